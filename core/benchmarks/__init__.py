@@ -0,0 +1,5 @@
+"""
+Developer benchmarks for cairn_core (not part of the installed package).
+
+Run from the core/ directory, e.g. `python -m benchmarks.report_formats`.
+"""
@@ -0,0 +1,177 @@
+"""
+Per-phase timings over synthetic project trees, with baseline comparison.
+
+    python -m benchmarks.phases run [--sizes 1k,10k,50k] [--repeat R] [--output F]
+    python -m benchmarks.phases compare BASELINE CURRENT [--threshold 0.2]
+
+`run` generates each preset tree (see benchmarks.synthetic_tree) in a temporary
+directory and times, best-of-R, each phase of the report pipeline:
+
+    introspect   introspect_project()
+    analyze      analyze_project() (introspection included)
+    build        build_report_from_analysis()
+    json         to_json_bytes()
+    text         render_report_text()
+
+Results are printed and, with --output, written as JSON. `compare` prints the
+ratio current/baseline per size and phase, and exits 1 when any phase is slower
+than the baseline by more than the threshold (0.2 = 20%). Phases under
+--min-seconds in the baseline are too noisy to gate on and are only reported.
+
+The stored baseline is benchmarks/baselines/phases.json; refresh it with
+`run --output` on the reference machine when a slowdown is intended.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict
+
+from benchmarks.report_formats import best_of
+from benchmarks.synthetic_tree import PRESETS, generate_tree
+from cairn_core.projects.analyze import analyze_project
+from cairn_core.projects.introspect import ScanOptions, introspect_project
+from cairn_core.reporting.build import build_report_from_analysis
+from cairn_core.reporting.emit import render_report_text
+from cairn_core.serialization import to_json_bytes
+
+PHASES = ("introspect", "analyze", "build", "json", "text")
+
+# The 50k preset is at the spec's default file limit; benchmarks scan unbounded.
+_OPTIONS = ScanOptions(max_files=None)
+
+_RESULTS_VERSION = 1
+
+Results = Dict[str, Dict[str, float]]
+
+
+def bench_size(size: str, repeat: int) -> tuple[int, Dict[str, float]]:
+    """
+    Time every phase on a fresh tree for one preset.
+    Returns (entries visited, {phase: best seconds}).
+    """
+    with tempfile.TemporaryDirectory(prefix=f"cairn-bench-{size}-") as tmp:
+        root = Path(tmp)
+        generate_tree(root, PRESETS[size])
+
+        analysis = analyze_project(root, options=_OPTIONS)
+        report = build_report_from_analysis(analysis)
+
+        timed: Dict[str, Callable[[], object]] = {
+            "introspect": lambda: introspect_project(root, options=_OPTIONS),
+            "analyze": lambda: analyze_project(root, options=_OPTIONS),
+            "build": lambda: build_report_from_analysis(analysis),
+            "json": lambda: to_json_bytes(report),
+            "text": lambda: render_report_text(report),
+        }
+        seconds = {phase: best_of(repeat, timed[phase]) for phase in PHASES}
+        return report.analysis.entry_count, seconds
+
+
+def _run(args: argparse.Namespace) -> int:
+    sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+    unknown = [s for s in sizes if s not in PRESETS]
+    if unknown:
+        print(f"unknown sizes: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    results: Results = {}
+    entries: Dict[str, int] = {}
+    print(f"{'size':<6}{'entries':>9}" + "".join(f"{p:>12}" for p in PHASES))
+    for size in sizes:
+        entries[size], results[size] = bench_size(size, args.repeat)
+        row = "".join(f"{results[size][p] * 1e3:>10.1f}ms" for p in PHASES)
+        print(f"{size:<6}{entries[size]:>9}{row}", flush=True)
+
+    if args.output is not None:
+        doc = {
+            "version": _RESULTS_VERSION,
+            "meta": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "repeat": args.repeat,
+                "entries": entries,
+            },
+            "results": results,
+        }
+        out = Path(args.output)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(doc, indent=2, sort_keys=True) + "\n")
+    return 0
+
+
+def _load(path: str) -> Results:
+    doc = json.loads(Path(path).read_text())
+    if doc.get("version") != _RESULTS_VERSION:
+        raise ValueError(f"{path}: unsupported results version {doc.get('version')!r}")
+    return doc["results"]
+
+
+def compare(
+    baseline: Results, current: Results, threshold: float, min_seconds: float
+) -> list[str]:
+    """
+    Print a comparison table and return the regressed "size/phase" keys.
+    """
+    regressions = []
+    print(f"{'size':<6}{'phase':<12}{'baseline':>12}{'current':>12}{'ratio':>8}")
+    for size in sorted(baseline.keys() & current.keys(), key=list(PRESETS).index):
+        for phase in PHASES:
+            if phase not in baseline[size] or phase not in current[size]:
+                continue
+            base, cur = baseline[size][phase], current[size][phase]
+            ratio = cur / base if base > 0 else float("inf")
+            flag = ""
+            if base < min_seconds:
+                flag = "  (noise)"
+            elif ratio > 1 + threshold:
+                flag = "  REGRESSION"
+                regressions.append(f"{size}/{phase}")
+            print(
+                f"{size:<6}{phase:<12}{base * 1e3:>10.1f}ms{cur * 1e3:>10.1f}ms"
+                f"{ratio:>8.2f}{flag}"
+            )
+    return regressions
+
+
+def _compare(args: argparse.Namespace) -> int:
+    try:
+        baseline, current = _load(args.baseline), _load(args.current)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"cannot read results: {e}", file=sys.stderr)
+        return 2
+
+    regressions = compare(baseline, current, args.threshold, args.min_seconds)
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        return 1
+    print("no regressions")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="time every phase per tree size")
+    run.add_argument("--sizes", default=",".join(PRESETS))
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--output", help="write results JSON here")
+
+    cmp = commands.add_parser("compare", help="flag regressions against a baseline")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=0.2)
+    cmp.add_argument("--min-seconds", type=float, default=0.002)
+
+    args = parser.parse_args(argv)
+    return _run(args) if args.command == "run" else _compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
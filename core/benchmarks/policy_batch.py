@@ -0,0 +1,120 @@
+"""
+Compare batch policy evaluation with a per-snapshot loop.
+
+    python -m benchmarks.policy_batch [--snapshots N] [--rules R] [--repeat K]
+
+Evaluates a synthetic pack of R rules (all rule kinds, spread over a handful
+of extensions) against N synthetic snapshots, once as a loop of
+CompiledPolicy.evaluate() per snapshot and once with evaluate_batch(). Both
+use the same compiled pack, compiled outside the timed region, so the
+comparison is row-wise against column-wise evaluation only; the results are
+checked to be identical.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+
+from benchmarks.report_formats import best_of
+from cairn_core.policy import PolicyPack, PolicyPackMeta, Rule, compile_policy
+from cairn_core.reporting import AnalysisSnapshot
+
+_EXTS = (".py", ".md", ".txt", ".json", ".yaml", ".toml", ".cfg", "")
+
+
+def synthetic_pack(n_rules: int) -> PolicyPack:
+    rng = random.Random(n_rules)
+    severities = ("info", "low", "medium", "high", "critical")
+    rules = []
+    for i in range(n_rules):
+        shape = i % 7
+        if shape == 0:
+            kind, params = "analysis_marker_present", {"marker": "readme"}
+        elif shape == 1:
+            kind, params = "analysis_marker_missing", {"marker": "requirements"}
+        elif shape == 2:
+            kind = "analysis_extension_count_at_least"
+            params = {"ext": rng.choice(_EXTS), "min": rng.randrange(0, 50)}
+        elif shape == 3:
+            kind = "analysis_extension_count_at_most"
+            params = {"ext": rng.choice(_EXTS), "max": rng.randrange(0, 200)}
+        elif shape == 4:
+            kind, params = "analysis_max_depth_at_most", {"max": rng.randrange(2, 10)}
+        elif shape == 5:
+            kind, params = "analysis_dir_count_at_least", {"min": rng.randrange(0, 20)}
+        else:
+            kind = "analysis_entry_count_at_most"
+            params = {"max": rng.randrange(100, 2000)}
+        rules.append(
+            Rule(
+                rule_id=f"bench.rule.{i:04d}",
+                title=f"Rule {i}",
+                kind=kind,  # type: ignore[arg-type]
+                severity=rng.choice(severities),  # type: ignore[arg-type]
+                params=params,
+            )
+        )
+    return PolicyPack(
+        meta=PolicyPackMeta(
+            policy_pack_id="bench", version="1.0.0", content_hash="00" * 32
+        ),
+        rules=tuple(rules),
+    )
+
+
+def synthetic_snapshots(n: int) -> list[AnalysisSnapshot]:
+    rng = random.Random(n)
+    snapshots = []
+    for _ in range(n):
+        ext_counts = {
+            ext: rng.randrange(0, 120) for ext in _EXTS if rng.random() < 0.6
+        }
+        files = sum(ext_counts.values())
+        dirs = rng.randrange(0, 30)
+        snapshots.append(
+            AnalysisSnapshot(
+                entry_count=files + dirs,
+                dir_count=dirs,
+                max_depth=rng.randrange(0, 12),
+                ext_counts=ext_counts,
+                has_readme=rng.random() < 0.7,
+                has_pyproject=rng.random() < 0.5,
+                has_requirements=rng.random() < 0.3,
+            )
+        )
+    return snapshots
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--snapshots", type=int, default=10_000)
+    parser.add_argument("--rules", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    pack = synthetic_pack(args.rules)
+    snapshots = synthetic_snapshots(args.snapshots)
+
+    compiled = compile_policy(pack)
+
+    def per_snapshot() -> list[object]:
+        return [compiled.evaluate(s) for s in snapshots]
+
+    def batch() -> object:
+        return compiled.evaluate_batch(snapshots)
+
+    assert tuple(per_snapshot()) == batch()
+
+    loop_s = best_of(args.repeat, per_snapshot)
+    batch_s = best_of(args.repeat, batch)
+
+    print(f"snapshots={args.snapshots} rules={args.rules} repeat={args.repeat}")
+    print(f"{'mode':<14}{'ms':>10}")
+    print(f"{'per-snapshot':<14}{loop_s * 1e3:>10.1f}")
+    print(f"{'batch':<14}{batch_s * 1e3:>10.1f}")
+    print(f"speedup: {loop_s / batch_s:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Compare the canonical binary report encoding with deterministic JSON.
+
+    python -m benchmarks.report_formats [--files N] [--repeat R]
+
+Reports size and best-of-R encode/decode time for a synthetic report with N
+file paths spread over a nested directory tree. JSON decode is json.loads only
+(plain dicts and lists); binary decode rebuilds the frozen dataclasses.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Callable
+
+from cairn_core.reporting import (
+    AnalysisSnapshot,
+    CairnReport,
+    PolicyPin,
+    ReportMeta,
+    decode_report_binary,
+    encode_report_binary,
+)
+from cairn_core.serialization import to_json_bytes
+
+
+def synthetic_report(n_files: int) -> CairnReport:
+    # Unique paths whose components repeat, as in real trees.
+    files = tuple(
+        f"src/pkg{i // 1000}/sub{i % 1000 // 40}/module_{i % 40}.py"
+        for i in range(n_files)
+    )
+    dirs = tuple(sorted({f.rpartition("/")[0] for f in files}))
+    return CairnReport(
+        meta=ReportMeta(generated_at="1970-01-01T00:00:00Z"),
+        policy=PolicyPin(policy_pack_id="bench", version="1.0.0", schema_version="1.0"),
+        project_ref="bench",
+        analysis=AnalysisSnapshot(
+            entry_count=len(files) + len(dirs) + 1,
+            dir_count=len(dirs),
+            max_depth=3,
+            files=files,
+            dirs=dirs,
+            ext_counts={".py": len(files)},
+        ),
+    )
+
+
+def best_of(repeat: int, fn: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    report = synthetic_report(args.files)
+    as_json = to_json_bytes(report)
+    as_binary = encode_report_binary(report)
+    assert decode_report_binary(as_binary) == report
+
+    rows = [
+        (
+            "json",
+            len(as_json),
+            best_of(args.repeat, lambda: to_json_bytes(report)),
+            best_of(args.repeat, lambda: json.loads(as_json)),
+        ),
+        (
+            "binary",
+            len(as_binary),
+            best_of(args.repeat, lambda: encode_report_binary(report)),
+            best_of(args.repeat, lambda: decode_report_binary(as_binary)),
+        ),
+    ]
+
+    print(f"files={args.files} repeat={args.repeat}")
+    print(f"{'format':<8}{'bytes':>12}{'encode ms':>12}{'decode ms':>12}")
+    for name, size, enc, dec in rows:
+        print(f"{name:<8}{size:>12}{enc * 1e3:>12.1f}{dec * 1e3:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
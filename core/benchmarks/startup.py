@@ -0,0 +1,80 @@
+"""
+Import-time budget for cairn_core entrypoints.
+
+    python -m benchmarks.startup [--repeat R] [--scale S]
+
+Imports each target module in a fresh interpreter, R times, and reports the
+best wall time of the import statement alone (interpreter startup excluded).
+Exits 1 if any target is over its budget times --scale (use a larger scale on
+slow machines), or if it loads a module it must leave for first use.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+
+from cairn_core._import_budget import DEFERRED_MODULES, IMPORT_BUDGETS_MS
+
+_PROBE = """\
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, sorted(sys.modules)]))
+"""
+
+
+def measure(module: str) -> tuple[float, list[str]]:
+    """
+    Import `module` in a fresh interpreter; return (seconds, loaded modules).
+    """
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    elapsed, modules = json.loads(out)
+    return elapsed, modules
+
+
+def check(module: str, repeat: int) -> tuple[float, list[str]]:
+    """
+    Best-of-`repeat` import time, and any deferred modules it loaded.
+    """
+    best = float("inf")
+    loaded: list[str] = []
+    for _ in range(repeat):
+        elapsed, modules = measure(module)
+        best = min(best, elapsed)
+        loaded = [m for m in DEFERRED_MODULES if m in modules]
+    return best, loaded
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    failures = 0
+    print(f"{'module':<32}{'ms':>8}{'budget':>8}")
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        best, loaded = check(module, args.repeat)
+        limit = budget * args.scale
+        flags = []
+        if best * 1e3 > limit:
+            flags.append("OVER BUDGET")
+        if loaded:
+            flags.append("loads " + ", ".join(loaded))
+        failures += bool(flags)
+        print(f"{module:<32}{best * 1e3:>8.1f}{limit:>8.1f}  {'; '.join(flags)}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Deterministic synthetic Cairn project trees for benchmarks.
+
+A TreeSpec fixes the shape: directory depth and fan-out (a full tree, so
+fanout + fanout**2 + ... + fanout**depth directories), the number of files and
+their extension mix, and optional excluded directories (e.g. node_modules)
+that introspection must skip. The same spec and seed always produce the same
+layout (only the .cairn manifest's id and timestamp differ between runs).
+
+    python -m benchmarks.synthetic_tree DIR [--preset 10k]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+from cairn_core.projects.init import init_project
+
+DEFAULT_EXT_MIX: tuple[tuple[str, int], ...] = (
+    (".py", 50),
+    (".md", 10),
+    (".json", 10),
+    (".txt", 10),
+    (".yaml", 5),
+    (".cfg", 5),
+    ("", 10),
+)
+
+
+@dataclass(frozen=True)
+class TreeSpec:
+    depth: int
+    fanout: int
+    files: int
+    ext_mix: tuple[tuple[str, int], ...] = DEFAULT_EXT_MIX
+    # Spec-excluded directory names created under the root and, for each one,
+    # the number of files placed inside (never visited by introspection).
+    excluded_dirs: tuple[str, ...] = ("node_modules", "__pycache__")
+    excluded_files: int = 50
+    with_cairn: bool = True
+    seed: int = 0
+
+    @property
+    def dir_count(self) -> int:
+        return sum(self.fanout**level for level in range(1, self.depth + 1))
+
+
+# Named scales: roughly 1k / 10k / 50k entries visited by introspection.
+PRESETS: dict[str, TreeSpec] = {
+    "1k": TreeSpec(depth=3, fanout=4, files=900),
+    "10k": TreeSpec(depth=4, fanout=5, files=9_200),
+    "50k": TreeSpec(depth=4, fanout=6, files=48_400),
+}
+
+
+def _dirs(spec: TreeSpec) -> list[str]:
+    # Breadth-first, so every level is complete before the next one starts.
+    dirs: list[str] = []
+    level = [""]
+    for depth in range(spec.depth):
+        nxt = []
+        for parent in level:
+            for i in range(spec.fanout):
+                name = f"d{depth}_{i}"
+                nxt.append(f"{parent}/{name}" if parent else name)
+        dirs.extend(nxt)
+        level = nxt
+    return dirs
+
+
+def generate_tree(root: Path, spec: TreeSpec) -> None:
+    """
+    Populate `root` (created if needed, expected empty) according to spec.
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(spec.seed)
+
+    if spec.with_cairn:
+        init_project(root, "benchmark-project")
+
+    dirs = _dirs(spec)
+    for rel in dirs:
+        (root / rel).mkdir()
+
+    exts = [ext for ext, _ in spec.ext_mix]
+    weights = [weight for _, weight in spec.ext_mix]
+    parents = [""] + dirs
+    for i in range(spec.files):
+        parent = parents[rng.randrange(len(parents))]
+        name = f"file_{i}{rng.choices(exts, weights)[0]}"
+        (root / parent / name).write_bytes(b"x")
+
+    for name in spec.excluded_dirs:
+        excluded = root / name
+        excluded.mkdir(exist_ok=True)
+        for i in range(spec.excluded_files):
+            (excluded / f"skip_{i}.js").write_bytes(b"x")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("root", type=Path)
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="1k")
+    args = parser.parse_args(argv)
+
+    spec = PRESETS[args.preset]
+    generate_tree(args.root, spec)
+    print(f"{args.root}: {spec.dir_count} dirs, {spec.files} files")
+
+
+if __name__ == "__main__":
+    main()
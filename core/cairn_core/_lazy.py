@@ -0,0 +1,35 @@
+"""
+Lazy public names for package __init__ modules.
+
+A package lists which submodule defines each public name; the submodule is
+imported on first attribute access (PEP 562), so importing one submodule, or
+using one name, does not load the rest of the package.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Return (__getattr__, __dir__) for `package`, where exports maps each public
+    name to the submodule (relative to the package) that defines it.
+    """
+    namespace = import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(f"{package}.{submodule}"), name)
+        namespace[name] = value  # later lookups skip __getattr__
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(namespace.keys() | exports.keys())
+
+    return __getattr__, __dir__
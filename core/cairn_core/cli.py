@@ -0,0 +1,124 @@
+"""
+Command-line entry point for cairn_core.
+
+    cairn-core batch ROOT... --out DIR [--workers N] [--discover DIR]
+                     [--roots-file FILE] [--max-depth N] [--max-files N]
+
+`batch` analyzes every project root (arguments first, then --roots-file lines,
+then --discover'ed projects) and writes one deterministic JSON report per
+project to --out, in that order. One status line per project goes to stdout:
+
+    ok     <root> <report file>
+    error  <root> <code> <message>
+
+Exit status: 0 if every project was analyzed, 1 if any project failed, 2 on
+usage errors.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Iterator, Sequence
+
+from cairn_core.projects.batch import BatchResult, run_batch
+from cairn_core.projects.introspect import ScanOptions
+
+__all__ = ["main"]
+
+
+def _discover(parent: Path) -> Iterator[Path]:
+    # Immediate subdirectories that are Cairn projects, sorted by name.
+    for child in sorted(parent.iterdir(), key=lambda p: p.name):
+        if (child / ".cairn" / "manifest.yaml").is_file():
+            yield child
+
+
+def _roots(args: argparse.Namespace) -> list[Path]:
+    roots = [Path(r) for r in args.roots]
+    if args.roots_file is not None:
+        text = Path(args.roots_file).read_text(encoding="utf-8")
+        roots.extend(Path(line) for line in text.splitlines() if line.strip())
+    if args.discover is not None:
+        roots.extend(_discover(Path(args.discover)))
+    return roots
+
+
+def _positive(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError("must be >= 1")
+    return n
+
+
+def _non_negative(value: str) -> int:
+    n = int(value)
+    if n < 0:
+        raise argparse.ArgumentTypeError("must be >= 0")
+    return n
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cairn-core")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser(
+        "batch", help="analyze many projects and write one report per project"
+    )
+    batch.add_argument("roots", nargs="*", help="project root directories")
+    batch.add_argument("--out", required=True, help="output directory for reports")
+    batch.add_argument(
+        "--workers",
+        type=_positive,
+        default=None,
+        help="worker processes (default: CPU count; 1 = in-process)",
+    )
+    batch.add_argument("--roots-file", help="file with one project root per line")
+    batch.add_argument(
+        "--discover", help="also analyze every project directly under this directory"
+    )
+    batch.add_argument("--max-depth", type=_non_negative, default=None)
+    batch.add_argument("--max-files", type=_non_negative, default=None)
+    return parser
+
+
+def _run_batch_command(args: argparse.Namespace) -> int:
+    try:
+        roots = _roots(args)
+    except OSError as e:
+        print(f"cairn-core batch: {e}", file=sys.stderr)
+        return 2
+    if not roots:
+        print("cairn-core batch: no project roots given", file=sys.stderr)
+        return 2
+
+    overrides = {}
+    if args.max_depth is not None:
+        overrides["max_depth"] = args.max_depth
+    if args.max_files is not None:
+        overrides["max_files"] = args.max_files
+    options = ScanOptions(**overrides) if overrides else None
+
+    def report(result: BatchResult) -> None:
+        if result.ok:
+            line = f"ok\t{result.root}\t{result.output_path}"
+        else:
+            line = f"error\t{result.root}\t{result.error_code}\t{result.error_message}"
+        print(line, flush=True)
+
+    results = run_batch(
+        roots, Path(args.out), workers=args.workers, options=options, on_result=report
+    )
+    return 0 if all(r.ok for r in results) else 1
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if args.command == "batch":
+        return _run_batch_command(args)
+    return 2  # pragma: no cover - argparse rejects unknown commands
+
+
+if __name__ == "__main__":
+    sys.exit(main())
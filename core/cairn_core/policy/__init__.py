@@ -1,13 +1,38 @@
-from .schema import (
-    PolicyPack,
-    PolicyPackMeta,
-    Rule,
-    SeverityModel,
-    StandardsRef,
-    JurisdictionScope,
-    RemediationRef,
-)
-from .errors import PolicyError
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cairn_core._lazy import lazy_exports
+
+# Public name -> defining submodule, imported on first use.
+_EXPORTS = {
+    "PolicyPack": "schema",
+    "PolicyPackMeta": "schema",
+    "Rule": "schema",
+    "SeverityModel": "schema",
+    "StandardsRef": "schema",
+    "JurisdictionScope": "schema",
+    "RemediationRef": "schema",
+    "PolicyError": "errors",
+    "PolicyEvaluationError": "errors",
+    "ColumnTest": "compile",
+    "CompiledPolicy": "compile",
+    "CompiledRule": "compile",
+    "clear_compiled_policies": "compile",
+    "compile_policy": "compile",
+    "pin_with_hash": "hashing",
+    "policy_content_hash": "hashing",
+    "policy_pin": "hashing",
+    "with_content_hash": "hashing",
+    "load_policy_pack": "load",
+    "policy_cache_path": "load",
+    "LintIssue": "lint",
+    "PolicyLintReport": "lint",
+    "lint_policy": "lint",
+    "evaluate_policy": "evaluate",
+    "evaluate_policy_batch": "evaluate",
+    "evaluate_report": "evaluate",
+}
 
 __all__ = [
     "PolicyPack",
@@ -18,4 +43,66 @@ __all__ = [
     "JurisdictionScope",
     "RemediationRef",
     "PolicyError",
+    "PolicyEvaluationError",
+    "ColumnTest",
+    "CompiledPolicy",
+    "CompiledRule",
+    "clear_compiled_policies",
+    "compile_policy",
+    "pin_with_hash",
+    "policy_content_hash",
+    "policy_pin",
+    "with_content_hash",
+    "load_policy_pack",
+    "policy_cache_path",
+    "LintIssue",
+    "PolicyLintReport",
+    "lint_policy",
+    "evaluate_policy",
+    "evaluate_policy_batch",
+    "evaluate_report",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .compile import (
+        ColumnTest,
+        CompiledPolicy,
+        CompiledRule,
+        clear_compiled_policies,
+        compile_policy,
+    )
+    from .errors import (
+        PolicyError,
+        PolicyEvaluationError,
+    )
+    from .evaluate import (
+        evaluate_policy,
+        evaluate_policy_batch,
+        evaluate_report,
+    )
+    from .hashing import (
+        pin_with_hash,
+        policy_content_hash,
+        policy_pin,
+        with_content_hash,
+    )
+    from .lint import (
+        LintIssue,
+        PolicyLintReport,
+        lint_policy,
+    )
+    from .load import (
+        load_policy_pack,
+        policy_cache_path,
+    )
+    from .schema import (
+        JurisdictionScope,
+        PolicyPack,
+        PolicyPackMeta,
+        RemediationRef,
+        Rule,
+        SeverityModel,
+        StandardsRef,
+    )
@@ -0,0 +1,557 @@
+"""
+Phase 7 policy compilation.
+
+A PolicyPack is validated once and turned into a CompiledPolicy: one pre-bound
+check closure per active rule, with its Finding template (remediation and
+standards links) built up front. Disabled rules and rules that do not target
+the requested environment are pruned at compile time, so evaluation is a
+single loop over already-ordered checks.
+
+Rule semantics (a finding is emitted when the requirement is NOT met):
+
+    analysis_marker_present            {"marker": M}        marker M is absent
+    analysis_marker_missing            {"marker": M}        marker M is present
+    analysis_extension_count_at_least  {"ext": E, "min": N} count(E) < N
+    analysis_extension_count_at_most   {"ext": E, "max": N} count(E) > N
+    analysis_max_depth_at_most         {"max": N}           max_depth > N
+    analysis_dir_count_at_least        {"min": N}           dir_count < N
+    analysis_entry_count_at_most       {"max": N}           entry_count > N
+
+M is one of "readme", "pyproject", "requirements". E is a file suffix as
+counted by Phase 5 ("" for files without one); it is matched case-insensitively.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from operator import attrgetter
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    get_args,
+)
+
+from cairn_core.policy.errors import PolicyError, PolicyEvaluationError
+from cairn_core.policy.hashing import policy_content_hash
+from cairn_core.policy.schema import PolicyPack, Rule, RuleKind, Severity, TargetEnv
+from cairn_core.reporting.schema import (
+    AnalysisSnapshot,
+    Evidence,
+    Finding,
+    RemediationLink,
+    StandardsLink,
+)
+
+# A check is given the rule's column value and returns the evidence of a
+# violation, or None when the rule passes.
+ValueCheck = Callable[[Any], Optional[Dict[str, Any]]]
+
+_TARGET_ENVS = frozenset(get_args(TargetEnv))
+
+# Deterministic severity ordering (lowest -> highest)
+_SEV_ORDER: Dict[str, int] = {sev: rank for rank, sev in enumerate(get_args(Severity))}
+
+# marker param -> AnalysisSnapshot attribute
+_MARKERS = {
+    "readme": "has_readme",
+    "pyproject": "has_pyproject",
+    "requirements": "has_requirements",
+}
+
+_COMPILED_CACHE_SIZE = 64
+
+
+class ColumnTest(NamedTuple):
+    """
+    A rule reduced to a comparison on one snapshot column.
+
+    column is ("attr", <AnalysisSnapshot attribute>) or ("ext", <suffix>) (the
+    count from ext_counts, 0 when absent). The rule fails when the column value
+    is < threshold ("lt"), > threshold ("gt"), truthy ("true") or falsy
+    ("false"); evidence(value) builds the finding's evidence.
+    """
+
+    column: Tuple[str, str]
+    op: Literal["lt", "gt", "true", "false"]
+    threshold: int
+    evidence: Callable[[Any], Dict[str, Any]]
+
+
+def _column_getter(column: Tuple[str, str]) -> Callable[[AnalysisSnapshot], Any]:
+    source, name = column
+    if source == "ext":
+        return lambda a: a.ext_counts.get(name, 0)
+    return attrgetter(name)
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """
+    One active rule: its pre-bound check and the Finding fields it reports.
+    """
+
+    rule_id: str
+    kind: RuleKind
+    severity: Severity
+    title: str
+    test: ColumnTest
+    check_value: ValueCheck
+    remediation: Tuple[RemediationLink, ...] = ()
+    standards: Tuple[StandardsLink, ...] = ()
+    rationale: str = ""
+
+    def finding(self, evidence: Mapping[str, Any]) -> Finding:
+        return Finding(
+            rule_id=self.rule_id,
+            severity=self.severity,
+            title=self.title,
+            evidence=Evidence(evidence),
+            remediation=self.remediation,
+            standards=self.standards,
+            rationale=self.rationale,
+        )
+
+
+@dataclass(frozen=True)
+class CompiledPolicy:
+    """
+    Validated, pruned form of a PolicyPack for one target environment.
+
+    rules are stored in report order (severity descending, then rule_id), so
+    evaluation never sorts. Rules reading the same column (e.g. two rules on
+    has_readme, or on the count of ".py") share one read per snapshot.
+    """
+
+    policy_pack_id: str
+    version: str
+    content_hash: Optional[str]
+    target_env: TargetEnv
+    rules: Tuple[CompiledRule, ...] = ()
+
+    # Derived from rules: distinct columns, one reader each, each rule's
+    # position in that list, and the rules grouped by kind (in report order).
+    columns: Tuple[Tuple[str, str], ...] = field(init=False, compare=False)
+    rules_by_kind: Mapping[RuleKind, Tuple[CompiledRule, ...]] = field(
+        init=False, repr=False, compare=False
+    )
+    _readers: Tuple[Callable[[AnalysisSnapshot], Any], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    _column_index: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        index: Dict[Tuple[str, str], int] = {}
+        for rule in self.rules:
+            index.setdefault(rule.test.column, len(index))
+        object.__setattr__(self, "columns", tuple(index))
+        object.__setattr__(self, "_readers", tuple(_column_getter(c) for c in index))
+        object.__setattr__(
+            self, "_column_index", tuple(index[r.test.column] for r in self.rules)
+        )
+
+        grouped: Dict[RuleKind, list[CompiledRule]] = {}
+        for rule in self.rules:
+            grouped.setdefault(rule.kind, []).append(rule)
+        object.__setattr__(
+            self,
+            "rules_by_kind",
+            MappingProxyType({kind: tuple(rs) for kind, rs in grouped.items()}),
+        )
+
+    def evaluate(self, analysis: AnalysisSnapshot) -> Tuple[Finding, ...]:
+        values = [read(analysis) for read in self._readers]
+        findings = []
+        for rule, i in zip(self.rules, self._column_index):
+            evidence = rule.check_value(values[i])
+            if evidence is not None:
+                findings.append(rule.finding(evidence))
+        return tuple(findings)
+
+    def evaluate_batch(
+        self, snapshots: Sequence[AnalysisSnapshot]
+    ) -> Tuple[Tuple[Finding, ...], ...]:
+        """
+        Findings for every snapshot, identical to evaluate() on each one.
+
+        Work is done column-wise: each distinct column (an attribute, or one
+        extension's count) is extracted once across all snapshots, then every
+        rule reading it is a single comprehension over that column. Rules run
+        in report order, so each snapshot's findings come out already sorted.
+        Snapshots failing a rule with the same column value share one Finding,
+        whose evidence is a read-only mapping so the sharing is safe.
+        """
+        per_snapshot: list[list[Finding]] = [[] for _ in snapshots]
+        columns: Dict[Tuple[str, str], list[Any]] = {}
+
+        for rule in self.rules:
+            test = rule.test
+            values = columns.get(test.column)
+            if values is None:
+                values = columns[test.column] = _extract_column(test.column, snapshots)
+
+            # Findings depend only on the column value: build each one once.
+            built: Dict[Any, Finding] = {}
+            for i in _failing_rows(values, test.op, test.threshold):
+                value = values[i]
+                finding = built.get(value)
+                if finding is None:
+                    evidence = MappingProxyType(test.evidence(value))
+                    finding = built[value] = rule.finding(evidence)
+                per_snapshot[i].append(finding)
+
+        return tuple(tuple(findings) for findings in per_snapshot)
+
+
+def _extract_column(
+    column: Tuple[str, str], snapshots: Sequence[AnalysisSnapshot]
+) -> list[Any]:
+    source, name = column
+    if source == "ext":
+        return [a.ext_counts.get(name, 0) for a in snapshots]
+    return list(map(attrgetter(name), snapshots))
+
+
+def _failing_rows(values: list[Any], op: str, threshold: int) -> list[int]:
+    if op == "lt":
+        return [i for i, v in enumerate(values) if v < threshold]
+    if op == "gt":
+        return [i for i, v in enumerate(values) if v > threshold]
+    if op == "true":
+        return [i for i, v in enumerate(values) if v]
+    return [i for i, v in enumerate(values) if not v]
+
+
+# ---- params ----
+
+
+def _params_error(rule: Rule, message: str) -> PolicyEvaluationError:
+    return PolicyEvaluationError(
+        "policy_rule_params_invalid", f"Rule {rule.rule_id!r}: {message}"
+    )
+
+
+def _check_param_keys(rule: Rule, expected: Tuple[str, ...]) -> None:
+    params = rule.params
+    if not isinstance(params, Mapping):
+        raise _params_error(rule, "params must be a mapping")
+    missing = sorted(set(expected) - params.keys())
+    unknown = sorted(str(k) for k in params.keys() - set(expected))
+    if missing:
+        raise _params_error(rule, f"missing params: {', '.join(missing)}")
+    if unknown:
+        raise _params_error(rule, f"unknown params: {', '.join(unknown)}")
+
+
+def _count_param(rule: Rule, name: str) -> int:
+    value = rule.params[name]
+    if type(value) is not int or value < 0:
+        raise _params_error(rule, f"{name!r} must be a non-negative integer")
+    return value
+
+
+def _ext_param(rule: Rule) -> str:
+    value = rule.params["ext"]
+    if not isinstance(value, str) or (
+        value and (not value.startswith(".") or len(value) < 2 or "/" in value)
+    ):
+        raise _params_error(rule, "'ext' must be a suffix such as '.py' (or '')")
+    return value.lower()
+
+
+def _marker_param(rule: Rule) -> str:
+    value = rule.params["marker"]
+    if not isinstance(value, str) or value not in _MARKERS:
+        raise _params_error(
+            rule, f"'marker' must be one of: {', '.join(sorted(_MARKERS))}"
+        )
+    return _MARKERS[value]
+
+
+# ---- checks by kind ----
+
+
+def _bind_value_check(test: ColumnTest) -> ValueCheck:
+    # One closure per comparison, so a check is a single compare.
+    threshold = test.threshold
+    evidence = test.evidence
+
+    if test.op == "lt":
+
+        def check(value: Any) -> Optional[Dict[str, Any]]:
+            return evidence(value) if value < threshold else None
+
+    elif test.op == "gt":
+
+        def check(value: Any) -> Optional[Dict[str, Any]]:
+            return evidence(value) if value > threshold else None
+
+    elif test.op == "true":
+
+        def check(value: Any) -> Optional[Dict[str, Any]]:
+            return evidence(value) if value else None
+
+    else:
+
+        def check(value: Any) -> Optional[Dict[str, Any]]:
+            return None if value else evidence(value)
+
+    return check
+
+
+def _marker_present(rule: Rule) -> ColumnTest:
+    _check_param_keys(rule, ("marker",))
+    attr = _marker_param(rule)
+    marker = rule.params["marker"]
+    return ColumnTest(
+        ("attr", attr), "false", 0, lambda v: {"marker": marker, "present": False}
+    )
+
+
+def _marker_missing(rule: Rule) -> ColumnTest:
+    _check_param_keys(rule, ("marker",))
+    attr = _marker_param(rule)
+    marker = rule.params["marker"]
+    return ColumnTest(
+        ("attr", attr), "true", 0, lambda v: {"marker": marker, "present": True}
+    )
+
+
+def _ext_at_least(rule: Rule) -> ColumnTest:
+    _check_param_keys(rule, ("ext", "min"))
+    ext = _ext_param(rule)
+    minimum = _count_param(rule, "min")
+    return ColumnTest(
+        ("ext", ext),
+        "lt",
+        minimum,
+        lambda v: {"ext": ext, "count": v, "min_required": minimum},
+    )
+
+
+def _ext_at_most(rule: Rule) -> ColumnTest:
+    _check_param_keys(rule, ("ext", "max"))
+    ext = _ext_param(rule)
+    maximum = _count_param(rule, "max")
+    return ColumnTest(
+        ("ext", ext),
+        "gt",
+        maximum,
+        lambda v: {"ext": ext, "count": v, "max_allowed": maximum},
+    )
+
+
+def _max_depth_at_most(rule: Rule) -> ColumnTest:
+    _check_param_keys(rule, ("max",))
+    maximum = _count_param(rule, "max")
+    return ColumnTest(
+        ("attr", "max_depth"),
+        "gt",
+        maximum,
+        lambda v: {"max_depth": v, "max_allowed": maximum},
+    )
+
+
+def _dir_count_at_least(rule: Rule) -> ColumnTest:
+    _check_param_keys(rule, ("min",))
+    minimum = _count_param(rule, "min")
+    return ColumnTest(
+        ("attr", "dir_count"),
+        "lt",
+        minimum,
+        lambda v: {"dir_count": v, "min_required": minimum},
+    )
+
+
+def _entry_count_at_most(rule: Rule) -> ColumnTest:
+    _check_param_keys(rule, ("max",))
+    maximum = _count_param(rule, "max")
+    return ColumnTest(
+        ("attr", "entry_count"),
+        "gt",
+        maximum,
+        lambda v: {"entry_count": v, "max_allowed": maximum},
+    )
+
+
+_COMPILERS: Dict[str, Callable[[Rule], ColumnTest]] = {
+    "analysis_marker_present": _marker_present,
+    "analysis_marker_missing": _marker_missing,
+    "analysis_extension_count_at_least": _ext_at_least,
+    "analysis_extension_count_at_most": _ext_at_most,
+    "analysis_max_depth_at_most": _max_depth_at_most,
+    "analysis_dir_count_at_least": _dir_count_at_least,
+    "analysis_entry_count_at_most": _entry_count_at_most,
+}
+
+assert set(_COMPILERS) == set(get_args(RuleKind))
+
+
+# ---- compilation ----
+
+
+def _compile_rule(policy: PolicyPack, rule: Rule) -> CompiledRule:
+    compiler = _COMPILERS.get(rule.kind)
+    if compiler is None:
+        raise PolicyEvaluationError(
+            "policy_rule_kind_unknown",
+            f"Rule {rule.rule_id!r}: unknown kind {rule.kind!r}",
+        )
+    if rule.severity not in policy.severity_model.allowed:
+        raise PolicyEvaluationError(
+            "policy_rule_severity_invalid",
+            f"Rule {rule.rule_id!r}: severity {rule.severity!r} is not allowed "
+            "by the pack's severity model",
+        )
+    unknown_envs = sorted(set(rule.target_envs) - _TARGET_ENVS)
+    if unknown_envs:
+        raise PolicyEvaluationError(
+            "policy_target_env_invalid",
+            f"Rule {rule.rule_id!r}: unknown target envs: {', '.join(unknown_envs)}",
+        )
+
+    test = compiler(rule)
+    return CompiledRule(
+        rule_id=rule.rule_id,
+        kind=rule.kind,
+        severity=rule.severity,
+        title=rule.title,
+        test=test,
+        check_value=_bind_value_check(test),
+        remediation=tuple(
+            RemediationLink(
+                project_id=r.project_id,
+                safe_by_default=r.safe_by_default,
+                dry_run_supported=r.dry_run_supported,
+            )
+            for r in rule.remediation
+        ),
+        standards=tuple(
+            StandardsLink(scheme=s.scheme, ref=s.ref, url=s.url) for s in rule.standards
+        ),
+        rationale=rule.rationale,
+    )
+
+
+def _compile(policy: PolicyPack, target_env: TargetEnv) -> CompiledPolicy:
+    if target_env not in _TARGET_ENVS:
+        raise PolicyEvaluationError(
+            "policy_target_env_invalid", f"Unknown target env: {target_env!r}"
+        )
+    unknown = sorted(set(policy.severity_model.allowed) - _SEV_ORDER.keys())
+    if unknown:
+        raise PolicyEvaluationError(
+            "policy_severity_model_invalid",
+            f"Unknown severities in severity model: {', '.join(unknown)}",
+        )
+
+    seen: set[str] = set()
+    active: list[CompiledRule] = []
+    for rule in policy.rules:
+        if rule.rule_id in seen:
+            raise PolicyEvaluationError(
+                "policy_rule_duplicate_id", f"Duplicate rule_id: {rule.rule_id!r}"
+            )
+        seen.add(rule.rule_id)
+
+        # Every rule is validated, including the ones pruned below.
+        compiled = _compile_rule(policy, rule)
+        if rule.enabled and target_env in rule.target_envs:
+            active.append(compiled)
+
+    active.sort(key=lambda r: (-_SEV_ORDER[r.severity], r.rule_id))
+    return CompiledPolicy(
+        policy_pack_id=policy.meta.policy_pack_id,
+        version=policy.meta.version,
+        content_hash=policy.meta.content_hash,
+        target_env=target_env,
+        rules=tuple(active),
+    )
+
+
+# (policy_pack_id, version, content_hash, hash was stored in meta) -> the pack
+# compiled under that key and its compiled form per target env.
+_PackKey = Tuple[str, str, str, bool]
+_CacheEntry = Tuple[PolicyPack, Dict[str, CompiledPolicy]]
+_cache: "OrderedDict[_PackKey, _CacheEntry]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def compile_policy(
+    policy: PolicyPack, *, target_env: TargetEnv = "general"
+) -> CompiledPolicy:
+    """
+    Validate a pack and compile its active rules for one target environment.
+
+    Must:
+    - validate every rule (kind, severity, target envs, params) exactly once
+    - prune disabled rules and rules not targeting target_env
+    - order rules by severity (descending), then rule_id
+
+    Packs are compiled once per target env and kept in an in-process LRU keyed
+    by (policy_pack_id, version, content_hash); later calls skip validation and
+    compilation. The stored meta.content_hash is used when set (see
+    with_content_hash()), so a hit costs no hashing; it is computed only for
+    unpinned packs. A hit must also be the same pack as the one compiled (by
+    identity, else by equality): a pack whose rules changed under an old meta
+    is compiled again, uncached.
+
+    Raises PolicyEvaluationError with code:
+    - 'policy_rule_kind_unknown'
+    - 'policy_rule_params_invalid'
+    - 'policy_rule_severity_invalid'
+    - 'policy_rule_duplicate_id'
+    - 'policy_severity_model_invalid'
+    - 'policy_target_env_invalid'
+    """
+    meta = policy.meta
+    content_hash = meta.content_hash
+    if content_hash is None:
+        try:
+            content_hash = policy_content_hash(policy)
+        except PolicyError:
+            # Not canonically serializable (e.g. non-string param keys):
+            # compile uncached, which reports the offending rule.
+            return _compile(policy, target_env)
+    pinned = meta.content_hash is not None
+    key = (meta.policy_pack_id, meta.version, content_hash, pinned)
+
+    stale = False
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            cached_pack, by_env = entry
+            stale = cached_pack is not policy and cached_pack != policy
+            if not stale:
+                _cache.move_to_end(key)
+                compiled = by_env.get(target_env)
+                if compiled is not None:
+                    return compiled
+
+    compiled = _compile(policy, target_env)
+    if stale:
+        # Same key, different content: the stored hash is out of date.
+        return compiled
+    with _cache_lock:
+        _cache.setdefault(key, (policy, {}))[1][target_env] = compiled
+        _cache.move_to_end(key)
+        while len(_cache) > _COMPILED_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return compiled
+
+
+def clear_compiled_policies() -> None:
+    """
+    Drop every cached compiled pack.
+    """
+    with _cache_lock:
+        _cache.clear()
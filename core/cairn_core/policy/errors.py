@@ -10,3 +10,17 @@ class PolicyError(Exception):
 
     def __str__(self) -> str:
         return f"{self.code}: {self.message}"
+
+
+class PolicyEvaluationError(Exception):
+    """
+    Phase 7 error base class.
+
+    All Phase 7 evaluation-specific errors MUST derive from this type and expose a
+    stable string code via .code.
+    """
+    code: str
+
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(message)
+        self.code = code
@@ -1,26 +1,28 @@
 from __future__ import annotations
 
-from typing import Tuple
+from dataclasses import replace
+from typing import Iterable, Tuple
 
-from cairn_core.policy.schema import PolicyPack, Rule
-from cairn_core.reporting.schema import AnalysisSnapshot, Evidence, Finding, RemediationLink, StandardsLink
+from cairn_core.policy.compile import compile_policy
+from cairn_core.policy.errors import PolicyEvaluationError
+from cairn_core.policy.hashing import pin_with_hash, policy_content_hash
+from cairn_core.policy.schema import PolicyPack, TargetEnv
+from cairn_core.reporting.schema import AnalysisSnapshot, CairnReport, Finding
 
+__all__ = [
+    "PolicyEvaluationError",
+    "evaluate_policy",
+    "evaluate_policy_batch",
+    "evaluate_report",
+]
 
-class PolicyEvaluationError(Exception):
-    """
-    Phase 7 error base class.
-
-    All Phase 7 evaluation-specific errors MUST derive from this type and expose a
-    stable string code via .code.
-    """
-    code: str
-
-    def __init__(self, code: str, message: str) -> None:
-        super().__init__(message)
-        self.code = code
 
-
-def evaluate_policy(policy: PolicyPack, analysis: AnalysisSnapshot) -> Tuple[Finding, ...]:
+def evaluate_policy(
+    policy: PolicyPack,
+    analysis: AnalysisSnapshot,
+    *,
+    target_env: TargetEnv = "general",
+) -> Tuple[Finding, ...]:
     """
     Phase 7 entrypoint.
 
@@ -29,5 +31,49 @@ def evaluate_policy(policy: PolicyPack, analysis: AnalysisSnapshot) -> Tuple[Fin
     - evaluate enabled rules only (policy is the authority)
     - return findings sorted deterministically (severity then rule_id)
     - never generate narrative text
+
+    The pack is compiled (and validated) through compile_policy(); see
+    cairn_core.policy.compile for rule semantics and error codes.
+    """
+    return compile_policy(policy, target_env=target_env).evaluate(analysis)
+
+
+def evaluate_policy_batch(
+    policy: PolicyPack,
+    snapshots: Iterable[AnalysisSnapshot],
+    *,
+    target_env: TargetEnv = "general",
+) -> Tuple[Tuple[Finding, ...], ...]:
+    """
+    Evaluate one pack against many snapshots.
+
+    Must:
+    - compile the pack once
+    - return one findings tuple per snapshot, in input order, each identical to
+      evaluate_policy() on that snapshot
+    """
+    compiled = compile_policy(policy, target_env=target_env)
+    return compiled.evaluate_batch(tuple(snapshots))
+
+
+def evaluate_report(
+    policy: PolicyPack,
+    report: CairnReport,
+    *,
+    target_env: TargetEnv = "general",
+) -> CairnReport:
+    """
+    The report pinned to `policy` (PolicyPin with content hash) and carrying
+    the pack's findings for its analysis snapshot.
     """
-    raise NotImplementedError
+    # Hash once: the pin needs it, and an unpinned pack gets it stored so
+    # compile_policy() does not hash again.
+    content_hash = policy_content_hash(policy)
+    pin = pin_with_hash(policy, content_hash)
+    if policy.meta.content_hash is None:
+        policy = replace(policy, meta=replace(policy.meta, content_hash=content_hash))
+    return replace(
+        report,
+        policy=pin,
+        findings=evaluate_policy(policy, report.analysis, target_env=target_env),
+    )
@@ -0,0 +1,83 @@
+"""
+Canonical content hashing of policy packs (audit pinning).
+
+The hash is SHA-256 over the pack's deterministic JSON (cairn_core.serialization)
+with meta.content_hash cleared, so a pack's hash does not depend on whether it
+has already been pinned, nor on dict insertion order in rule params.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import replace
+
+from cairn_core.policy.errors import PolicyError
+from cairn_core.policy.schema import PolicyPack
+from cairn_core.reporting.schema import PolicyPin
+from cairn_core.serialization import SerializationError, to_json_bytes
+
+__all__ = [
+    "pin_with_hash",
+    "policy_content_hash",
+    "policy_pin",
+    "with_content_hash",
+]
+
+
+def policy_content_hash(policy: PolicyPack) -> str:
+    """
+    Hex SHA-256 of the pack's canonical form (meta.content_hash excluded).
+
+    Raises PolicyError('policy_pack_unhashable') if the pack holds values the
+    deterministic serializer rejects (e.g. non-string param keys).
+    """
+    unpinned = replace(policy, meta=replace(policy.meta, content_hash=None))
+    try:
+        data = to_json_bytes(unpinned)
+    except SerializationError as e:
+        raise PolicyError(
+            code="policy_pack_unhashable",
+            message=f"Policy pack cannot be canonicalized: {e}",
+        ) from e
+    return hashlib.sha256(data).hexdigest()
+
+
+def with_content_hash(policy: PolicyPack) -> PolicyPack:
+    """
+    The same pack with meta.content_hash set to its canonical hash.
+
+    Loaders call this once, so reports and compiled packs carry the pin.
+    """
+    content_hash = policy_content_hash(policy)
+    if policy.meta.content_hash == content_hash:
+        return policy
+    return replace(policy, meta=replace(policy.meta, content_hash=content_hash))
+
+
+def policy_pin(policy: PolicyPack) -> PolicyPin:
+    """
+    Report pin for a pack, with the hash of its actual content.
+
+    Raises PolicyError('policy_pack_hash_mismatch') if meta.content_hash is set
+    but is not the pack's hash (e.g. rules replaced after pinning).
+    """
+    return pin_with_hash(policy, policy_content_hash(policy))
+
+
+def pin_with_hash(policy: PolicyPack, content_hash: str) -> PolicyPin:
+    """
+    policy_pin() for a caller that has already computed policy_content_hash().
+    """
+    meta = policy.meta
+    if meta.content_hash is not None and meta.content_hash != content_hash:
+        raise PolicyError(
+            code="policy_pack_hash_mismatch",
+            message="meta.content_hash does not match the pack's content",
+        )
+    return PolicyPin(
+        policy_pack_id=meta.policy_pack_id,
+        version=meta.version,
+        schema_version=meta.schema_version,
+        content_hash_alg=meta.content_hash_alg,
+        content_hash=content_hash,
+    )
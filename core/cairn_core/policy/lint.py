@@ -0,0 +1,140 @@
+"""
+Static lint of policy packs.
+
+Rules are compared pairwise within each column they read (see ColumnTest), for
+the rules active in one target environment:
+
+    duplicate      same comparison and threshold: both fire on exactly the
+                   same snapshots
+    subsumed       whenever the first rule fires the second does too, e.g.
+                   count_at_least 3 vs count_at_least 5 on ".py"
+    contradictory  no snapshot can satisfy both, so one of them always fires,
+                   e.g. marker_present vs marker_missing on "readme", or
+                   count_at_least 5 vs count_at_most 2 on ".py"
+
+Lint never changes evaluation: flagged rules still report their own findings.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Dict, List, Literal, Optional, Tuple
+
+from cairn_core.policy.compile import CompiledRule, compile_policy
+from cairn_core.policy.schema import PolicyPack, TargetEnv
+
+__all__ = ["LintIssue", "PolicyLintReport", "lint_policy"]
+
+LintCode = Literal["contradictory", "duplicate", "subsumed"]
+
+
+@dataclass(frozen=True)
+class LintIssue:
+    """
+    One finding about a pair of rules. For 'subsumed', rule_ids is
+    (implied rule, implying rule); otherwise the pair is sorted.
+    """
+
+    code: LintCode
+    rule_ids: Tuple[str, str]
+    column: Tuple[str, str]
+    message: str
+
+
+@dataclass(frozen=True)
+class PolicyLintReport:
+    """
+    Lint result for one target environment.
+
+    column_reads is the number of distinct snapshot reads per evaluation, after
+    rules reading the same column share them (rule_count before sharing).
+    """
+
+    policy_pack_id: str
+    version: str
+    target_env: TargetEnv
+    rule_count: int
+    column_reads: int
+    issues: Tuple[LintIssue, ...] = ()
+
+
+def _describe(rule: CompiledRule) -> str:
+    test = rule.test
+    if test.op == "lt":
+        return f"fires when {test.column[1]!r} < {test.threshold}"
+    if test.op == "gt":
+        return f"fires when {test.column[1]!r} > {test.threshold}"
+    return f"fires when {test.column[1]!r} is {test.op}"
+
+
+def _compare(a: CompiledRule, b: CompiledRule) -> Optional[LintIssue]:
+    ta, tb = a.test, b.test
+    column = ta.column
+
+    def issue(code: LintCode, ids: Tuple[str, str], relation: str) -> LintIssue:
+        first, second = (a, b) if ids[0] == a.rule_id else (b, a)
+        return LintIssue(
+            code=code,
+            rule_ids=ids,
+            column=column,
+            message=(
+                f"{first.rule_id} ({_describe(first)}) {relation} "
+                f"{second.rule_id} ({_describe(second)})"
+            ),
+        )
+
+    pair = (a.rule_id, b.rule_id)
+    ops = {ta.op, tb.op}
+
+    if ta.op == tb.op and (ta.op in ("true", "false") or ta.threshold == tb.threshold):
+        return issue("duplicate", pair, "duplicates")
+
+    if ops == {"true", "false"}:
+        return issue("contradictory", pair, "contradicts")
+
+    if ta.op == tb.op:
+        # "lt": the lower threshold fires on a subset; "gt": the higher one.
+        low, high = (a, b) if ta.threshold < tb.threshold else (b, a)
+        weaker, stronger = (low, high) if ta.op == "lt" else (high, low)
+        return issue("subsumed", (weaker.rule_id, stronger.rule_id), "is implied by")
+
+    if ops == {"lt", "gt"}:
+        # Passing both needs minimum <= value <= maximum.
+        lt, gt = (a, b) if ta.op == "lt" else (b, a)
+        if lt.test.threshold > gt.test.threshold:
+            return issue("contradictory", pair, "contradicts")
+
+    return None
+
+
+def lint_policy(
+    policy: PolicyPack, *, target_env: TargetEnv = "general"
+) -> PolicyLintReport:
+    """
+    Report duplicate, subsumed and contradictory rules among the rules active
+    for target_env. Validates the pack as compile_policy() does.
+    """
+    compiled = compile_policy(policy, target_env=target_env)
+
+    by_column: Dict[Tuple[str, str], List[CompiledRule]] = {}
+    for rule in compiled.rules:
+        by_column.setdefault(rule.test.column, []).append(rule)
+
+    issues: List[LintIssue] = []
+    for rules in by_column.values():
+        ordered = sorted(rules, key=lambda r: r.rule_id)
+        for a, b in combinations(ordered, 2):
+            found = _compare(a, b)
+            if found is not None:
+                issues.append(found)
+
+    issues.sort(key=lambda i: (i.code, i.rule_ids))
+    return PolicyLintReport(
+        policy_pack_id=compiled.policy_pack_id,
+        version=compiled.version,
+        target_env=target_env,
+        rule_count=len(compiled.rules),
+        column_reads=len(compiled.columns),
+        issues=tuple(issues),
+    )
@@ -0,0 +1,361 @@
+"""
+Policy pack loading from YAML.
+
+A pack file mirrors the PolicyPack dataclasses:
+
+    meta:
+      policy_pack_id: cairn-default
+      version: "1.0.0"
+    rules:
+      - rule_id: proj.readme.required
+        title: README present
+        kind: analysis_marker_present
+        severity: low
+        params: {marker: readme}
+
+Optional fields take their dataclass defaults; unknown fields are rejected.
+Scalars keep their YAML types, so versions and dates must be quoted strings.
+
+After a successful load, the validated pack (content hash included) is written
+as canonical JSON next to the source, keyed by the SHA-256 of the source bytes.
+While the source is unchanged, later loads rebuild the pack from that cache
+without YAML parsing. The rebuilt pack goes through the same checks as a parsed
+one (content hash recomputed and compared, every rule validated), so a cache
+can only save the parse, never change the pack. Any unreadable, stale,
+malformed or mismatching cache is ignored (and rewritten); failing to write it
+is not an error.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import MISSING, fields, replace
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union, cast, get_args
+
+from cairn_core.policy.compile import compile_policy
+from cairn_core.policy.errors import PolicyError, PolicyEvaluationError
+from cairn_core.policy.hashing import policy_content_hash
+from cairn_core.policy.schema import (
+    JurisdictionScope,
+    PolicyPack,
+    PolicyPackMeta,
+    RemediationRef,
+    Rule,
+    SchemaVersion,
+    SeverityModel,
+    StandardsRef,
+)
+from cairn_core.serialization import to_json_bytes
+
+__all__ = ["load_policy_pack", "policy_cache_path"]
+
+_CACHE_VERSION = 1
+_CACHE_SUFFIX = ".cairn-cache"
+
+_SCHEMA_VERSIONS = frozenset(get_args(SchemaVersion))
+
+
+def _parse_yaml(raw: bytes) -> Any:
+    # yaml is imported on first parse: loading a pack from its up-to-date cache,
+    # or importing this module, does not need it. libyaml's loader is used when
+    # available; same results as SafeLoader, much faster.
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        return yaml.load(raw, Loader=loader)
+    except yaml.YAMLError as e:
+        raise PolicyError(
+            code="policy_pack_invalid_yaml",
+            message=f"Policy pack is not valid YAML: {e}",
+        ) from e
+
+
+def policy_cache_path(source: Path) -> Path:
+    """
+    Location of the pre-validated cache for a pack file.
+    """
+    return source.with_name(f".{source.name}{_CACHE_SUFFIX}")
+
+
+# ---- structure ----
+
+
+def _invalid(message: str) -> PolicyError:
+    return PolicyError(code="policy_pack_invalid", message=message)
+
+
+def _fields(obj: Any, cls: type, where: str) -> Dict[str, Any]:
+    if not isinstance(obj, dict):
+        raise _invalid(f"{where} must be a mapping")
+    known = {f.name: f for f in fields(cls)}
+    unknown = sorted(str(k) for k in obj.keys() - known.keys())
+    if unknown:
+        raise _invalid(f"{where} has unknown fields: {', '.join(unknown)}")
+    missing = sorted(
+        name
+        for name, f in known.items()
+        if name not in obj and f.default is MISSING and f.default_factory is MISSING
+    )
+    if missing:
+        raise _invalid(f"{where} is missing fields: {', '.join(missing)}")
+    return obj
+
+
+def _str(value: Any, where: str) -> str:
+    if not isinstance(value, str):
+        raise _invalid(f"{where} must be a string")
+    return value
+
+
+def _opt_str(value: Any, where: str) -> Optional[str]:
+    return None if value is None else _str(value, where)
+
+
+def _bool(value: Any, where: str) -> bool:
+    if type(value) is not bool:
+        raise _invalid(f"{where} must be a boolean")
+    return value
+
+
+def _list(value: Any, where: str) -> list:
+    if not isinstance(value, list):
+        raise _invalid(f"{where} must be a list")
+    return value
+
+
+def _str_tuple(value: Any, where: str) -> Tuple[str, ...]:
+    return tuple(_str(v, f"{where}[{i}]") for i, v in enumerate(_list(value, where)))
+
+
+def _standard(obj: Any, where: str) -> StandardsRef:
+    d = _fields(obj, StandardsRef, where)
+    return StandardsRef(
+        scheme=_str(d["scheme"], f"{where}.scheme"),
+        ref=_str(d["ref"], f"{where}.ref"),
+        url=_opt_str(d.get("url"), f"{where}.url"),
+    )
+
+
+def _standards(value: Any, where: str) -> Tuple[StandardsRef, ...]:
+    items = _list(value, where)
+    return tuple(_standard(v, f"{where}[{i}]") for i, v in enumerate(items))
+
+
+def _remediation(obj: Any, where: str) -> RemediationRef:
+    d = _fields(obj, RemediationRef, where)
+    return RemediationRef(
+        project_id=_str(d["project_id"], f"{where}.project_id"),
+        safe_by_default=_bool(
+            d.get("safe_by_default", True), f"{where}.safe_by_default"
+        ),
+        dry_run_supported=_bool(
+            d.get("dry_run_supported", True), f"{where}.dry_run_supported"
+        ),
+    )
+
+
+def _rule(obj: Any, where: str) -> Rule:
+    d = _fields(obj, Rule, where)
+    params = d.get("params", {})
+    if not isinstance(params, dict) or not all(isinstance(k, str) for k in params):
+        raise _invalid(f"{where}.params must be a mapping with string keys")
+    remediation = _list(d.get("remediation", []), f"{where}.remediation")
+
+    # kind/severity/target_envs/params semantics are checked by the compiler.
+    return Rule(
+        rule_id=_str(d["rule_id"], f"{where}.rule_id"),
+        title=_str(d["title"], f"{where}.title"),
+        kind=_str(d["kind"], f"{where}.kind"),  # type: ignore[arg-type]
+        severity=_str(d["severity"], f"{where}.severity"),  # type: ignore[arg-type]
+        enabled=_bool(d.get("enabled", True), f"{where}.enabled"),
+        target_envs=_str_tuple(  # type: ignore[arg-type]
+            d.get("target_envs", ["general"]), f"{where}.target_envs"
+        ),
+        params=params,
+        remediation=tuple(
+            _remediation(v, f"{where}.remediation[{i}]")
+            for i, v in enumerate(remediation)
+        ),
+        standards=_standards(d.get("standards", []), f"{where}.standards"),
+        rationale=_str(d.get("rationale", ""), f"{where}.rationale"),
+        references=_str_tuple(d.get("references", []), f"{where}.references"),
+    )
+
+
+def _meta(obj: Any) -> PolicyPackMeta:
+    d = _fields(obj, PolicyPackMeta, "meta")
+
+    schema_version = d.get("schema_version", "1.0")
+    if not isinstance(schema_version, str) or schema_version not in _SCHEMA_VERSIONS:
+        raise PolicyError(
+            code="policy_pack_schema_unsupported",
+            message=f"Unsupported policy schema_version: {schema_version!r}",
+        )
+    if d.get("content_hash_alg", "sha256") != "sha256":
+        raise _invalid("meta.content_hash_alg must be 'sha256'")
+
+    j = _fields(d.get("jurisdiction", {}), JurisdictionScope, "meta.jurisdiction")
+    return PolicyPackMeta(
+        policy_pack_id=_str(d["policy_pack_id"], "meta.policy_pack_id"),
+        version=_str(d["version"], "meta.version"),
+        schema_version=cast(SchemaVersion, schema_version),
+        published_date=_opt_str(d.get("published_date"), "meta.published_date"),
+        author=_opt_str(d.get("author"), "meta.author"),
+        description=_opt_str(d.get("description"), "meta.description"),
+        jurisdiction=JurisdictionScope(
+            regions=_str_tuple(j.get("regions", []), "meta.jurisdiction.regions"),
+            excluded_regions=_str_tuple(
+                j.get("excluded_regions", []), "meta.jurisdiction.excluded_regions"
+            ),
+            notes=_opt_str(j.get("notes"), "meta.jurisdiction.notes"),
+        ),
+        standards_profile=_standards(
+            d.get("standards_profile", []), "meta.standards_profile"
+        ),
+        min_cairn_version=_opt_str(
+            d.get("min_cairn_version"), "meta.min_cairn_version"
+        ),
+        content_hash=_opt_str(d.get("content_hash"), "meta.content_hash"),
+    )
+
+
+def _severity_model(obj: Any) -> SeverityModel:
+    d = _fields(obj, SeverityModel, "severity_model")
+    if d.get("schema", "fixed_scale_v1") != "fixed_scale_v1":
+        raise _invalid("severity_model.schema must be 'fixed_scale_v1'")
+    default = SeverityModel().allowed
+    return SeverityModel(
+        allowed=_str_tuple(  # type: ignore[arg-type]
+            d.get("allowed", list(default)), "severity_model.allowed"
+        ),
+    )
+
+
+def _pack(data: Any) -> PolicyPack:
+    d = _fields(data, PolicyPack, "policy pack")
+    rules = _list(d.get("rules", []), "rules")
+    return PolicyPack(
+        meta=_meta(d["meta"]),
+        severity_model=_severity_model(d.get("severity_model", {})),
+        rules=tuple(_rule(r, f"rules[{i}]") for i, r in enumerate(rules)),
+    )
+
+
+def _pin(pack: PolicyPack) -> PolicyPack:
+    # Shared by the YAML and cache paths: set or check meta.content_hash, then
+    # validate every rule.
+    content_hash = policy_content_hash(pack)
+    if pack.meta.content_hash is None:
+        pack = replace(pack, meta=replace(pack.meta, content_hash=content_hash))
+    elif pack.meta.content_hash != content_hash:
+        raise PolicyError(
+            code="policy_pack_hash_mismatch",
+            message="meta.content_hash does not match the pack's content",
+        )
+
+    try:
+        # Validates every rule (including disabled and other-env ones) and
+        # leaves the compiled pack in the in-process cache.
+        compile_policy(pack)
+    except PolicyEvaluationError as e:
+        raise PolicyError(code=e.code, message=str(e)) from e
+    return pack
+
+
+# ---- cache ----
+
+
+def _read_cache(path: Path, source_hash: str) -> Optional[PolicyPack]:
+    try:
+        data = json.loads(path.read_bytes())
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != _CACHE_VERSION
+            or data.get("source_sha256") != source_hash
+        ):
+            return None
+        pack = _pack(data["pack"])
+        if pack.meta.content_hash is None:
+            return None
+        return _pin(pack)
+    except (OSError, ValueError, KeyError, PolicyError):
+        return None
+
+
+def _write_cache(path: Path, source_hash: str, pack: PolicyPack) -> None:
+    # Canonical JSON of the pack, wrapped without re-encoding it.
+    data = b'{"pack":%s,"source_sha256":"%s","version":%d}' % (
+        to_json_bytes(pack).rstrip(b"\n"),
+        source_hash.encode("ascii"),
+        _CACHE_VERSION,
+    )
+
+    tmp_name: str | None = None
+    try:
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f"{path.name}.", suffix=".tmp", dir=path.parent
+        )
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+        tmp_name = None
+    except OSError:
+        pass
+    finally:
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+# ---- public API ----
+
+
+def load_policy_pack(path: Union[str, Path], *, use_cache: bool = True) -> PolicyPack:
+    """
+    Load, validate and pin a policy pack YAML file.
+
+    Must:
+    - reject unknown fields and wrongly typed values
+    - validate every rule's kind, severity, target envs and params
+    - return the pack with meta.content_hash set (see policy_content_hash())
+
+    With use_cache, an up-to-date cache next to the source is used instead of
+    parsing (after the same hash and rule checks), and a fresh one is written
+    after parsing.
+
+    Raises PolicyError with code:
+    - 'policy_pack_io_error'
+    - 'policy_pack_invalid_yaml'
+    - 'policy_pack_schema_unsupported'
+    - 'policy_pack_invalid' (wrong shape, missing/unknown field, bad type)
+    - 'policy_pack_hash_mismatch' (meta.content_hash given but not the pack's)
+    - the PolicyEvaluationError code of any rule that fails validation
+    """
+    source = Path(path)
+    try:
+        raw = source.read_bytes()
+    except OSError as e:
+        raise PolicyError(
+            code="policy_pack_io_error",
+            message=f"Failed to read policy pack: {source} ({e})",
+        ) from e
+
+    source_hash = hashlib.sha256(raw).hexdigest()
+    cache_path = policy_cache_path(source)
+    if use_cache:
+        cached = _read_cache(cache_path, source_hash)
+        if cached is not None:
+            return cached
+
+    pack = _pin(_pack(_parse_yaml(raw)))
+    if use_cache:
+        _write_cache(cache_path, source_hash, pack)
+    return pack
+
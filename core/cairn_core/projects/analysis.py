@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, Sequence
 
 from cairn_core.projects.context import ProjectContext
 from cairn_core.projects.introspect import ProjectIntrospection
@@ -20,10 +20,15 @@ class ProjectAnalysis:
     introspection: ProjectIntrospection
 
     entry_count: int
-    relative_paths: Tuple[str, ...]
+    # Lazy view over introspection.table (no per-analysis copy of the paths).
+    relative_paths: Sequence[str]
 
     extension_counts: Dict[str, int]
     dir_counts: Dict[str, int]
     max_depth: int
 
     markers: AnalysisMarkers
+
+    # Bookkeeping for incremental updates: file depth -> number of files at that
+    # depth (same scope as max_depth), so max_depth survives deletions.
+    file_depth_counts: Dict[int, int] = field(default_factory=dict)
@@ -1,16 +1,151 @@
 from __future__ import annotations
 
+import os
+import stat
+from bisect import bisect_left
 from collections import Counter
-from pathlib import Path
+from pathlib import Path, PurePath
+from typing import TYPE_CHECKING, Any, Iterable
 
 from cairn_core.projects.analysis import AnalysisMarkers, ProjectAnalysis
-from cairn_core.projects.introspect import introspect_project
+from cairn_core.projects.context import ProjectContext
+from cairn_core.projects.introspect import (
+    IntrospectionEntry,
+    ProjectIntrospection,
+    ScanOptions,
+    _load_recorded,
+    introspect_from_context,
+)
 from cairn_core.projects.load import load_project
-from cairn_core.reporting.build import build_report_from_analysis
-from cairn_core.reporting.schema import CairnReport
+from cairn_core.projects.path_table import PathTable
+from cairn_core.projects.stats import ScanRecorder, ScanStats, clock
+from cairn_core.projects.traversal import (
+    KIND_DIR,
+    KIND_FILE,
+    KIND_OTHER,
+    EntryKind,
+    ExclusionMatcher,
+    ProjectIntrospectError,
+    exclusion_matcher,
+    is_excluded_path,
+    iter_subtree_deterministic,
+)
 
+if TYPE_CHECKING:
+    # Reporting is only loaded by the *_report entrypoints, when first called.
+    from cairn_core.reporting.schema import CairnReport
+    from cairn_core.tracing import Tracer
 
-def analyze_project(root: Path) -> ProjectAnalysis:
+
+def _suffix(name: str) -> str:
+    # Same rule as PurePath.suffix, without constructing a path object.
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i:]
+    return ""
+
+
+class _Totals:
+    """
+    Running aggregates over typed entries.
+
+    Entries can be added (sign=+1) or removed (sign=-1), which lets incremental
+    re-analysis patch a previous result instead of recomputing it.
+    """
+
+    __slots__ = ("ext", "dirs", "file_depths", "markers")
+
+    def __init__(self) -> None:
+        self.ext: Counter[str] = Counter()
+        self.dirs: Counter[str] = Counter()
+        self.file_depths: Counter[int] = Counter()
+        self.markers: Counter[str] = Counter()
+
+    def apply(self, entries: Iterable[IntrospectionEntry], sign: int = 1) -> None:
+        # Single fused pass over typed entries: no filesystem calls after traversal.
+        ext = self.ext
+        dirs = self.dirs
+        file_depths = self.file_depths
+
+        for rel, kind, depth in entries:
+            # ---- markers ----
+            # Only root-level entries count for markers; ignore internal metadata.
+            if depth == 1 and rel != ".cairn":
+                marker = _root_marker(rel.lower())
+                if marker is not None:
+                    self.markers[marker] += sign
+
+            if kind != "file":
+                continue
+
+            # ---- extension_counts ----
+            ext[_suffix(rel.rpartition("/")[2]).lower()] += sign
+
+            # Exclude Cairn internal metadata
+            if rel.startswith(".cairn/"):
+                continue
+
+            # ---- dir_counts ----
+            # Group files by top-level directory; root files count under ""
+            top = "" if depth == 1 else rel.partition("/")[0]
+            dirs[top] += sign
+
+            # ---- max_depth ----
+            # Depth = number of directories in the relative path (root file => 0)
+            file_depths[depth - 1] += sign
+
+
+def _root_marker(name: str) -> str | None:
+    if name == "pyproject.toml":
+        return "pyproject"
+    if name == "requirements.txt":
+        return "requirements"
+    # README.* at root (case-insensitive)
+    if name.startswith("readme") and (len(name) == 6 or name[6] == "."):
+        return "readme"
+    return None
+
+
+def _markers_from_counts(counts: Counter[str]) -> AnalysisMarkers:
+    return AnalysisMarkers(
+        has_readme=counts["readme"] > 0,
+        has_pyproject=counts["pyproject"] > 0,
+        has_requirements=counts["requirements"] > 0,
+    )
+
+
+def _positive(counter: Counter[Any]) -> dict[Any, int]:
+    return {k: v for k, v in counter.items() if v > 0}
+
+
+def _analysis_from_totals(
+    project: ProjectContext,
+    intro: ProjectIntrospection,
+    totals: _Totals,
+    *,
+    markers: AnalysisMarkers,
+) -> ProjectAnalysis:
+    file_depth_counts = _positive(totals.file_depths)
+
+    return ProjectAnalysis(
+        project=project,
+        introspection=intro,
+        entry_count=intro.entry_count,
+        relative_paths=intro.relative_paths,
+        extension_counts=_positive(totals.ext),
+        dir_counts=_positive(totals.dirs),
+        max_depth=max(file_depth_counts, default=0),
+        markers=markers,
+        file_depth_counts=file_depth_counts,
+    )
+
+
+def analyze_project(
+    root: Path,
+    *,
+    options: ScanOptions | None = None,
+    tracer: Tracer | None = None,
+) -> ProjectAnalysis:
     """
     Phase 5 entrypoint (partial).
 
@@ -18,107 +153,327 @@ def analyze_project(root: Path) -> ProjectAnalysis:
     - enforce Phase 3 + Phase 4 gates
     - be deterministic and side-effect free
     - return ProjectAnalysis
+
+    With a tracer, spans are recorded for every phase and listing.
     """
+    if tracer is not None:
+        return analyze_project_with_stats(root, options=options, tracer=tracer)[0]
     project = load_project(root)
-    intro = introspect_project(root)
+    return analyze_from_context(project, options=options)
 
-    relative_paths = tuple(intro.relative_paths)
 
-    # ---- extension_counts ----
-    ext_counter: Counter[str] = Counter()
-    for rel in relative_paths:
-        full_path = root / Path(rel)
-        if not full_path.is_file():
-            continue
+def analyze_project_with_stats(
+    root: Path,
+    *,
+    options: ScanOptions | None = None,
+    tracer: Tracer | None = None,
+) -> tuple[ProjectAnalysis, ScanStats]:
+    """
+    analyze_project(), plus per-phase timings and counters for the scan.
+    """
+    stats = ScanRecorder(tracer)
+    project = _load_recorded(root, stats)
+    analysis = analyze_from_context(project, options=options, stats=stats)
+    return analysis, stats.freeze()
 
-        suffix = Path(rel).suffix.lower()
-        ext_counter[suffix] += 1
 
-    # ---- dir_counts ----
-    dir_counter: Counter[str] = Counter()
-    for rel in relative_paths:
-        full_path = root / Path(rel)
-        if not full_path.is_file():
-            continue
+def analyze_from_context(
+    project: ProjectContext,
+    *,
+    options: ScanOptions | None = None,
+    stats: ScanRecorder | None = None,
+) -> ProjectAnalysis:
+    """
+    Pipeline entrypoint for callers that already hold a validated ProjectContext.
 
-        # Normalize for Windows paths
-        rel_norm = rel.replace("\\", "/")
+    The Phase 3 gate is not repeated; introspection reuses the same context so the
+    manifest is read and parsed exactly once per public entrypoint.
 
-        # Exclude Cairn internal metadata
-        if rel_norm.startswith(".cairn/"):
-            continue
+    With `stats`, traversal and aggregation are recorded into it.
+    """
+    intro = introspect_from_context(project, options=options, stats=stats)
 
-        # Group files by top-level directory; root files count under ""
-        head, sep, _tail = rel_norm.partition("/")
-        top = "" if sep == "" else head
-        dir_counter[top] += 1
+    if stats is not None:
+        start = clock()
 
-    # ---- max_depth ----
-    max_depth = 0
-    for rel in relative_paths:
-        full_path = root / Path(rel)
-        if not full_path.is_file():
-            continue
+    totals = _Totals()
+    totals.apply(intro.entries)
+    analysis = _analysis_from_totals(
+        project, intro, totals, markers=_markers_from_counts(totals.markers)
+    )
 
-        # Normalize for Windows paths
-        rel_norm = rel.replace("\\", "/")
+    if stats is not None:
+        end = clock()
+        stats.aggregation_ns += end - start
+        if stats.tracer is not None:
+            stats.tracer.add("aggregate", start, end)
+    return analysis
 
-        # Exclude Cairn internal metadata
-        if rel_norm.startswith(".cairn/"):
-            continue
 
-        # Depth = number of directories in the relative path
-        parts = rel_norm.split("/")
-        depth = len(parts) - 1  # root file => 0
-        if depth > max_depth:
-            max_depth = depth
+_MANIFEST_REL = ".cairn/manifest.yaml"
+
+
+def _entry_key(entry: IntrospectionEntry) -> list[str]:
+    # Depth-first traversal with name-sorted children is exactly the order of
+    # paths compared component by component.
+    return entry.relative_path.split("/")
+
+
+def _locate(entries: list[IntrospectionEntry], rel: str) -> tuple[int, bool]:
+    i = bisect_left(entries, rel.split("/"), key=_entry_key)
+    return i, i < len(entries) and entries[i].relative_path == rel
+
 
-    # ---- markers ----
-    has_readme = False
-    has_pyproject = False
-    has_requirements = False
+def _subtree_end(entries: list[IntrospectionEntry], start: int, rel: str) -> int:
+    prefix = rel + "/"
+    end = start
+    while end < len(entries) and entries[end].relative_path.startswith(prefix):
+        end += 1
+    return end
 
-    for rel in relative_paths:
-        rel_norm = rel.replace("\\", "/")
 
-        # Ignore internal metadata
-        if rel_norm == ".cairn" or rel_norm.startswith(".cairn/"):
+def _normalize_changed_path(root: Path, path: str | os.PathLike[str]) -> str:
+    p = PurePath(path)
+    if p.is_absolute():
+        # Raises ValueError for paths outside the project root.
+        p = p.relative_to(root)
+
+    parts = [part for part in p.parts if part != "."]
+    if ".." in parts:
+        raise ValueError(f"Changed path escapes the project root: {path}")
+
+    return "/".join(parts) if parts else "."
+
+
+def _anchor(entries: list[IntrospectionEntry], rel: str) -> str:
+    """
+    Highest ancestor of `rel` (or rel itself) not already known as a directory.
+
+    A watcher may report only the deepest new path; anything above it that the
+    previous traversal did not record as a directory must be read as well.
+    """
+    parts = rel.split("/")
+    for n in range(1, len(parts)):
+        ancestor = "/".join(parts[:n])
+        i, found = _locate(entries, ancestor)
+        if not found or entries[i].kind != KIND_DIR:
+            return ancestor
+    return rel
+
+
+def _lstat_or_none(full_path: str) -> os.stat_result | None:
+    try:
+        return os.lstat(full_path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    except OSError as e:
+        raise ProjectIntrospectError(
+            code="introspect_io_error",
+            message=f"Failed to read entry: {full_path} ({e})",
+        ) from e
+
+
+def _check_depth(full_path: str, depth: int, options: ScanOptions) -> None:
+    # The parent sits at or beyond the depth limit and now has a child.
+    if depth > options.max_depth:
+        parent_path = os.path.dirname(full_path)
+        raise ProjectIntrospectError(
+            code="introspection_scan_limit_exceeded",
+            message=f"Traversal depth limit exceeded at: {parent_path}",
+        )
+
+
+def _read_ignored(root: Path, rel: str, *, options: ScanOptions) -> bool:
+    """
+    Whether the excluded entry at `rel` exists (and so belongs in ignored_paths).
+    """
+    full_path = os.path.join(root, *rel.split("/"))
+    if _lstat_or_none(full_path) is None:
+        return False
+    _check_depth(full_path, len(rel.split("/")), options)
+    return True
+
+
+def _read_path(
+    root: Path,
+    rel: str,
+    *,
+    options: ScanOptions,
+    exclusions: ExclusionMatcher,
+    ignored: list[str],
+) -> list[IntrospectionEntry]:
+    """
+    Current entries for `rel` and its subtree ([] if it no longer exists);
+    excluded paths pruned inside the subtree are appended to `ignored`.
+    """
+    full_path = os.path.join(root, *rel.split("/"))
+    depth = len(rel.split("/"))
+
+    st = _lstat_or_none(full_path)
+    if st is None:
+        return []
+
+    if stat.S_ISLNK(st.st_mode):
+        raise ProjectIntrospectError(
+            code="introspect_symlink_detected",
+            message=f"Symlink encountered: {full_path}",
+        )
+
+    _check_depth(full_path, depth, options)
+
+    kind: EntryKind
+    if stat.S_ISDIR(st.st_mode):
+        kind = KIND_DIR
+    elif stat.S_ISREG(st.st_mode):
+        kind = KIND_FILE
+    else:
+        kind = KIND_OTHER
+
+    out = [IntrospectionEntry(rel, kind, depth)]
+    if kind == KIND_DIR:
+        # A subtree over budget on its own is over budget in the whole tree.
+        out.extend(
+            iter_subtree_deterministic(
+                root,
+                rel,
+                max_depth=options.max_depth,
+                max_files=options.max_files,
+                max_entries=options.max_entries,
+                exclusions=exclusions,
+                ignored=ignored,
+            )
+        )
+    return out
+
+
+def _check_scan_limits(
+    root: Path, entry_count: int, file_count: int, options: ScanOptions
+) -> None:
+    if options.max_entries is not None and entry_count > options.max_entries:
+        raise ProjectIntrospectError(
+            code="introspection_scan_limit_exceeded",
+            message=f"Traversal entry limit exceeded under: {root}",
+        )
+    if options.max_files is not None and file_count > options.max_files:
+        raise ProjectIntrospectError(
+            code="introspection_scan_limit_exceeded",
+            message=f"Traversal file limit exceeded under: {root}",
+        )
+
+
+def update_analysis(
+    previous: ProjectAnalysis,
+    changed_paths: Iterable[str | os.PathLike[str]],
+    *,
+    options: ScanOptions | None = None,
+) -> ProjectAnalysis:
+    """
+    Return the analysis of the current on-disk state, given a previous analysis of
+    the same project and the paths that changed since (added, removed or modified;
+    relative to the project root, or absolute paths under it).
+
+    Must:
+    - be equal to a fresh analyze_project() of the same state
+    - touch the filesystem only for the changed paths and their subtrees
+    - re-run the Phase 3 gate if the manifest itself changed
+    - enforce the same scan limits as a full scan with the same options
+    """
+    if options is None:
+        options = ScanOptions()
+
+    project = previous.project
+    root = project.root
+
+    targets = {_normalize_changed_path(root, p) for p in changed_paths}
+
+    if not targets:
+        return previous
+
+    if targets & {".", ".cairn", _MANIFEST_REL}:
+        # Phase 3 gate: the manifest may have changed; errors propagate unchanged.
+        project = load_project(root)
+
+    # A changed exclusion set can reshape the whole tree.
+    if "." in targets or project.extra_exclusions != previous.project.extra_exclusions:
+        return analyze_from_context(project, options=options)
+
+    exclusions = exclusion_matcher(project.extra_exclusions)
+    ignored = set(previous.introspection.ignored_paths)
+
+    entries = list(previous.introspection.entries)
+    removed: list[IntrospectionEntry] = []
+    added: list[IntrospectionEntry] = []
+    rescanned: set[str] = set()
+
+    for target in sorted(targets, key=lambda rel: rel.split("/")):
+        rel = _anchor(entries, target)
+
+        # Skip paths already covered by an ancestor's rescan in this update.
+        parts = rel.split("/")
+        if any("/".join(parts[:n]) in rescanned for n in range(1, len(parts) + 1)):
             continue
+        rescanned.add(rel)
 
-        # Only root-level files count for markers
-        if "/" in rel_norm:
+        # The anchor's ancestors are known (visited) directories, so an excluded
+        # anchor is itself the pruned entry: only its presence can have changed.
+        # A change reported below it can still reveal new (non-excluded)
+        # ancestors, handled via the anchor.
+        if is_excluded_path(rel, exclusions):
+            if exclusions(parts[-1]):
+                if _read_ignored(root, rel, options=options):
+                    ignored.add(rel)
+                else:
+                    ignored.discard(rel)
             continue
 
-        name = rel_norm.lower()
-
-        if name == "pyproject.toml":
-            has_pyproject = True
-        elif name == "requirements.txt":
-            has_requirements = True
-        else:
-            # README.* at root (case-insensitive)
-            if name.startswith("readme") and (len(name) == 6 or name[6] == "."):
-                has_readme = True
-
-    markers = AnalysisMarkers(
-        has_readme=has_readme,
-        has_pyproject=has_pyproject,
-        has_requirements=has_requirements,
-    )
+        prefix = rel + "/"
+        ignored = {p for p in ignored if not p.startswith(prefix)}
 
-    return ProjectAnalysis(
+        i, found = _locate(entries, rel)
+        end = _subtree_end(entries, i + 1 if found else i, rel)
+        fresh_ignored: list[str] = []
+        fresh = _read_path(
+            root, rel, options=options, exclusions=exclusions, ignored=fresh_ignored
+        )
+        ignored.update(fresh_ignored)
+
+        removed.extend(entries[i:end])
+        added.extend(fresh)
+        entries[i:end] = fresh
+
+    totals = _Totals()
+    totals.ext.update(previous.extension_counts)
+    totals.dirs.update(previous.dir_counts)
+    totals.file_depths.update(previous.file_depth_counts)
+    totals.apply(removed, sign=-1)
+    totals.apply(added)
+
+    entry_count = previous.entry_count - len(removed) + len(added)
+    _check_scan_limits(root, entry_count, sum(totals.ext.values()), options)
+
+    if any(e.depth == 1 for e in removed) or any(e.depth == 1 for e in added):
+        root_level = _Totals()
+        root_level.apply(e for e in entries if e.depth == 1)
+        markers = _markers_from_counts(root_level.markers)
+    else:
+        markers = previous.markers
+
+    intro = ProjectIntrospection(
         project=project,
-        introspection=intro,
-        entry_count=intro.entry_count,
-        relative_paths=relative_paths,
-        extension_counts=dict(ext_counter),
-        dir_counts=dict(dir_counter),
-        max_depth=max_depth,
-        markers=markers,
+        entry_count=entry_count,
+        table=PathTable(entries),
+        ignored_paths=tuple(sorted(ignored)),
     )
 
+    return _analysis_from_totals(project, intro, totals, markers=markers)
 
-def analyze_project_report(root: Path) -> CairnReport:
+
+def analyze_project_report(
+    root: Path,
+    *,
+    options: ScanOptions | None = None,
+    tracer: Tracer | None = None,
+) -> CairnReport:
     """
     Phase 6 Step 5 integration entrypoint.
 
@@ -126,6 +481,40 @@ def analyze_project_report(root: Path) -> CairnReport:
     - enforce Phase 3 + Phase 4 gates via analyze_project
     - be deterministic and side-effect free
     - return CairnReport
+
+    With a tracer, spans are recorded for every phase and listing.
     """
-    analysis = analyze_project(root)
+    if tracer is not None:
+        return analyze_project_report_with_stats(
+            root, options=options, tracer=tracer
+        )[0]
+    from cairn_core.reporting.build import build_report_from_analysis
+
+    analysis = analyze_project(root, options=options)
     return build_report_from_analysis(analysis)
+
+
+def analyze_project_report_with_stats(
+    root: Path,
+    *,
+    options: ScanOptions | None = None,
+    tracer: Tracer | None = None,
+) -> tuple[CairnReport, ScanStats]:
+    """
+    analyze_project_report(), plus per-phase timings and counters; report
+    building counts as aggregation. Pass the report and stats to
+    serialize_with_stats() to add the JSON encoding.
+    """
+    from cairn_core.reporting.build import build_report_from_analysis
+
+    stats = ScanRecorder(tracer)
+    project = _load_recorded(root, stats)
+    analysis = analyze_from_context(project, options=options, stats=stats)
+
+    start = clock()
+    report = build_report_from_analysis(analysis)
+    end = clock()
+    stats.aggregation_ns += end - start
+    if tracer is not None:
+        tracer.add("build_report", start, end)
+    return report, stats.freeze()
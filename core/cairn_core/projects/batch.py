@@ -0,0 +1,212 @@
+"""
+Multi-project batch analysis.
+
+Each project root goes through analyze_project_report() in a worker process.
+Reports are serialized to deterministic JSON in the worker, so only bytes cross
+the process boundary. Results are yielded (and written) strictly in input
+order, whatever order the workers finish in; at most a bounded window of
+projects is in flight or waiting, so memory stays flat over long batches.
+
+Per-project failures with a stable error code (ProjectLoadError,
+ProjectIntrospectError, ReportError, SerializationError) are recorded on the
+result and the batch continues. So is a manifest that parses to something
+other than a mapping (load_project() raises NotImplementedError for it), under
+the code 'manifest_unsupported'. Anything else is a bug and aborts the batch.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Tuple
+
+from cairn_core.projects.analyze import analyze_from_context
+from cairn_core.projects.introspect import ScanOptions
+from cairn_core.projects.load import ProjectLoadError, load_project
+from cairn_core.projects.traversal import ProjectIntrospectError
+from cairn_core.reporting.errors import ReportError
+from cairn_core.serialization.errors import SerializationError
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+__all__ = [
+    "BatchResult",
+    "batch_output_name",
+    "iter_batch_reports",
+    "run_batch",
+]
+
+# Errors that describe a project, not the batch: captured by .code.
+_PROJECT_ERRORS = (
+    ProjectLoadError,
+    ProjectIntrospectError,
+    ReportError,
+    SerializationError,
+)
+
+# Projects submitted ahead of the one being yielded, per worker.
+_WINDOW_PER_WORKER = 4
+
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9._-]+")
+
+# What a worker sends back: (report JSON, error code, error message).
+_Raw = Tuple[bytes | None, str | None, str | None]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    Outcome for one project root, at its position in the input.
+
+    Exactly one of report_json / error_code is set. output_path is set once
+    run_batch() has written the report.
+    """
+
+    index: int
+    root: Path
+    report_json: bytes | None = None
+    error_code: str | None = None
+    error_message: str | None = None
+    output_path: Path | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error_code is None
+
+
+def _analyze_one(root: str, options: ScanOptions | None) -> _Raw:
+    # Top-level (picklable) worker entrypoint: analyze_project_report(), with
+    # the manifest gate split out so its unsupported-manifest case is caught
+    # there and nowhere else.
+    from cairn_core.reporting.build import build_report_from_analysis
+    from cairn_core.serialization import to_json_bytes
+
+    try:
+        try:
+            project = load_project(Path(root))
+        except NotImplementedError:
+            return None, "manifest_unsupported", "Project manifest is not a mapping"
+        analysis = analyze_from_context(project, options=options)
+        return to_json_bytes(build_report_from_analysis(analysis)), None, None
+    except _PROJECT_ERRORS as e:
+        return None, e.code, getattr(e, "message", str(e))
+
+
+def _result(index: int, root: Path, raw: _Raw) -> BatchResult:
+    report_json, code, message = raw
+    return BatchResult(
+        index=index,
+        root=root,
+        report_json=report_json,
+        error_code=code,
+        error_message=message,
+    )
+
+
+def iter_batch_reports(
+    roots: Iterable[Path],
+    *,
+    workers: int | None = None,
+    options: ScanOptions | None = None,
+) -> Iterator[BatchResult]:
+    """
+    Analyze many project roots; yield one BatchResult per root, in input order.
+
+    Must:
+    - run up to `workers` projects concurrently in separate processes
+      (default: os.cpu_count(); 1 analyzes in-process, without a pool)
+    - capture per-project coded errors instead of aborting
+    - yield in input order regardless of completion order
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    items = ((i, Path(root)) for i, root in enumerate(roots))
+
+    if workers == 1:
+        for index, root in items:
+            yield _result(index, root, _analyze_one(str(root), options))
+        return
+
+    # Deferred: multiprocessing is only loaded for an actual pool.
+    from concurrent.futures import ProcessPoolExecutor
+
+    window = workers * _WINDOW_PER_WORKER
+    pending: deque[Tuple[int, Path, Future[_Raw]]] = deque()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+
+        def submit_next() -> None:
+            item = next(items, None)
+            if item is not None:
+                index, root = item
+                future = pool.submit(_analyze_one, str(root), options)
+                pending.append((index, root, future))
+
+        try:
+            for _ in range(window):
+                submit_next()
+            while pending:
+                index, root, future = pending.popleft()
+                raw = future.result()
+                submit_next()
+                yield _result(index, root, raw)
+        finally:
+            # Early exit (consumer stopped, or an unexpected error): drop
+            # queued work instead of finishing it.
+            for _, _, future in pending:
+                future.cancel()
+
+
+def batch_output_name(index: int, root: Path) -> str:
+    """
+    Report file name for one project: input position, then a sanitized root name
+    (so two projects with the same directory name never collide).
+    """
+    name = _UNSAFE_NAME.sub("_", root.resolve().name).strip("._") or "project"
+    return f"{index:06d}-{name}.json"
+
+
+def run_batch(
+    roots: Iterable[Path],
+    out_dir: Path,
+    *,
+    workers: int | None = None,
+    options: ScanOptions | None = None,
+    on_result: Callable[[BatchResult], None] | None = None,
+) -> Tuple[BatchResult, ...]:
+    """
+    Analyze many project roots and write each report to out_dir, in input order.
+
+    Each successful report is written atomically as batch_output_name(); failed
+    projects produce no file. The returned results carry output paths and error
+    codes but not the report bytes; on_result, if given, receives each one as
+    soon as it is written (for progress output).
+    """
+    from cairn_core.reporting.emit import write_report_bytes
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    for result in iter_batch_reports(roots, workers=workers, options=options):
+        output_path = None
+        if result.report_json is not None:
+            output_path = out_dir / batch_output_name(result.index, result.root)
+            write_report_bytes(result.report_json, output_path)
+        done = BatchResult(
+            index=result.index,
+            root=result.root,
+            error_code=result.error_code,
+            error_message=result.error_message,
+            output_path=output_path,
+        )
+        results.append(done)
+        if on_result is not None:
+            on_result(done)
+    return tuple(results)
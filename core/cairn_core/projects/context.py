@@ -10,3 +10,7 @@ class ProjectContext:
     manifest_path: Path
     project_id: str
     schema_version: str
+
+    # Optional manifest `exclude`: extra entry names / fnmatch name patterns that
+    # introspection prunes in addition to the spec exclusion set.
+    extra_exclusions: tuple[str, ...] = ()
@@ -14,8 +14,6 @@ from pathlib import Path
 from typing import Any
 import uuid
 
-import yaml
-
 
 def _validate_project_name(name: str) -> None:
     """
@@ -137,6 +135,8 @@ def init_project(
         },
     }
 
+    import yaml  # deferred: not needed to import this module
+
     manifest_yaml = yaml.safe_dump(
         manifest,
         sort_keys=False,
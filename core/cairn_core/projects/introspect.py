@@ -1,25 +1,40 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
 from cairn_core.projects.context import ProjectContext
+from cairn_core.projects.introspect_cache import iter_tree_cached
 from cairn_core.projects.load import load_project
-
-
-class ProjectIntrospectError(Exception):
-    """
-    Phase 4 error base class.
-
-    All Phase 4 introspection-specific errors MUST derive from this type and expose a
-    stable string code via .code. Phase 3 load errors must propagate unchanged.
-    """
-
-    code: str
-
-    def __init__(self, code: str, message: str) -> None:
-        super().__init__(message)
-        self.code = code
+from cairn_core.projects.path_table import EntriesView, PathTable, RelativePathsView
+from cairn_core.projects.stats import ScanRecorder, ScanStats, clock
+from cairn_core.projects.traversal import (
+    EntryKind,
+    ExclusionMatcher,
+    IntrospectionEntry,
+    ParallelDirLister,
+    ProjectIntrospectError,
+    exclusion_matcher,
+    walk_tree,
+)
+
+if TYPE_CHECKING:
+    from cairn_core.tracing import Tracer
+
+__all__ = [
+    "EntryKind",
+    "IntrospectionEntry",
+    "ProjectIntrospectError",
+    "ProjectIntrospection",
+    "ScanOptions",
+    "ScanStats",
+    "introspect_from_context",
+    "introspect_project",
+    "introspect_project_with_stats",
+    "iter_entries_from_context",
+    "iter_project_entries",
+]
 
 
 @dataclass(frozen=True, slots=True)
@@ -33,111 +48,268 @@ class ProjectIntrospection:
 
     project: ProjectContext
     entry_count: int
-    relative_paths: list[str]
 
+    # Visited entries in traversal order (root excluded), stored compactly.
+    table: PathTable = field(default_factory=PathTable)
+
+    # Excluded entries that were pruned (not visited), sorted. Descendants of an
+    # excluded directory are never listed, so only the excluded entry appears.
+    ignored_paths: tuple[str, ...] = ()
+
+    @property
+    def relative_paths(self) -> RelativePathsView:
+        """
+        Relative POSIX paths in traversal order, built on access.
+        """
+        return RelativePathsView(self.table)
+
+    @property
+    def entries(self) -> EntriesView:
+        """
+        Typed entries, parallel to relative_paths.
+        """
+        return EntriesView(self.table)
 
-_EXCLUDED_DIR_NAMES = {"__pycache__", ".git"}
+
+_DEFAULT_MAX_DEPTH = 25  # Spec default: MAX_DEPTH = 25
+_DEFAULT_MAX_FILES = 50000  # Spec default: MAX_FILES = 50000
 
 
-def _iter_tree_deterministic(root: Path, *, max_depth: int) -> list[Path]:
+@dataclass(frozen=True, slots=True)
+class ScanOptions:
+    """
+    Phase 4 scan configuration. Defaults are the spec's v0 scan limits.
+
+    - max_depth, max_files, max_entries: enforced during traversal (None means
+      unlimited); crossing any of them raises 'introspection_scan_limit_exceeded'.
+      max_files counts regular files; max_entries counts every visited entry,
+      root included (same as ProjectIntrospection.entry_count).
+    - use_cache: persistent listing cache under .cairn/ (the only case where
+      introspection writes to disk). Output is identical to a cold scan.
+    - workers: > 1 lists directories concurrently on a bounded thread pool (for
+      network or cold-cache filesystems). Output and errors match the
+      sequential walk. Cannot be combined with use_cache.
     """
-    Deterministic directory traversal (foundation for Phase 4).
 
-    - Stable lexicographic ordering within each directory.
-    - Rejects symlinks immediately (fail-fast).
-    - Enforces max_depth (root is depth 0).
-    - Excludes internal directories (__pycache__, .git) and their contents.
+    max_depth: int = _DEFAULT_MAX_DEPTH
+    max_files: int | None = _DEFAULT_MAX_FILES
+    max_entries: int | None = None
+    use_cache: bool = False
+    workers: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_depth < 0:
+            raise ValueError("max_depth must be >= 0")
+        if self.max_files is not None and self.max_files < 0:
+            raise ValueError("max_files must be >= 0")
+        if self.max_entries is not None and self.max_entries < 0:
+            raise ValueError("max_entries must be >= 0")
+        if self.workers is not None and self.workers < 1:
+            raise ValueError("workers must be >= 1")
+        if self.use_cache and self.parallel:
+            raise ValueError("use_cache and parallel workers cannot be combined")
+
+    @property
+    def parallel(self) -> bool:
+        return self.workers is not None and self.workers > 1
+
+
+_DEFAULT_SCAN_OPTIONS = ScanOptions()
+
+
+def introspect_project(
+    root: Path,
+    *,
+    options: ScanOptions | None = None,
+    tracer: Tracer | None = None,
+) -> ProjectIntrospection:
     """
-    if max_depth < 0:
-        raise ValueError("max_depth must be >= 0")
+    Phase 4:
+    - Phase 3 gate MUST run first; errors propagate unchanged.
+    - Must enforce scan limits (see ScanOptions), raising code
+      'introspection_scan_limit_exceeded'.
+    - For a valid project (within limits), must return ProjectIntrospection.
 
-    out: list[Path] = []
+    With a tracer, spans are recorded for the load, the walk and each listing.
+    """
+    if tracer is not None:
+        return introspect_project_with_stats(root, options=options, tracer=tracer)[0]
+    project = load_project(root)
+    return introspect_from_context(project, options=options)
 
-    def walk_dir(dir_path: Path, depth: int) -> None:
-        # Exclusion: ignore internal directories entirely (dir + contents).
-        if dir_path.name in _EXCLUDED_DIR_NAMES:
-            return
 
-        # Fail-fast on symlinks.
-        if dir_path.is_symlink():
-            raise ProjectIntrospectError(
-                code="introspect_symlink_detected",
-                message=f"Symlink encountered: {dir_path}",
-            )
+def introspect_project_with_stats(
+    root: Path,
+    *,
+    options: ScanOptions | None = None,
+    tracer: Tracer | None = None,
+) -> tuple[ProjectIntrospection, ScanStats]:
+    """
+    introspect_project(), plus per-phase timings and counters for the scan.
+    """
+    stats = ScanRecorder(tracer)
+    project = _load_recorded(root, stats)
+    intro = introspect_from_context(project, options=options, stats=stats)
+    return intro, stats.freeze()
 
-        out.append(dir_path)
-
-        # Spec: if visiting an entry would exceed MAX_DEPTH, we MUST fail.
-        if depth >= max_depth:
-            try:
-                has_child = any(dir_path.iterdir())
-            except OSError as e:
-                raise ProjectIntrospectError(
-                    code="introspect_io_error",
-                    message=f"Failed to read directory: {dir_path} ({e})",
-                ) from e
-
-            if has_child:
-                raise ProjectIntrospectError(
-                    code="introspection_scan_limit_exceeded",
-                    message=f"Traversal depth limit exceeded at: {dir_path}",
-                )
-            return
-
-        # Deterministic ordering: sort by name only (filesystem case preserved).
-        try:
-            children = sorted(dir_path.iterdir(), key=lambda p: p.name)
-        except OSError as e:
-            raise ProjectIntrospectError(
-                code="introspect_io_error",
-                message=f"Failed to read directory: {dir_path} ({e})",
-            ) from e
-
-        for child in children:
-            # Exclusion: ignore internal directories entirely (dir + contents).
-            if child.name in _EXCLUDED_DIR_NAMES:
-                continue
-
-            # Reject symlinks at the entry point.
-            if child.is_symlink():
-                raise ProjectIntrospectError(
-                    code="introspect_symlink_detected",
-                    message=f"Symlink encountered: {child}",
-                )
-
-            if child.is_dir():
-                walk_dir(child, depth + 1)
-            else:
-                out.append(child)
-
-    walk_dir(root, 0)
-    return out
 
+def _load_recorded(root: Path, stats: ScanRecorder) -> ProjectContext:
+    """
+    load_project(), timed as the manifest phase.
+    """
+    start = clock()
+    try:
+        return load_project(root)
+    finally:
+        end = clock()
+        stats.manifest_ns += end - start
+        if stats.tracer is not None:
+            stats.tracer.add("load_project", start, end)
+
+
+def iter_project_entries(
+    root: Path,
+    *,
+    options: ScanOptions | None = None,
+    ignored: list[str] | None = None,
+) -> Iterator[IntrospectionEntry]:
+    """
+    Streaming Phase 4: yield every visited entry in deterministic order.
 
-_DEFAULT_MAX_DEPTH = 25  # Spec default: MAX_DEPTH = 25
+    - Phase 3 gate runs before this returns; its errors propagate unchanged.
+    - The root entry "." comes first, so the number of entries yielded equals
+      ProjectIntrospection.entry_count.
+    - Scan limits and symlink errors are raised when the walk reaches them.
+    - Pruned (excluded) paths are appended to `ignored`, if given.
+    """
+    project = load_project(root)
+    return iter_entries_from_context(project, options=options, ignored=ignored)
 
 
-def introspect_project(root: Path) -> ProjectIntrospection:
+def iter_entries_from_context(
+    project: ProjectContext,
+    *,
+    options: ScanOptions | None = None,
+    ignored: list[str] | None = None,
+    stats: ScanRecorder | None = None,
+) -> Iterator[IntrospectionEntry]:
     """
-    Phase 4:
-    - Phase 3 gate MUST run first; errors propagate unchanged.
-    - Must enforce traversal max depth, raising code 'introspection_scan_limit_exceeded'.
-    - For a valid project (within limits), must return ProjectIntrospection.
+    Streaming counterpart of introspect_from_context().
+
+    Sequential and parallel scans hold one pending listing per open directory,
+    so memory is bounded by fan-out, not tree size. A cached scan must see the
+    whole tree before it can rewrite the cache, so it is materialized first.
     """
-    project = load_project(root)
+    if options is None:
+        options = _DEFAULT_SCAN_OPTIONS
+
+    root = project.root
+    exclusions = exclusion_matcher(project.extra_exclusions)
+
+    if options.use_cache:
+        return iter(
+            iter_tree_cached(
+                root,
+                max_depth=options.max_depth,
+                max_files=options.max_files,
+                max_entries=options.max_entries,
+                exclusions=exclusions,
+                ignored=ignored,
+                stats=stats,
+            )
+        )
+
+    if options.parallel:
+        return _walk_parallel(root, options, exclusions, ignored, stats)
+
+    return walk_tree(
+        root,
+        max_depth=options.max_depth,
+        max_files=options.max_files,
+        max_entries=options.max_entries,
+        exclusions=exclusions,
+        ignored=ignored,
+        stats=stats,
+    )
 
-    entries = _iter_tree_deterministic(root, max_depth=_DEFAULT_MAX_DEPTH)
 
-    # Convert to relative POSIX paths and EXCLUDE the root entry "."
-    relative_paths: list[str] = []
-    for p in entries:
-        rp = p.relative_to(root).as_posix()
-        if rp == ".":
-            continue
-        relative_paths.append(rp)
+def _walk_parallel(
+    root: Path,
+    options: ScanOptions,
+    exclusions: ExclusionMatcher,
+    ignored: list[str] | None,
+    stats: ScanRecorder | None,
+) -> Iterator[IntrospectionEntry]:
+    assert options.workers is not None
+    # The pool lives exactly as long as the stream (closed on exhaustion, error
+    # or generator close()).
+    with ParallelDirLister(
+        options.workers, max_depth=options.max_depth, exclusions=exclusions
+    ) as lister:
+        yield from walk_tree(
+            root,
+            max_depth=options.max_depth,
+            max_files=options.max_files,
+            max_entries=options.max_entries,
+            lister=lister,
+            exclusions=exclusions,
+            ignored=ignored,
+            stats=stats,
+        )
+
+
+def introspect_from_context(
+    project: ProjectContext,
+    *,
+    options: ScanOptions | None = None,
+    stats: ScanRecorder | None = None,
+) -> ProjectIntrospection:
+    """
+    Pipeline entrypoint for callers that already hold a validated ProjectContext.
+
+    The context is the proof that the Phase 3 gate ran (only load_project produces
+    it), so the manifest is not read or parsed again here.
+
+    With `stats`, traversal phases and counters are recorded into it.
+    """
+    if stats is not None:
+        listing_before, stat_before = stats.listing_ns, stats.stat_ns
+        start = clock()
+
+    entry_count = 0
+    ignored: list[str] = []
+
+    def visited() -> Iterator[IntrospectionEntry]:
+        nonlocal entry_count
+        stream = iter_entries_from_context(
+            project, options=options, ignored=ignored, stats=stats
+        )
+        for entry in stream:
+            entry_count += 1
+            # EXCLUDE the root entry "." (it still counts towards entry_count).
+            if entry.depth:
+                yield entry
+
+    # Streamed straight into the table: full path strings are never retained.
+    table = PathTable(visited())
+
+    if stats is not None:
+        end = clock()
+        # Whatever traversal time was not spent listing or stat'ing.
+        stats.walk_ns += (
+            end
+            - start
+            - (stats.listing_ns - listing_before)
+            - (stats.stat_ns - stat_before)
+        )
+        stats.entries_visited += entry_count
+        stats.entries_excluded += len(ignored)
+        if stats.tracer is not None:
+            stats.tracer.add("walk", start, end, {"entries": entry_count})
 
     return ProjectIntrospection(
         project=project,
-        entry_count=len(entries),
-        relative_paths=relative_paths,
+        entry_count=entry_count,
+        table=table,
+        ignored_paths=tuple(sorted(ignored)),
     )
@@ -0,0 +1,251 @@
+"""
+Persistent introspection cache (opt-in).
+
+For every directory visited by a scan, `.cairn/introspect-cache.json` records the
+directory's st_mtime_ns / st_ino and its raw sorted child listing. The next scan
+re-lists only directories whose identity changed and replays the cached listing
+for the rest, through the same traversal rules as a cold scan.
+
+Any unreadable, malformed or inconsistent cache is ignored and the scan falls back
+to reading the filesystem.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from cairn_core.projects.stats import ScanRecorder, clock
+from cairn_core.projects.traversal import (
+    INTROSPECT_CACHE_NAME,
+    INTROSPECT_CACHE_TMP_PREFIX,
+    KIND_DIR,
+    KIND_FILE,
+    KIND_OTHER,
+    KIND_SYMLINK,
+    DirLister,
+    ExclusionMatcher,
+    IntrospectionEntry,
+    ProjectIntrospectError,
+    iter_tree_deterministic,
+    scan_dir,
+)
+
+_CACHE_VERSION = 1
+
+_KNOWN_KINDS = {KIND_DIR, KIND_FILE, KIND_OTHER, KIND_SYMLINK}
+
+# A directory can change again within the same mtime tick it was listed in, which
+# its mtime would not reveal. Listings are only trusted for directories whose
+# mtime is older than the previous scan start by at least this window.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class _DirRecord(NamedTuple):
+    mtime_ns: int
+    ino: int
+    listing: list[tuple[str, str]]
+
+
+class CachingDirLister(DirLister):
+    """
+    DirLister that replays cached listings for unchanged directories.
+
+    Each listed directory costs one lstat(); only directories whose mtime/inode
+    differ from the cache (or are too recent to trust) are re-listed. Every
+    listing served is recorded so the cache can be rewritten after the scan.
+    """
+
+    def __init__(
+        self,
+        previous: dict[str, _DirRecord],
+        trusted_before_ns: int,
+        stats: ScanRecorder | None = None,
+    ) -> None:
+        self._previous = previous
+        self._trusted_before_ns = trusted_before_ns
+        self._stats = stats
+        self.records: dict[str, _DirRecord] = {}
+        self.hits = 0
+
+    def _lstat(self, dir_path: str) -> os.stat_result:
+        stats = self._stats
+        if stats is None:
+            return os.lstat(dir_path)
+        start = clock()
+        try:
+            return os.lstat(dir_path)
+        finally:
+            stats.stat_ns += clock() - start
+            stats.stat_calls += 1
+
+    def list_dir(self, dir_path: str, rel: str) -> list[tuple[str, str]]:
+        # Identity is captured BEFORE listing: a change racing with the listing
+        # leaves an older mtime in the record and forces a re-list next time.
+        try:
+            st = self._lstat(dir_path)
+        except OSError as e:
+            raise ProjectIntrospectError(
+                code="introspect_io_error",
+                message=f"Failed to read directory: {dir_path} ({e})",
+            ) from e
+
+        cached = self._previous.get(rel)
+        if (
+            cached is not None
+            and cached.mtime_ns == st.st_mtime_ns
+            and cached.ino == st.st_ino
+            and st.st_mtime_ns < self._trusted_before_ns
+        ):
+            listing = cached.listing
+            self.hits += 1
+        else:
+            listing = scan_dir(dir_path)
+
+        self.records[rel] = _DirRecord(st.st_mtime_ns, st.st_ino, listing)
+        return listing
+
+    def has_child(self, dir_path: str, rel: str) -> bool:
+        return bool(self.list_dir(dir_path, rel))
+
+
+def _cache_path(root: Path) -> Path:
+    return root / ".cairn" / INTROSPECT_CACHE_NAME
+
+
+def _parse_listing(raw: Any) -> list[tuple[str, str]]:
+    if not isinstance(raw, list):
+        raise ValueError("listing must be a list")
+
+    listing: list[tuple[str, str]] = []
+    for item in raw:
+        if not (isinstance(item, list) and len(item) == 2):
+            raise ValueError("listing item must be a [name, kind] pair")
+        name, kind = item
+        if not isinstance(name, str) or not name or "/" in name:
+            raise ValueError("invalid entry name")
+        if kind not in _KNOWN_KINDS:
+            raise ValueError("invalid entry kind")
+        if listing and listing[-1][0] >= name:
+            raise ValueError("listing must be strictly sorted by name")
+        listing.append((name, kind))
+    return listing
+
+
+def _read_cache(path: Path) -> tuple[dict[str, _DirRecord], int]:
+    """
+    Return (records, trusted_before_ns); an empty cache on any problem.
+    """
+    try:
+        data = json.loads(path.read_bytes())
+
+        if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+            raise ValueError("unsupported cache version")
+
+        started_ns = data["scan_started_ns"]
+        dirs = data["dirs"]
+        if not isinstance(started_ns, int) or not isinstance(dirs, dict):
+            raise ValueError("malformed cache header")
+
+        records: dict[str, _DirRecord] = {}
+        for rel, raw in dirs.items():
+            if not (isinstance(raw, list) and len(raw) == 3):
+                raise ValueError("malformed directory record")
+            mtime_ns, ino, listing = raw
+            if not isinstance(mtime_ns, int) or not isinstance(ino, int):
+                raise ValueError("malformed directory identity")
+            records[rel] = _DirRecord(mtime_ns, ino, _parse_listing(listing))
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}, 0
+
+    return records, started_ns - _RACY_WINDOW_NS
+
+
+def _write_cache(path: Path, started_ns: int, records: dict[str, _DirRecord]) -> None:
+    """
+    Atomically replace the cache file. Failures are ignored (the cache is optional).
+    """
+    payload = {
+        "version": _CACHE_VERSION,
+        "scan_started_ns": started_ns,
+        "dirs": {
+            rel: [rec.mtime_ns, rec.ino, [list(item) for item in rec.listing]]
+            for rel, rec in records.items()
+        },
+    }
+    data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+    import tempfile  # deferred: only cached scans write
+
+    tmp_name: str | None = None
+    try:
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=INTROSPECT_CACHE_TMP_PREFIX, suffix=".tmp", dir=path.parent
+        )
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+        tmp_name = None
+    except OSError:
+        pass
+    finally:
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+def iter_tree_cached(
+    root: Path,
+    *,
+    max_depth: int,
+    max_files: int | None = None,
+    max_entries: int | None = None,
+    exclusions: ExclusionMatcher | None = None,
+    ignored: list[str] | None = None,
+    stats: ScanRecorder | None = None,
+) -> list[IntrospectionEntry]:
+    """
+    Cache-assisted equivalent of iter_tree_deterministic().
+
+    Produces the same entries (and ignored paths) a cold scan would, then rewrites
+    the cache. Listings are cached unfiltered, so they stay valid when the
+    exclusion rules change.
+    """
+    started_ns = time.time_ns()
+    path = _cache_path(root)
+
+    def walk(lister: CachingDirLister) -> list[IntrospectionEntry]:
+        if ignored is not None:
+            ignored.clear()
+        return iter_tree_deterministic(
+            root,
+            max_depth=max_depth,
+            max_files=max_files,
+            max_entries=max_entries,
+            lister=lister,
+            exclusions=exclusions,
+            ignored=ignored,
+            stats=stats,
+        )
+
+    previous, trusted_before_ns = _read_cache(path)
+    lister = CachingDirLister(previous, trusted_before_ns, stats)
+
+    try:
+        entries = walk(lister)
+    except ProjectIntrospectError:
+        if lister.hits == 0:
+            raise
+
+        # Only report errors that a cold scan reproduces: rescan without
+        # trusting any cached listing.
+        lister = CachingDirLister({}, 0, stats)
+        entries = walk(lister)
+
+    _write_cache(path, started_ns, lister.records)
+    return entries
@@ -3,8 +3,6 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
-import yaml
-
 from cairn_core.projects.context import ProjectContext
 
 
@@ -33,6 +31,9 @@ def load_project(root: Path) -> ProjectContext:
             message="Project manifest path is not a file",
         )
 
+    # Deferred: only callers that actually parse a manifest pay for yaml.
+    import yaml
+
     try:
         raw = manifest_path.read_text(encoding="utf-8")
         _data = yaml.safe_load(raw)
@@ -67,9 +68,30 @@ def load_project(root: Path) -> ProjectContext:
             message="Invalid manifest field: project_id",
         )
 
+    # Optional field: extra introspection exclusions (entry names or patterns)
+    exclude = _data.get("exclude", [])
+    if not isinstance(exclude, list) or not all(
+        _is_valid_exclusion(item) for item in exclude
+    ):
+        raise ProjectLoadError(
+            code="manifest_invalid_field",
+            message="Invalid manifest field: exclude",
+        )
+
     return ProjectContext(
         root=root,
         manifest_path=manifest_path,
         project_id=_data["project_id"],
         schema_version=_data["schema_version"],
+        extra_exclusions=tuple(sorted(set(exclude))),
+    )
+
+
+def _is_valid_exclusion(item: object) -> bool:
+    # A single path component: exclusions match entry names, not paths.
+    return (
+        isinstance(item, str)
+        and item not in ("", ".", "..")
+        and "/" not in item
+        and "\\" not in item
     )
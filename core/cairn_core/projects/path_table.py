@@ -0,0 +1,202 @@
+"""
+Compact storage for Phase 4 traversal output.
+
+A PathTable stores visited entries (root excluded, traversal order) as rows of
+array-backed columns: parent row, interned name, kind and depth. Full relative
+paths are rebuilt on demand, so deep trees do not hold every directory prefix
+once per descendant.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterable, Iterator, Sequence, TypeVar
+
+from cairn_core.projects.traversal import EntryKind, IntrospectionEntry
+
+# Row codes for the kind column.
+_KINDS: tuple[EntryKind, ...] = ("dir", "file", "other")
+_KIND_CODES = {kind: code for code, kind in enumerate(_KINDS)}
+_DIR_CODE = _KIND_CODES["dir"]
+
+_NO_PARENT = -1
+
+_T = TypeVar("_T")
+
+
+class PathTable:
+    """
+    Immutable, array-backed table of introspection entries.
+
+    Rows must arrive in traversal order (depth-first, parent before children);
+    a row's parent is the nearest preceding directory one level up. Names are
+    interned, so a component repeated across the tree is stored once.
+    """
+
+    __slots__ = ("_parents", "_names", "_kinds", "_depths", "_strings")
+
+    def __init__(self, entries: Iterable[IntrospectionEntry] = ()) -> None:
+        parents = array("i")
+        names = array("i")
+        kinds = array("b")
+        depths = array("i")
+        strings: list[str] = []
+        interned: dict[str, int] = {}
+
+        # open_dirs[d] = row of the most recent directory at depth d + 1.
+        open_dirs: list[int] = []
+
+        for rel, kind, depth in entries:
+            if depth < 1 or depth > len(open_dirs) + 1:
+                raise ValueError(f"Entry out of traversal order: {rel!r}")
+
+            name = rel.rpartition("/")[2]
+            idx = interned.get(name)
+            if idx is None:
+                idx = interned[name] = len(strings)
+                strings.append(name)
+
+            row = len(depths)
+            del open_dirs[depth - 1 :]
+            parents.append(open_dirs[-1] if open_dirs else _NO_PARENT)
+            names.append(idx)
+            kinds.append(_KIND_CODES[kind])
+            depths.append(depth)
+
+            if kind == "dir":
+                open_dirs.append(row)
+
+        self._parents = parents
+        self._names = names
+        self._kinds = kinds
+        self._depths = depths
+        self._strings = tuple(strings)
+
+    def __len__(self) -> int:
+        return len(self._depths)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PathTable):
+            return NotImplemented
+        if (
+            self._parents != other._parents
+            or self._kinds != other._kinds
+            or self._depths != other._depths
+        ):
+            return False
+        if self._strings == other._strings:
+            return self._names == other._names
+        return all(
+            self._strings[a] == other._strings[b]
+            for a, b in zip(self._names, other._names)
+        )
+
+    # Mutable-looking equality (compares equal to equivalent tables): unhashable.
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"PathTable(<{len(self)} entries>)"
+
+    def path(self, row: int) -> str:
+        """
+        Relative POSIX path of one row (walks its parent chain).
+        """
+        parts = []
+        while row != _NO_PARENT:
+            parts.append(self._strings[self._names[row]])
+            row = self._parents[row]
+        return "/".join(reversed(parts))
+
+    def entry(self, row: int) -> IntrospectionEntry:
+        return IntrospectionEntry(
+            self.path(row), _KINDS[self._kinds[row]], self._depths[row]
+        )
+
+    def iter_entries(self) -> Iterator[IntrospectionEntry]:
+        """
+        All rows in order; each path is built from its parent's path in O(1).
+        """
+        strings = self._strings
+        # prefixes[d] = path of the open directory at depth d + 1, plus "/".
+        prefixes: list[str] = []
+
+        for name_idx, kind_code, depth in zip(self._names, self._kinds, self._depths):
+            del prefixes[depth - 1 :]
+            rel = (prefixes[-1] if prefixes else "") + strings[name_idx]
+            if kind_code == _DIR_CODE:
+                prefixes.append(rel + "/")
+            yield IntrospectionEntry(rel, _KINDS[kind_code], depth)
+
+    def iter_paths(self) -> Iterator[str]:
+        for entry in self.iter_entries():
+            yield entry.relative_path
+
+
+class _TableView(Sequence[_T]):
+    """
+    Read-only sequence over a PathTable. Items are rebuilt on access and not
+    retained; the view compares equal to any list or tuple with the same items.
+    """
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table: PathTable) -> None:
+        self._table = table
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def _item(self, row: int) -> _T:
+        raise NotImplementedError
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(len(self)))]
+
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("index out of range")
+        return self._item(index)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is type(self):
+            assert isinstance(other, _TableView)
+            return self._table == other._table
+        if not isinstance(other, (list, tuple, _TableView)):
+            return NotImplemented
+        return len(other) == len(self) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class RelativePathsView(_TableView[str]):
+    """
+    Lazy relative paths, in traversal order.
+    """
+
+    __slots__ = ()
+
+    def _item(self, row: int) -> str:
+        return self._table.path(row)
+
+    def __iter__(self) -> Iterator[str]:
+        return self._table.iter_paths()
+
+
+class EntriesView(_TableView[IntrospectionEntry]):
+    """
+    Lazy typed entries, parallel to RelativePathsView.
+    """
+
+    __slots__ = ()
+
+    def _item(self, row: int) -> IntrospectionEntry:
+        return self._table.entry(row)
+
+    def __iter__(self) -> Iterator[IntrospectionEntry]:
+        return self._table.iter_entries()
@@ -0,0 +1,153 @@
+"""
+Opt-in scan instrumentation.
+
+The *_with_stats entrypoints (introspect_project_with_stats,
+analyze_project_with_stats, analyze_project_report_with_stats) thread a
+ScanRecorder through the pipeline and return a frozen ScanStats next to their
+usual result. Without a recorder (the plain entrypoints) no clock is read and
+no counter is touched: the only cost is a None check per traversal.
+
+Phases are disjoint, timed with a monotonic clock (time.perf_counter_ns):
+
+    manifest_ns       Phase 3 gate: manifest checks and YAML parse
+    listing_ns        directory listings (os.scandir, or cached listings)
+    stat_ns           explicit stat calls made by traversal
+    walk_ns           the rest of traversal: ordering, exclusions, limits and
+                      storing entries
+    aggregation_ns    Phase 5 totals, plus report building where applicable
+    serialization_ns  deterministic JSON encoding (serialize_with_stats)
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, fields, replace
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cairn_core.tracing import Tracer
+
+__all__ = ["ScanRecorder", "ScanStats", "serialize_with_stats"]
+
+# Monotonic, highest available resolution.
+clock = time.perf_counter_ns
+
+
+@dataclass(frozen=True, slots=True)
+class ScanStats:
+    """
+    Timings (nanoseconds) and counters for one scan.
+
+    - dirs_listed: directory listings requested by traversal (including the
+      single-entry probes made at the depth limit)
+    - entries_visited: visited entries, root included (= entry_count)
+    - stat_calls: stat calls issued by traversal; entry types come from the
+      listings, so a plain scan issues one (the root symlink check) and a
+      cached scan adds one per listed directory
+    - entries_excluded: pruned entries (= len(ignored_paths))
+    - bytes_serialized: size of the JSON report, once serialized
+    """
+
+    manifest_ns: int = 0
+    listing_ns: int = 0
+    stat_ns: int = 0
+    walk_ns: int = 0
+    aggregation_ns: int = 0
+    serialization_ns: int = 0
+
+    dirs_listed: int = 0
+    entries_visited: int = 0
+    stat_calls: int = 0
+    entries_excluded: int = 0
+    bytes_serialized: int = 0
+
+    @property
+    def total_ns(self) -> int:
+        return (
+            self.manifest_ns
+            + self.listing_ns
+            + self.stat_ns
+            + self.walk_ns
+            + self.aggregation_ns
+            + self.serialization_ns
+        )
+
+
+_STAT_FIELDS = tuple(f.name for f in fields(ScanStats))
+
+
+class ScanRecorder:
+    """
+    Mutable accumulator behind ScanStats; one per scan, single-threaded.
+
+    Listing time is recorded by the walker's thread only; with parallel
+    workers it is the time the walk waited for listings, not their total cost.
+
+    With a tracer, every timed phase and listing is also recorded as a span.
+    """
+
+    # Counters mirror the ScanStats fields one-to-one (freeze() copies them by
+    # name); keep the two lists in the same order.
+    __slots__ = (
+        "manifest_ns",
+        "listing_ns",
+        "stat_ns",
+        "walk_ns",
+        "aggregation_ns",
+        "serialization_ns",
+        "dirs_listed",
+        "entries_visited",
+        "stat_calls",
+        "entries_excluded",
+        "bytes_serialized",
+        "tracer",
+    )
+
+    manifest_ns: int
+    listing_ns: int
+    stat_ns: int
+    walk_ns: int
+    aggregation_ns: int
+    serialization_ns: int
+
+    dirs_listed: int
+    entries_visited: int
+    stat_calls: int
+    entries_excluded: int
+    bytes_serialized: int
+
+    tracer: Tracer | None
+
+    def __init__(self, tracer: Tracer | None = None) -> None:
+        self.manifest_ns = 0
+        self.listing_ns = 0
+        self.stat_ns = 0
+        self.walk_ns = 0
+        self.aggregation_ns = 0
+        self.serialization_ns = 0
+        self.dirs_listed = 0
+        self.entries_visited = 0
+        self.stat_calls = 0
+        self.entries_excluded = 0
+        self.bytes_serialized = 0
+        self.tracer = tracer
+
+    def freeze(self) -> ScanStats:
+        values: dict[str, Any] = {name: getattr(self, name) for name in _STAT_FIELDS}
+        return ScanStats(**values)
+
+
+def serialize_with_stats(report: Any, stats: ScanStats) -> tuple[bytes, ScanStats]:
+    """
+    to_json_bytes(report), with its time and size added to stats.
+    """
+    from cairn_core.serialization import to_json_bytes
+
+    start = clock()
+    data = to_json_bytes(report)
+    elapsed = clock() - start
+    return data, replace(
+        stats,
+        serialization_ns=stats.serialization_ns + elapsed,
+        bytes_serialized=stats.bytes_serialized + len(data),
+    )
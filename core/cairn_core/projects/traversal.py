@@ -0,0 +1,605 @@
+"""
+Deterministic traversal engine for Phase 4 introspection.
+
+Directory contents come from a DirLister, so alternative listing sources (such as
+the persistent introspection cache or parallel prefetching) reuse the exact same
+ordering, exclusion, depth-limit and symlink-rejection rules as a plain
+filesystem walk.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Final,
+    Iterable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    cast,
+)
+
+from cairn_core.projects.stats import ScanRecorder, clock
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+class ProjectIntrospectError(Exception):
+    """
+    Phase 4 error base class.
+
+    All Phase 4 introspection-specific errors MUST derive from this type and expose a
+    stable string code via .code. Phase 3 load errors must propagate unchanged.
+    """
+
+    code: str
+
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+# Kind of a visited entry. Symlinks never appear: traversal rejects them.
+EntryKind = Literal["dir", "file", "other"]
+
+
+class IntrospectionEntry(NamedTuple):
+    """
+    One visited entry, carried forward with its type so consumers never re-stat.
+
+    - relative_path: POSIX path relative to root ("." for the root itself)
+    - kind: "dir", "file" (regular file) or "other" (fifo, socket, device, ...)
+    - depth: root is depth 0; an entry directly under root is depth 1
+    """
+
+    relative_path: str
+    kind: EntryKind
+    depth: int
+
+
+# Spec v0 exclusion rules: these names are pruned anywhere in the tree.
+SPEC_EXCLUDED_NAMES = frozenset(
+    {
+        ".git",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+    }
+)
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+class ExclusionMatcher:
+    """
+    Precompiled exclusion rules: the spec names plus optional project extras.
+
+    Extras are entry names, or fnmatch-style name patterns (case-sensitive on
+    every platform, for deterministic output). Plain names are a set lookup;
+    all patterns are combined into a single compiled regex.
+    """
+
+    __slots__ = ("names", "patterns", "_match")
+
+    def __init__(self, extra: Iterable[str] = ()) -> None:
+        names = set(SPEC_EXCLUDED_NAMES)
+        patterns = set()
+        for item in extra:
+            if _GLOB_CHARS.isdisjoint(item):
+                names.add(item)
+            else:
+                patterns.add(item)
+
+        self.names = frozenset(names)
+        self.patterns = tuple(sorted(patterns))
+        self._match = (
+            re.compile("|".join(fnmatch.translate(p) for p in self.patterns)).match
+            if self.patterns
+            else None
+        )
+
+    def __call__(self, name: str) -> bool:
+        """
+        True if an entry with this name is excluded (with all its contents).
+        """
+        if name in self.names:
+            return True
+        return self._match is not None and self._match(name) is not None
+
+    def excludes_path(self, rel: str) -> bool:
+        """
+        True if a root-relative POSIX path is, or lies under, an excluded name.
+        """
+        return any(self(part) for part in rel.split("/"))
+
+
+@lru_cache(maxsize=64)
+def exclusion_matcher(extra: tuple[str, ...] = ()) -> ExclusionMatcher:
+    """
+    Shared matcher for a set of project extras (compiled once per process).
+    """
+    return ExclusionMatcher(extra)
+
+
+DEFAULT_EXCLUSIONS = exclusion_matcher()
+
+# Entry kinds resolved once per directory listing (from cached DirEntry data).
+KIND_DIR: Final = "dir"
+KIND_FILE: Final = "file"
+KIND_OTHER: Final = "other"
+KIND_SYMLINK: Final = "symlink"
+
+# Cairn-owned scan artifacts stored directly under .cairn/. They are never part
+# of traversal output, so a warm (cached) scan matches a cold one exactly.
+INTROSPECT_CACHE_NAME = "introspect-cache.json"
+INTROSPECT_CACHE_TMP_PREFIX = ".introspect-cache."
+
+
+def _is_scan_artifact(name: str) -> bool:
+    return name == INTROSPECT_CACHE_NAME or name.startswith(INTROSPECT_CACHE_TMP_PREFIX)
+
+
+def _entry_kind(entry: os.DirEntry[str]) -> str:
+    # DirEntry caches lstat-style type data from the directory listing, so on
+    # most platforms these calls do not issue any extra syscalls.
+    if entry.is_symlink():
+        return KIND_SYMLINK
+    if entry.is_dir(follow_symlinks=False):
+        return KIND_DIR
+    if entry.is_file(follow_symlinks=False):
+        return KIND_FILE
+    return KIND_OTHER
+
+
+def scan_dir(dir_path: str) -> list[tuple[str, str]]:
+    """
+    List a directory once, returning (name, kind) pairs sorted by name.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            listing = [(entry.name, _entry_kind(entry)) for entry in it]
+    except OSError as e:
+        raise ProjectIntrospectError(
+            code="introspect_io_error",
+            message=f"Failed to read directory: {dir_path} ({e})",
+        ) from e
+
+    # Names are unique within a directory, so this is a sort by name only
+    # (filesystem case preserved).
+    listing.sort()
+    return listing
+
+
+def dir_has_child(dir_path: str) -> bool:
+    try:
+        with os.scandir(dir_path) as it:
+            return next(it, None) is not None
+    except OSError as e:
+        raise ProjectIntrospectError(
+            code="introspect_io_error",
+            message=f"Failed to read directory: {dir_path} ({e})",
+        ) from e
+
+
+class DirLister:
+    """
+    Source of directory listings for the walker.
+
+    The default implementation reads the live filesystem. `rel` is the directory's
+    POSIX path relative to the traversal root ("." for the root itself).
+    """
+
+    def list_dir(self, dir_path: str, rel: str) -> list[tuple[str, str]]:
+        return scan_dir(dir_path)
+
+    def has_child(self, dir_path: str, rel: str) -> bool:
+        return dir_has_child(dir_path)
+
+
+class ParallelDirLister(DirLister):
+    """
+    DirLister that lists subdirectories ahead of the walker on a bounded thread pool.
+
+    os.scandir releases the GIL, so on high-latency filesystems several listings can
+    be in flight while the walker consumes them in its usual deterministic order.
+    A prefetched listing's error surfaces only when the walker reaches that
+    directory, so the first error in traversal order wins; close() cancels any
+    outstanding work.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        *,
+        max_depth: int,
+        max_pending: int | None = None,
+        exclusions: ExclusionMatcher = DEFAULT_EXCLUSIONS,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+
+        # Deferred: sequential scans never load concurrent.futures.
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="cairn-scan"
+        )
+        self._max_depth = max_depth
+        self._exclusions = exclusions
+        # Bounds memory held by listings fetched ahead of the walker.
+        self._max_pending = max_pending if max_pending is not None else workers * 4
+        self._pending: dict[str, Future[list[tuple[str, str]]]] = {}
+        self._visited: set[str] = set()
+        # Stack of (dir_path, rel) to prefetch; top is the next directory the
+        # depth-first walk will reach.
+        self._queue: list[tuple[str, str]] = []
+
+    def __enter__(self) -> ParallelDirLister:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._queue.clear()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._pending.clear()
+
+    def _fill(self) -> None:
+        while self._queue and len(self._pending) < self._max_pending:
+            dir_path, rel = self._queue.pop()
+            if rel in self._visited or rel in self._pending:
+                continue
+            self._pending[rel] = self._executor.submit(scan_dir, dir_path)
+
+    def list_dir(self, dir_path: str, rel: str) -> list[tuple[str, str]]:
+        self._visited.add(rel)
+        future = self._pending.pop(rel, None)
+        listing = scan_dir(dir_path) if future is None else future.result()
+
+        depth = 0 if rel == "." else rel.count("/") + 1
+        if depth + 1 <= self._max_depth:
+            prefix = "" if depth == 0 else rel + "/"
+            for name, kind in reversed(listing):
+                if kind == KIND_DIR and not self._exclusions(name):
+                    self._queue.append((os.path.join(dir_path, name), prefix + name))
+
+        self._fill()
+        return listing
+
+    def has_child(self, dir_path: str, rel: str) -> bool:
+        self._visited.add(rel)
+        future = self._pending.pop(rel, None)
+        if future is None:
+            return dir_has_child(dir_path)
+
+        has_child = bool(future.result())
+        self._fill()
+        return has_child
+
+
+class RecordingDirLister(DirLister):
+    """
+    DirLister wrapper that records listing time and count into a ScanRecorder
+    (and a span per listing into its tracer, if any).
+
+    Stat time recorded by the inner lister during a call (see CachingDirLister)
+    is not counted again as listing time.
+    """
+
+    def __init__(self, inner: DirLister, stats: ScanRecorder) -> None:
+        self._inner = inner
+        self._stats = stats
+
+    def list_dir(self, dir_path: str, rel: str) -> list[tuple[str, str]]:
+        stats = self._stats
+        stat_before = stats.stat_ns
+        start = clock()
+        listing = self._inner.list_dir(dir_path, rel)
+        end = clock()
+        stats.listing_ns += end - start - (stats.stat_ns - stat_before)
+        stats.dirs_listed += 1
+        if stats.tracer is not None:
+            stats.tracer.listing(rel, start, end, len(listing))
+        return listing
+
+    def has_child(self, dir_path: str, rel: str) -> bool:
+        stats = self._stats
+        stat_before = stats.stat_ns
+        start = clock()
+        has_child = self._inner.has_child(dir_path, rel)
+        end = clock()
+        stats.listing_ns += end - start - (stats.stat_ns - stat_before)
+        stats.dirs_listed += 1
+        if stats.tracer is not None:
+            stats.tracer.listing(rel, start, end, None)
+        return has_child
+
+
+def is_excluded_path(
+    rel: str, exclusions: ExclusionMatcher = DEFAULT_EXCLUSIONS
+) -> bool:
+    """
+    True if a root-relative POSIX path is never part of traversal output (it is, or
+    lies under, an excluded name, or it is a Cairn scan artifact).
+    """
+    if exclusions.excludes_path(rel):
+        return True
+    parts = rel.split("/")
+    return len(parts) == 2 and parts[0] == ".cairn" and _is_scan_artifact(parts[1])
+
+
+class _WalkState:
+    """
+    Scan limits, exclusions and running counters, shared across one traversal.
+    """
+
+    __slots__ = (
+        "max_depth",
+        "max_files",
+        "max_entries",
+        "exclusions",
+        "ignored",
+        "files",
+        "entries",
+    )
+
+    def __init__(
+        self,
+        max_depth: int,
+        max_files: int | None,
+        max_entries: int | None,
+        exclusions: ExclusionMatcher | None,
+        ignored: list[str] | None,
+    ) -> None:
+        if max_depth < 0:
+            raise ValueError("max_depth must be >= 0")
+        if max_files is not None and max_files < 0:
+            raise ValueError("max_files must be >= 0")
+        if max_entries is not None and max_entries < 0:
+            raise ValueError("max_entries must be >= 0")
+
+        self.max_depth = max_depth
+        self.max_files = sys.maxsize if max_files is None else max_files
+        self.max_entries = sys.maxsize if max_entries is None else max_entries
+        self.exclusions = DEFAULT_EXCLUSIONS if exclusions is None else exclusions
+        self.ignored = ignored
+        self.files = 0
+        self.entries = 0
+
+
+def _walk_dir(
+    lister: DirLister,
+    dir_path: str,
+    rel: str,
+    depth: int,
+    budget: _WalkState,
+) -> Iterator[IntrospectionEntry]:
+    """
+    Yield the entries strictly below one directory, depth-first by name.
+
+    Iterative: one pending listing per open directory, so memory is bounded by
+    fan-out along the current path rather than by tree size.
+    """
+    # Spec: if visiting an entry would exceed MAX_DEPTH, we MUST fail.
+    if depth >= budget.max_depth:
+        if lister.has_child(dir_path, rel):
+            raise ProjectIntrospectError(
+                code="introspection_scan_limit_exceeded",
+                message=f"Traversal depth limit exceeded at: {dir_path}",
+            )
+        return
+
+    # Stack of (listing iterator, dir_path, child prefix, child depth).
+    stack = [
+        (
+            iter(lister.list_dir(dir_path, rel)),
+            dir_path,
+            "" if depth == 0 else rel + "/",
+            depth + 1,
+        )
+    ]
+
+    excluded = budget.exclusions
+    ignored = budget.ignored
+
+    while stack:
+        listing, parent_path, prefix, child_depth = stack[-1]
+        item = next(listing, None)
+        if item is None:
+            stack.pop()
+            continue
+
+        name, kind = item
+
+        # Exclusion: pruned before it is listed (entry + contents); only the
+        # excluded entry itself is recorded.
+        if excluded(name):
+            if ignored is not None:
+                ignored.append(prefix + name)
+            continue
+
+        if child_depth == 2 and prefix == ".cairn/" and _is_scan_artifact(name):
+            continue
+
+        child_path = os.path.join(parent_path, name)
+
+        # Reject symlinks at the entry point.
+        if kind == KIND_SYMLINK:
+            raise ProjectIntrospectError(
+                code="introspect_symlink_detected",
+                message=f"Symlink encountered: {child_path}",
+            )
+
+        # Spec: scan limits fail the moment they are crossed, before any more
+        # of the tree is listed or yielded.
+        budget.entries += 1
+        if budget.entries > budget.max_entries:
+            raise ProjectIntrospectError(
+                code="introspection_scan_limit_exceeded",
+                message=f"Traversal entry limit exceeded at: {child_path}",
+            )
+
+        child_rel = prefix + name
+
+        if kind == KIND_FILE:
+            budget.files += 1
+            if budget.files > budget.max_files:
+                raise ProjectIntrospectError(
+                    code="introspection_scan_limit_exceeded",
+                    message=f"Traversal file limit exceeded at: {child_path}",
+                )
+
+        # Symlinks were rejected above, so kind is an EntryKind here.
+        yield IntrospectionEntry(child_rel, cast(EntryKind, kind), child_depth)
+
+        if kind != KIND_DIR:
+            continue
+
+        if child_depth >= budget.max_depth:
+            if lister.has_child(child_path, child_rel):
+                raise ProjectIntrospectError(
+                    code="introspection_scan_limit_exceeded",
+                    message=f"Traversal depth limit exceeded at: {child_path}",
+                )
+            continue
+
+        stack.append(
+            (
+                iter(lister.list_dir(child_path, child_rel)),
+                child_path,
+                child_rel + "/",
+                child_depth + 1,
+            )
+        )
+
+
+def walk_tree(
+    root: Path,
+    *,
+    max_depth: int,
+    max_files: int | None = None,
+    max_entries: int | None = None,
+    lister: DirLister | None = None,
+    exclusions: ExclusionMatcher | None = None,
+    ignored: list[str] | None = None,
+    stats: ScanRecorder | None = None,
+) -> Iterator[IntrospectionEntry]:
+    """
+    Deterministic directory traversal (foundation for Phase 4), as a stream.
+
+    - Yields the root entry "." first, then every visited entry depth-first,
+      children in stable lexicographic order.
+    - Rejects symlinks immediately (fail-fast).
+    - Enforces max_depth (root is depth 0).
+    - Enforces max_files (regular files) and max_entries (all entries, root
+      included) while walking; None means unlimited.
+    - Prunes excluded names (spec set plus project extras, see ExclusionMatcher)
+      before listing them; when `ignored` is given, each pruned path is
+      appended to it in traversal order.
+    - One directory listing per directory; entry types come from the listing.
+
+    - With `stats`, listings and stat calls are timed and counted into it.
+
+    Errors surface when the walk reaches them, after the entries before them
+    have been yielded.
+    """
+    budget = _WalkState(max_depth, max_files, max_entries, exclusions, ignored)
+
+    if lister is None:
+        lister = DirLister()
+
+    # Exclusions apply to entries below the root, never to the root itself.
+    root_path = os.fspath(root)
+
+    # Fail-fast on symlinks.
+    if stats is None:
+        root_is_link = os.path.islink(root_path)
+    else:
+        lister = RecordingDirLister(lister, stats)
+        start = clock()
+        root_is_link = os.path.islink(root_path)
+        stats.stat_ns += clock() - start
+        stats.stat_calls += 1
+
+    if root_is_link:
+        raise ProjectIntrospectError(
+            code="introspect_symlink_detected",
+            message=f"Symlink encountered: {root_path}",
+        )
+
+    budget.entries += 1
+    if budget.entries > budget.max_entries:
+        raise ProjectIntrospectError(
+            code="introspection_scan_limit_exceeded",
+            message=f"Traversal entry limit exceeded at: {root_path}",
+        )
+
+    yield IntrospectionEntry(".", KIND_DIR, 0)
+    yield from _walk_dir(lister, root_path, ".", 0, budget)
+
+
+def iter_tree_deterministic(
+    root: Path,
+    *,
+    max_depth: int,
+    max_files: int | None = None,
+    max_entries: int | None = None,
+    lister: DirLister | None = None,
+    exclusions: ExclusionMatcher | None = None,
+    ignored: list[str] | None = None,
+    stats: ScanRecorder | None = None,
+) -> list[IntrospectionEntry]:
+    """
+    Materialized walk_tree(): every visited entry, root included, in order.
+    """
+    return list(
+        walk_tree(
+            root,
+            max_depth=max_depth,
+            max_files=max_files,
+            max_entries=max_entries,
+            lister=lister,
+            exclusions=exclusions,
+            ignored=ignored,
+            stats=stats,
+        )
+    )
+
+
+def iter_subtree_deterministic(
+    root: Path,
+    rel: str,
+    *,
+    max_depth: int,
+    max_files: int | None = None,
+    max_entries: int | None = None,
+    lister: DirLister | None = None,
+    exclusions: ExclusionMatcher | None = None,
+    ignored: list[str] | None = None,
+) -> list[IntrospectionEntry]:
+    """
+    Entries strictly below the directory at `rel`, exactly as a full traversal
+    would produce them (same order, depths and exclusions).
+
+    max_files / max_entries bound this subtree only; callers combining it with
+    other entries must check whole-tree totals themselves.
+    """
+    budget = _WalkState(max_depth, max_files, max_entries, exclusions, ignored)
+
+    if lister is None:
+        lister = DirLister()
+
+    depth = len(rel.split("/"))
+    dir_path = os.path.join(root, *rel.split("/"))
+    return list(_walk_dir(lister, dir_path, rel, depth, budget))
@@ -1,15 +1,32 @@
-from .schema import (
-    CairnReport,
-    ReportMeta,
-    PolicyPin,
-    AnalysisSnapshot,
-    Finding,
-    Evidence,
-    RemediationLink,
-    StandardsLink,
-)
-from .errors import ReportError
-from .emit import render_report_text, write_report_json, write_report_text
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cairn_core._lazy import lazy_exports
+
+# Public name -> defining submodule, imported on first use.
+_EXPORTS = {
+    "CairnReport": "schema",
+    "ReportMeta": "schema",
+    "PolicyPin": "schema",
+    "AnalysisSnapshot": "schema",
+    "Finding": "schema",
+    "Evidence": "schema",
+    "RemediationLink": "schema",
+    "StandardsLink": "schema",
+    "ReportError": "errors",
+    "decode_report_binary": "binary",
+    "encode_report_binary": "binary",
+    "report_content_hash": "binary",
+    "load_report_json": "load",
+    "parse_report_json": "load",
+    "render_report_text": "emit",
+    "stream_report_text": "emit",
+    "write_report_binary": "emit",
+    "write_report_bytes": "emit",
+    "write_report_json": "emit",
+    "write_report_text": "emit",
+}
 
 __all__ = [
     "CairnReport",
@@ -21,7 +38,47 @@ __all__ = [
     "RemediationLink",
     "StandardsLink",
     "ReportError",
+    "decode_report_binary",
+    "encode_report_binary",
+    "report_content_hash",
+    "load_report_json",
+    "parse_report_json",
     "render_report_text",
+    "stream_report_text",
+    "write_report_binary",
+    "write_report_bytes",
     "write_report_json",
     "write_report_text",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .binary import (
+        decode_report_binary,
+        encode_report_binary,
+        report_content_hash,
+    )
+    from .emit import (
+        render_report_text,
+        stream_report_text,
+        write_report_binary,
+        write_report_bytes,
+        write_report_json,
+        write_report_text,
+    )
+    from .errors import ReportError
+    from .load import (
+        load_report_json,
+        parse_report_json,
+    )
+    from .schema import (
+        AnalysisSnapshot,
+        CairnReport,
+        Evidence,
+        Finding,
+        PolicyPin,
+        RemediationLink,
+        ReportMeta,
+        StandardsLink,
+    )
@@ -0,0 +1,574 @@
+"""
+Canonical binary encoding of CairnReport (optional, alongside JSON).
+
+Layout (integers are unsigned LEB128 varints unless noted):
+
+    magic      8 bytes  b"CAIRNRPT"
+    version    varint   format version (1)
+    strings    packed array of per-string lengths (in code points), then
+               varint byte length + the UTF-8 of all strings concatenated
+    sections   meta, policy, project_ref, analysis, findings; each one is a
+               length-prefixed record (varint byte length + payload)
+    hash       32 bytes SHA-256 over every preceding byte
+
+A packed array is a typecode byte (B/H/I/Q: the narrowest that fits the
+largest value), a varint item count and the little-endian items, so bulk data
+decodes at C speed through the array module.
+
+Every string is stored once in the table and referenced by index. Paths in
+AnalysisSnapshot.files/dirs are split on "/" and stored as two packed arrays
+(component counts, component indices), so shared directory prefixes cost one
+index per level. Dicts are written with sorted keys, so equal reports always
+produce identical bytes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+import sys
+from array import array
+from itertools import accumulate
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from cairn_core.reporting.errors import ReportError
+from cairn_core.reporting.schema import (
+    AnalysisSnapshot,
+    CairnReport,
+    Evidence,
+    Finding,
+    PolicyPin,
+    RemediationLink,
+    ReportMeta,
+    ReportSchemaVersion,
+    Severity,
+    StandardsLink,
+)
+
+__all__ = [
+    "BINARY_FORMAT_VERSION",
+    "decode_report_binary",
+    "encode_report_binary",
+    "report_content_hash",
+]
+
+_MAGIC = b"CAIRNRPT"
+BINARY_FORMAT_VERSION = 1
+
+_HASH_SIZE = 32
+
+# Evidence value tags.
+_T_NONE = 0
+_T_FALSE = 1
+_T_TRUE = 2
+_T_INT = 3
+_T_FLOAT = 4
+_T_STR = 5
+_T_LIST = 6
+_T_TUPLE = 7
+_T_DICT = 8
+
+_DOUBLE = struct.Struct(">d")
+
+_T = TypeVar("_T")
+
+# Packed array typecodes, narrowest first (sizes 1, 2, 4, 8 on every CPython).
+_ARRAY_CODES = "BHIQ"
+_SWAP = sys.byteorder == "big"
+
+
+class _Writer:
+    """
+    Section encoder sharing one string table across the whole report.
+    """
+
+    __slots__ = ("buf", "_strings", "_index")
+
+    def __init__(self, strings: List[str], index: Dict[str, int]) -> None:
+        self.buf = bytearray()
+        self._strings = strings
+        self._index = index
+
+    def uint(self, value: int) -> None:
+        if value < 0:
+            raise ReportError(
+                "report_binary_invalid_value",
+                f"Expected a non-negative integer, got {value}",
+            )
+        buf = self.buf
+        while value > 0x7F:
+            buf.append((value & 0x7F) | 0x80)
+            value >>= 7
+        buf.append(value)
+
+    def sint(self, value: int) -> None:
+        # Zigzag: small magnitudes of either sign stay short.
+        self.uint(value * 2 if value >= 0 else -value * 2 - 1)
+
+    def flag(self, value: bool) -> None:
+        self.buf.append(1 if value else 0)
+
+    def text(self, value: str) -> None:
+        idx = self._index.get(value)
+        if idx is None:
+            idx = self._index[value] = len(self._strings)
+            self._strings.append(value)
+        self.uint(idx)
+
+    def opt_text(self, value: Optional[str]) -> None:
+        self.flag(value is not None)
+        if value is not None:
+            self.text(value)
+
+    def ints(self, values: List[int]) -> None:
+        top = max(values, default=0)
+        for code in _ARRAY_CODES:
+            packed = array(code)
+            if top < 1 << (8 * packed.itemsize):
+                break
+        packed.extend(values)
+        if _SWAP:
+            packed.byteswap()
+        self.buf.append(ord(code))
+        self.uint(len(packed))
+        self.buf += packed.tobytes()
+
+    def paths(self, values: Tuple[str, ...]) -> None:
+        strings = self._strings
+        index = self._index
+        counts: List[int] = []
+        flat: List[int] = []
+
+        for value in values:
+            parts = value.split("/")
+            counts.append(len(parts))
+            for part in parts:
+                idx = index.get(part)
+                if idx is None:
+                    idx = index[part] = len(strings)
+                    strings.append(part)
+                flat.append(idx)
+
+        self.ints(counts)
+        self.ints(flat)
+
+    def value(self, value: Any) -> None:
+        # Exact types only: anything else could not be restored as written.
+        t = type(value)
+        if value is None:
+            self.buf.append(_T_NONE)
+        elif value is False:
+            self.buf.append(_T_FALSE)
+        elif value is True:
+            self.buf.append(_T_TRUE)
+        elif t is int:
+            self.buf.append(_T_INT)
+            self.sint(value)
+        elif t is float:
+            self.buf.append(_T_FLOAT)
+            self.buf += _DOUBLE.pack(value)
+        elif t is str:
+            self.buf.append(_T_STR)
+            self.text(value)
+        elif t is list or t is tuple:
+            self.buf.append(_T_LIST if t is list else _T_TUPLE)
+            self.uint(len(value))
+            for item in value:
+                self.value(item)
+        elif t is dict:
+            self.buf.append(_T_DICT)
+            self.str_dict(value, self.value)
+        else:
+            raise ReportError(
+                "report_binary_unsupported_type",
+                f"Object of type {t!r} cannot be encoded",
+            )
+
+    def str_dict(self, value: Mapping[str, Any], put: Callable[[Any], None]) -> None:
+        for key in value:
+            if type(key) is not str:
+                raise ReportError(
+                    "report_binary_unsupported_type",
+                    f"Dict keys must be strings; got key type {type(key)!r}",
+                )
+        self.uint(len(value))
+        for key in sorted(value):
+            self.text(key)
+            put(value[key])
+
+
+class _Reader:
+    __slots__ = ("data", "pos", "end", "strings")
+
+    def __init__(
+        self, data: memoryview, pos: int, end: int, strings: List[str]
+    ) -> None:
+        self.data = data
+        self.pos = pos
+        self.end = end
+        self.strings = strings
+
+    def _truncated(self) -> ReportError:
+        return ReportError("report_binary_invalid", "Truncated binary report")
+
+    def byte(self) -> int:
+        if self.pos >= self.end:
+            raise self._truncated()
+        b = self.data[self.pos]
+        self.pos += 1
+        return b
+
+    def take(self, n: int) -> memoryview:
+        if self.end - self.pos < n:
+            raise self._truncated()
+        chunk = self.data[self.pos : self.pos + n]
+        self.pos += n
+        return chunk
+
+    def uint(self) -> int:
+        data, pos, end = self.data, self.pos, self.end
+        result = 0
+        shift = 0
+        while True:
+            if pos >= end:
+                raise self._truncated()
+            b = data[pos]
+            pos += 1
+            result |= (b & 0x7F) << shift
+            if b < 0x80:
+                self.pos = pos
+                return result
+            shift += 7
+
+    def sint(self) -> int:
+        z = self.uint()
+        return z >> 1 if not z & 1 else -((z + 1) >> 1)
+
+    def flag(self) -> bool:
+        b = self.byte()
+        if b > 1:
+            raise ReportError("report_binary_invalid", f"Invalid flag byte: {b}")
+        return b == 1
+
+    def text(self) -> str:
+        idx = self.uint()
+        if idx >= len(self.strings):
+            raise ReportError("report_binary_invalid", f"Bad string index: {idx}")
+        return self.strings[idx]
+
+    def opt_text(self) -> Optional[str]:
+        return self.text() if self.flag() else None
+
+    def ints(self) -> array[int]:
+        code = chr(self.byte())
+        if code not in _ARRAY_CODES:
+            raise ReportError("report_binary_invalid", f"Bad array typecode: {code!r}")
+        packed = array(code)
+        packed.frombytes(self.take(self.uint() * packed.itemsize))
+        if _SWAP:
+            packed.byteswap()
+        return packed
+
+    def paths(self) -> Tuple[str, ...]:
+        counts = self.ints()
+        flat = self.ints()
+        if sum(counts) != len(flat):
+            raise ReportError("report_binary_invalid", "Path table size mismatch")
+
+        strings = self.strings
+        try:
+            parts = [strings[i] for i in flat]
+        except IndexError:
+            raise ReportError("report_binary_invalid", "Bad string index") from None
+
+        out = []
+        pos = 0
+        for count in counts:
+            end = pos + count
+            out.append("/".join(parts[pos:end]))
+            pos = end
+        return tuple(out)
+
+    def value(self) -> Any:
+        tag = self.byte()
+        if tag == _T_NONE:
+            return None
+        if tag == _T_FALSE:
+            return False
+        if tag == _T_TRUE:
+            return True
+        if tag == _T_INT:
+            return self.sint()
+        if tag == _T_FLOAT:
+            return _DOUBLE.unpack(self.take(_DOUBLE.size))[0]
+        if tag == _T_STR:
+            return self.text()
+        if tag == _T_LIST:
+            return [self.value() for _ in range(self.uint())]
+        if tag == _T_TUPLE:
+            return tuple(self.value() for _ in range(self.uint()))
+        if tag == _T_DICT:
+            return self.str_dict(self.value)
+        raise ReportError("report_binary_invalid", f"Unknown value tag: {tag}")
+
+    def str_dict(self, get: Callable[[], Any]) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for _ in range(self.uint()):
+            key = self.text()
+            out[key] = get()
+        return out
+
+    def done(self) -> None:
+        if self.pos != self.end:
+            raise ReportError("report_binary_invalid", "Trailing bytes in record")
+
+
+# ---- sections ----
+
+
+def _put_meta(w: _Writer, meta: ReportMeta) -> None:
+    w.text(meta.report_schema_version)
+    w.opt_text(meta.generated_at)
+    w.opt_text(meta.tool_version)
+
+
+def _get_meta(r: _Reader) -> ReportMeta:
+    return ReportMeta(
+        report_schema_version=cast(ReportSchemaVersion, r.text()),
+        generated_at=r.opt_text(),
+        tool_version=r.opt_text(),
+    )
+
+
+def _put_policy(w: _Writer, policy: PolicyPin) -> None:
+    w.text(policy.policy_pack_id)
+    w.text(policy.version)
+    w.text(policy.schema_version)
+    w.text(policy.content_hash_alg)
+    w.opt_text(policy.content_hash)
+
+
+def _get_policy(r: _Reader) -> PolicyPin:
+    return PolicyPin(
+        policy_pack_id=r.text(),
+        version=r.text(),
+        schema_version=r.text(),
+        content_hash_alg=cast(Literal["sha256"], r.text()),
+        content_hash=r.opt_text(),
+    )
+
+
+def _put_project_ref(w: _Writer, project_ref: str) -> None:
+    w.text(project_ref)
+
+
+def _get_project_ref(r: _Reader) -> str:
+    return r.text()
+
+
+def _put_analysis(w: _Writer, a: AnalysisSnapshot) -> None:
+    w.sint(a.entry_count)
+    w.sint(a.dir_count)
+    w.sint(a.max_depth)
+    w.paths(a.files)
+    w.paths(a.dirs)
+    w.str_dict(a.ext_counts, w.sint)
+    w.flag(a.has_readme)
+    w.flag(a.has_pyproject)
+    w.flag(a.has_requirements)
+    w.flag(a.cairn_aware)
+
+
+def _get_analysis(r: _Reader) -> AnalysisSnapshot:
+    return AnalysisSnapshot(
+        entry_count=r.sint(),
+        dir_count=r.sint(),
+        max_depth=r.sint(),
+        files=r.paths(),
+        dirs=r.paths(),
+        ext_counts=r.str_dict(r.sint),
+        has_readme=r.flag(),
+        has_pyproject=r.flag(),
+        has_requirements=r.flag(),
+        cairn_aware=r.flag(),
+    )
+
+
+def _put_findings(w: _Writer, findings: Tuple[Finding, ...]) -> None:
+    w.uint(len(findings))
+    for f in findings:
+        w.text(f.rule_id)
+        w.text(f.severity)
+        w.text(f.title)
+        w.str_dict(f.evidence.items, w.value)
+        w.uint(len(f.remediation))
+        for link in f.remediation:
+            w.text(link.project_id)
+            w.flag(link.safe_by_default)
+            w.flag(link.dry_run_supported)
+        w.uint(len(f.standards))
+        for std in f.standards:
+            w.text(std.scheme)
+            w.text(std.ref)
+            w.opt_text(std.url)
+        w.text(f.rationale)
+
+
+def _get_findings(r: _Reader) -> Tuple[Finding, ...]:
+    out = []
+    for _ in range(r.uint()):
+        rule_id = r.text()
+        severity = r.text()
+        title = r.text()
+        evidence = Evidence(r.str_dict(r.value))
+        remediation = tuple(
+            RemediationLink(
+                project_id=r.text(),
+                safe_by_default=r.flag(),
+                dry_run_supported=r.flag(),
+            )
+            for _ in range(r.uint())
+        )
+        standards = tuple(
+            StandardsLink(scheme=r.text(), ref=r.text(), url=r.opt_text())
+            for _ in range(r.uint())
+        )
+        out.append(
+            Finding(
+                rule_id=rule_id,
+                severity=cast(Severity, severity),
+                title=title,
+                evidence=evidence,
+                remediation=remediation,
+                standards=standards,
+                rationale=r.text(),
+            )
+        )
+    return tuple(out)
+
+
+# ---- public API ----
+
+
+def encode_report_binary(report: CairnReport) -> bytes:
+    """
+    Canonical binary bytes for a report (deterministic; ends with its SHA-256).
+
+    Raises ReportError('report_binary_unsupported_type') for evidence values
+    other than None/bool/int/float/str/list/tuple/dict-with-str-keys, and
+    ReportError('report_binary_invalid_value') for negative counts.
+    """
+    strings: List[str] = []
+    index: Dict[str, int] = {}
+
+    def section(put: Callable[[_Writer], None]) -> bytearray:
+        w = _Writer(strings, index)
+        put(w)
+        return w.buf
+
+    sections = [
+        section(lambda w: _put_meta(w, report.meta)),
+        section(lambda w: _put_policy(w, report.policy)),
+        section(lambda w: _put_project_ref(w, report.project_ref)),
+        section(lambda w: _put_analysis(w, report.analysis)),
+        section(lambda w: _put_findings(w, report.findings)),
+    ]
+
+    try:
+        blob = "".join(strings).encode("utf-8")
+    except UnicodeEncodeError as e:
+        raise ReportError(
+            "report_binary_invalid_value", f"String is not valid Unicode: {e}"
+        ) from e
+
+    head = _Writer([], {})
+    head.buf += _MAGIC
+    head.uint(BINARY_FORMAT_VERSION)
+    head.ints([len(s) for s in strings])
+    head.uint(len(blob))
+    head.buf += blob
+    for body in sections:
+        head.uint(len(body))
+        head.buf += body
+
+    head.buf += hashlib.sha256(head.buf).digest()
+    return bytes(head.buf)
+
+
+def report_content_hash(report: CairnReport) -> str:
+    """
+    Hex SHA-256 over the report's canonical binary bytes (the stored trailer).
+
+    Equal reports always hash equal, independent of dict insertion order.
+    """
+    return encode_report_binary(report)[-_HASH_SIZE:].hex()
+
+
+def decode_report_binary(data: bytes) -> CairnReport:
+    """
+    Load a report written by encode_report_binary(), verifying its hash.
+
+    Raises ReportError with code:
+    - 'report_binary_invalid' (bad magic, truncated or malformed data)
+    - 'report_binary_version_unsupported'
+    - 'report_binary_hash_mismatch'
+    """
+    view = memoryview(data)
+    if len(view) < len(_MAGIC) + _HASH_SIZE or bytes(view[: len(_MAGIC)]) != _MAGIC:
+        raise ReportError("report_binary_invalid", "Not a Cairn binary report")
+
+    body_end = len(view) - _HASH_SIZE
+    if hashlib.sha256(view[:body_end]).digest() != bytes(view[body_end:]):
+        raise ReportError(
+            "report_binary_hash_mismatch", "Binary report content hash mismatch"
+        )
+
+    r = _Reader(view, len(_MAGIC), body_end, [])
+    version = r.uint()
+    if version != BINARY_FORMAT_VERSION:
+        raise ReportError(
+            "report_binary_version_unsupported",
+            f"Unsupported binary report version: {version}",
+        )
+
+    lengths = r.ints()
+    try:
+        blob = str(r.take(r.uint()), "utf-8")
+    except UnicodeDecodeError as e:
+        raise ReportError("report_binary_invalid", f"Invalid UTF-8: {e}") from e
+    if sum(lengths) != len(blob):
+        raise ReportError("report_binary_invalid", "String table size mismatch")
+
+    offsets = [0, *accumulate(lengths)]
+    strings = [blob[a:b] for a, b in zip(offsets, offsets[1:])]
+
+    def record(get: Callable[[_Reader], _T]) -> _T:
+        length = r.uint()
+        sub = _Reader(view, r.pos, r.pos + length, strings)
+        if sub.end > body_end:
+            raise sub._truncated()
+        value = get(sub)
+        sub.done()
+        r.pos = sub.end
+        return value
+
+    report = CairnReport(
+        meta=record(_get_meta),
+        policy=record(_get_policy),
+        project_ref=record(_get_project_ref),
+        analysis=record(_get_analysis),
+        findings=record(_get_findings),
+    )
+    r.done()
+    return report
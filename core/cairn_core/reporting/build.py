@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from pathlib import Path
-
 from cairn_core.projects.analysis import ProjectAnalysis
 from cairn_core.reporting.schema import (
     AnalysisSnapshot,
@@ -39,10 +37,15 @@ def build_report_from_analysis(analysis: ProjectAnalysis) -> CairnReport:
 
     intro = analysis.introspection
 
-    rels = tuple(intro.relative_paths)
+    # One pass over the analysis' own sequence (no intermediate copy); the last
+    # POSIX segment is the entry name, as Path(p).name would give.
+    file_list: list[str] = []
+    dir_list: list[str] = []
+    for p in intro.relative_paths:
+        (file_list if "." in p.rpartition("/")[2] else dir_list).append(p)
 
-    files = tuple(p for p in rels if "." in Path(p).name)
-    dirs = tuple(p for p in rels if "." not in Path(p).name)
+    files = tuple(file_list)
+    dirs = tuple(dir_list)
 
     snapshot = AnalysisSnapshot(
         entry_count=analysis.entry_count,
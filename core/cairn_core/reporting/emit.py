@@ -1,13 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+import io
+import os
+import stat
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import (
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
 
+from cairn_core.reporting.binary import encode_report_binary
 from cairn_core.reporting.schema import CairnReport, Finding
-from cairn_core.serialization import to_json_bytes
+from cairn_core.serialization import write_json
+from cairn_core.tracing import Tracer
 
 
+# Entries per page in the optional FILES / DIRS listing.
+DEFAULT_PAGE_SIZE = 1000
+
 # Deterministic severity ordering (lowest -> highest)
 _SEV_ORDER = {
     "info": 0,
@@ -28,116 +44,277 @@ def _sort_findings(findings: Tuple[Finding, ...]) -> Tuple[Finding, ...]:
     )
 
 
-def render_report_text(report: CairnReport) -> str:
-    """
-    Deterministic, non-improvisational, human-readable rendering.
-
-    Rules:
-    - fixed section order
-    - stable sorting
-    - no free-form advice, no creative language
-    """
+def _report_lines(
+    report: CairnReport, paths: Optional[Tuple[int, Optional[int]]] = None
+) -> Iterator[str]:
+    # Lines of the text rendering, produced lazily in section order. `paths` is
+    # (page_size, page) to append the FILES/DIRS listing.
     findings = _sort_findings(report.findings)
 
-    lines: list[str] = []
-
     # Header
-    lines.append("CAIRN REPORT")
-    lines.append(f"schema_version: {report.meta.report_schema_version}")
-    lines.append(f"generated_at: {report.meta.generated_at or ''}")
-    lines.append(f"tool_version: {report.meta.tool_version or ''}")
-    lines.append("")
+    yield "CAIRN REPORT"
+    yield f"schema_version: {report.meta.report_schema_version}"
+    yield f"generated_at: {report.meta.generated_at or ''}"
+    yield f"tool_version: {report.meta.tool_version or ''}"
+    yield ""
 
     # Policy pin
-    lines.append("POLICY")
-    lines.append(f"policy_pack_id: {report.policy.policy_pack_id}")
-    lines.append(f"version: {report.policy.version}")
-    lines.append(f"schema_version: {report.policy.schema_version}")
-    lines.append(f"content_hash_alg: {report.policy.content_hash_alg}")
-    lines.append(f"content_hash: {report.policy.content_hash or ''}")
-    lines.append("")
+    yield "POLICY"
+    yield f"policy_pack_id: {report.policy.policy_pack_id}"
+    yield f"version: {report.policy.version}"
+    yield f"schema_version: {report.policy.schema_version}"
+    yield f"content_hash_alg: {report.policy.content_hash_alg}"
+    yield f"content_hash: {report.policy.content_hash or ''}"
+    yield ""
 
     # Project ref
-    lines.append("PROJECT")
-    lines.append(f"project_ref: {report.project_ref}")
-    lines.append("")
+    yield "PROJECT"
+    yield f"project_ref: {report.project_ref}"
+    yield ""
 
     # Analysis snapshot
     a = report.analysis
-    lines.append("ANALYSIS")
-    lines.append(f"entry_count: {a.entry_count}")
-    lines.append(f"dir_count: {a.dir_count}")
-    lines.append(f"max_depth: {a.max_depth}")
-    lines.append(f"has_readme: {a.has_readme}")
-    lines.append(f"has_pyproject: {a.has_pyproject}")
-    lines.append(f"has_requirements: {a.has_requirements}")
-    lines.append(f"cairn_aware: {a.cairn_aware}")
+    yield "ANALYSIS"
+    yield f"entry_count: {a.entry_count}"
+    yield f"dir_count: {a.dir_count}"
+    yield f"max_depth: {a.max_depth}"
+    yield f"has_readme: {a.has_readme}"
+    yield f"has_pyproject: {a.has_pyproject}"
+    yield f"has_requirements: {a.has_requirements}"
+    yield f"cairn_aware: {a.cairn_aware}"
 
     # ext_counts: stable ordering by extension
-    lines.append("ext_counts:")
+    yield "ext_counts:"
     for ext in sorted(a.ext_counts.keys()):
-        lines.append(f"  {ext}: {a.ext_counts[ext]}")
-    lines.append("")
+        yield f"  {ext}: {a.ext_counts[ext]}"
+    yield ""
 
     # Findings
-    lines.append("FINDINGS")
-    lines.append(f"count: {len(findings)}")
-    lines.append("")
+    yield "FINDINGS"
+    yield f"count: {len(findings)}"
+    yield ""
 
     if not findings:
-        lines.append("(none)")
-        lines.append("")
-        return "\n".join(lines)
+        yield "(none)"
+        yield ""
 
     for idx, f in enumerate(findings, start=1):
-        lines.append(f"[{idx}] rule_id: {f.rule_id}")
-        lines.append(f"    severity: {f.severity}")
-        lines.append(f"    title: {f.title}")
-        lines.append(f"    rationale: {f.rationale}")
+        yield f"[{idx}] rule_id: {f.rule_id}"
+        yield f"    severity: {f.severity}"
+        yield f"    title: {f.title}"
+        yield f"    rationale: {f.rationale}"
 
         # evidence: stable ordering by key
         ev = f.evidence.items
-        lines.append("    evidence:")
+        yield "    evidence:"
         for k in sorted(ev.keys()):
-            lines.append(f"      {k}: {ev[k]}")
+            yield f"      {k}: {ev[k]}"
 
         # remediation: stable ordering by project_id
-        lines.append("    remediation:")
+        yield "    remediation:"
         if f.remediation:
             for r in sorted(f.remediation, key=lambda x: x.project_id):
-                lines.append(
-                    f"      - project_id: {r.project_id} | safe_by_default: {r.safe_by_default} | dry_run_supported: {r.dry_run_supported}"
+                yield (
+                    f"      - project_id: {r.project_id}"
+                    f" | safe_by_default: {r.safe_by_default}"
+                    f" | dry_run_supported: {r.dry_run_supported}"
                 )
         else:
-            lines.append("      (none)")
+            yield "      (none)"
 
         # standards: stable ordering by (scheme, ref)
-        lines.append("    standards:")
+        yield "    standards:"
         if f.standards:
             for s in sorted(f.standards, key=lambda x: (x.scheme, x.ref)):
-                lines.append(f"      - {s.scheme}: {s.ref}" + (f" | {s.url}" if s.url else ""))
+                yield f"      - {s.scheme}: {s.ref}" + (f" | {s.url}" if s.url else "")
         else:
-            lines.append("      (none)")
+            yield "      (none)"
+
+        yield ""
+
+    if paths is not None:
+        page_size, page = paths
+        yield from _path_lines("FILES", a.files, page_size, page)
+        yield from _path_lines("DIRS", a.dirs, page_size, page)
+
+
+def _path_lines(
+    title: str, paths: Sequence[str], page_size: int, page: Optional[int]
+) -> Iterator[str]:
+    # Paths keep the report's traversal order (depth-first, name-sorted).
+    pages = max(1, -(-len(paths) // page_size))
+    yield title
+    yield f"count: {len(paths)}"
+    yield ""
+    if not paths:
+        yield "(none)"
+        yield ""
+        return
+
+    if page is None:
+        numbers: Iterable[int] = range(1, pages + 1)
+    else:
+        # FILES and DIRS page separately; a section may end before `page`.
+        numbers = (page,) if page <= pages else ()
+    for number in numbers:
+        yield f"page: {number}/{pages}"
+        start = (number - 1) * page_size
+        for i in range(start, min(start + page_size, len(paths))):
+            yield f"  {paths[i]}"
+        yield ""
+
+
+def _write_lines(lines: Iterable[str], out: TextIO) -> str:
+    # Writes "\n".join(lines) without building it; returns the last line.
+    last = None
+    for line in lines:
+        if last is not None:
+            out.write("\n")
+        out.write(line)
+        last = line
+    return "" if last is None else last
+
+
+def render_report_text(report: CairnReport) -> str:
+    """
+    Deterministic, non-improvisational, human-readable rendering.
+
+    Rules:
+    - fixed section order
+    - stable sorting
+    - no free-form advice, no creative language
+    """
+    return "\n".join(_report_lines(report))
+
+
+def stream_report_text(
+    report: CairnReport,
+    out: TextIO,
+    *,
+    include_paths: bool = False,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    page: Optional[int] = None,
+) -> None:
+    """
+    Write render_report_text(report) to a text stream, line by line.
+
+    Sections are written in order as they are formatted, so a reader of the
+    stream sees the header before findings are rendered, and memory stays
+    constant in the report's size.
+
+    With include_paths, FILES and DIRS sections follow the findings, listing
+    analysis.files / analysis.dirs in pages of page_size entries: every page,
+    or only `page` (1-based) if given; a section with fewer pages then shows
+    only its header and count.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be >= 1")
+    if page is not None and page < 1:
+        raise ValueError("page must be >= 1")
+    paths = (page_size, page) if include_paths else None
+    _write_lines(_report_lines(report, paths), out)
+
+
+# Temporary files are created like open() creates files (0o666 less the umask,
+# applied by the OS), and exclusively, so a leftover file is never reused.
+_TMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+_TMP_ATTEMPTS = 100
+
+
+def _open_temp(p: Path) -> Tuple[int, str]:
+    for _ in range(_TMP_ATTEMPTS):
+        name = os.path.join(p.parent, f".{p.name}.{os.urandom(6).hex()}.tmp")
+        try:
+            return os.open(name, _TMP_FLAGS, 0o666), name
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No free temporary name next to {p}")
+
+
+def _write_atomic(p: Path, write: Callable[[BinaryIO], object]) -> None:
+    """
+    Write via a temporary file in the same directory, fsync, then rename over
+    `p`: readers see either the previous file or the complete new one.
+
+    A replaced report keeps its permissions; a new one gets open()'s default.
+    """
+    fd, tmp_name = _open_temp(p)
+    try:
+        if hasattr(os, "fchmod"):  # POSIX only
+            try:
+                os.fchmod(fd, stat.S_IMODE(os.stat(p).st_mode))
+            except FileNotFoundError:
+                pass
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, p)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
 
-        lines.append("")
 
-    return "\n".join(lines)
+def _emit(
+    name: str,
+    path: str | Path,
+    write: Callable[[BinaryIO], object],
+    tracer: Optional[Tracer],
+) -> None:
+    if tracer is None:
+        _write_atomic(Path(path), write)
+        return
+    with tracer.span(name, path=os.fspath(path)):
+        _write_atomic(Path(path), write)
 
 
-def write_report_json(report: CairnReport, path: str | Path) -> None:
+def write_report_json(
+    report: CairnReport, path: str | Path, *, tracer: Optional[Tracer] = None
+) -> None:
     """
     Deterministic JSON emission (single-authority serializer).
+
+    Streams exactly to_json_bytes(report) with bounded buffering, atomically.
+    """
+    _emit("emit_json", path, lambda f: write_json(report, f), tracer)
+
+
+def write_report_binary(
+    report: CairnReport, path: str | Path, *, tracer: Optional[Tracer] = None
+) -> None:
+    """
+    Canonical binary emission (see reporting.binary), written atomically.
     """
-    p = Path(path)
-    p.write_bytes(to_json_bytes(report))
+    _emit("emit_binary", path, lambda f: f.write(encode_report_binary(report)), tracer)
 
 
-def write_report_text(report: CairnReport, path: str | Path) -> None:
+def write_report_bytes(
+    data: bytes, path: str | Path, *, tracer: Optional[Tracer] = None
+) -> None:
     """
-    Deterministic text emission (UTF-8, newline normalized).
+    Write an already serialized report (e.g. to_json_bytes output) atomically.
     """
-    p = Path(path)
-    text = render_report_text(report)
-    if not text.endswith("\n"):
-        text += "\n"
-    p.write_text(text, encoding="utf-8", newline="\n")
+    _emit("emit_bytes", path, lambda f: f.write(data), tracer)
+
+
+def write_report_text(
+    report: CairnReport, path: str | Path, *, tracer: Optional[Tracer] = None
+) -> None:
+    """
+    Deterministic text emission (UTF-8, newline normalized), written atomically.
+
+    Streamed to the file (see stream_report_text); the full text is never held
+    in memory.
+    """
+
+    def write(f: BinaryIO) -> None:
+        out = io.TextIOWrapper(f, encoding="utf-8", newline="\n", write_through=False)
+        if _write_lines(_report_lines(report), out):
+            out.write("\n")
+        out.flush()
+        out.detach()
+
+    _emit("emit_text", path, write, tracer)
@@ -0,0 +1,414 @@
+"""
+Load JSON reports (as written by write_report_json) back into CairnReport.
+
+The document is checked strictly against the report schema: every object must
+carry exactly the fields of its dataclass, with the expected JSON types.
+
+AnalysisSnapshot.files/dirs are the bulk of a large report. At load time their
+arrays are only matched against a regular expression (arrays of JSON strings,
+so a malformed document fails in the loader); decoding happens on first
+attribute access, so reading findings or ext_counts stays cheap.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union, cast, get_args
+
+from cairn_core.reporting.errors import ReportError
+from cairn_core.reporting.schema import (
+    AnalysisSnapshot,
+    CairnReport,
+    Evidence,
+    Finding,
+    PolicyPin,
+    RemediationLink,
+    ReportMeta,
+    ReportSchemaVersion,
+    Severity,
+    StandardsLink,
+)
+
+__all__ = ["load_report_json", "parse_report_json"]
+
+_SCHEMA_VERSIONS = frozenset(get_args(ReportSchemaVersion))
+_SEVERITIES = frozenset(get_args(Severity))
+
+_WS = re.compile(r"[ \t\n\r]*")
+
+# An array of JSON strings, matched without decoding any of them.
+_JSON_CHARS = r'[^"\\\x00-\x1f]*'
+_JSON_STR = rf'"{_JSON_CHARS}(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{{4}}){_JSON_CHARS})*"'
+_STR_ARRAY = re.compile(
+    rf"\[[ \t\n\r]*(?:{_JSON_STR}(?:[ \t\n\r]*,[ \t\n\r]*{_JSON_STR})*)?[ \t\n\r]*\]"
+)
+
+_LAZY_PATH_FIELDS = ("files", "dirs")
+
+_DECODER = json.JSONDecoder()
+
+
+class _PendingPaths:
+    """
+    Raw JSON text of a path array that has been validated but not decoded.
+    """
+
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: str) -> None:
+        self.raw = raw
+
+    def decode(self) -> Tuple[str, ...]:
+        return tuple(json.loads(self.raw))
+
+
+class _LazyPaths:
+    """
+    Data descriptor for one AnalysisSnapshot path field: decodes a
+    _PendingPaths value on first access and stores the tuple in its place.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, objtype: Any = None) -> Any:
+        if obj is None:
+            return self
+        value = obj.__dict__[self.name]
+        if isinstance(value, _PendingPaths):
+            value = obj.__dict__[self.name] = value.decode()
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        # Reached only through object.__setattr__ (dataclass __init__); the
+        # frozen __setattr__ still rejects ordinary assignment.
+        obj.__dict__[self.name] = value
+
+
+class _LazyAnalysisSnapshot(AnalysisSnapshot):
+    """
+    AnalysisSnapshot whose files/dirs are decoded on first access.
+
+    Compares equal to a plain AnalysisSnapshot with the same field values.
+    """
+
+    files = _LazyPaths("files")  # type: ignore[assignment]
+    dirs = _LazyPaths("dirs")  # type: ignore[assignment]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AnalysisSnapshot):
+            return NotImplemented
+        return all(
+            getattr(self, f.name) == getattr(other, f.name) for f in fields(self)
+        )
+
+    __hash__ = AnalysisSnapshot.__hash__
+
+
+# ---- tokenizer ----
+
+
+def _invalid(message: str) -> ReportError:
+    return ReportError("report_json_invalid", message)
+
+
+def _skip_ws(text: str, pos: int) -> int:
+    return _WS.match(text, pos).end()  # type: ignore[union-attr]
+
+
+def _decode_value(text: str, pos: int) -> Tuple[Any, int]:
+    try:
+        return _DECODER.raw_decode(text, pos)
+    except json.JSONDecodeError as e:
+        raise _invalid(f"Malformed JSON: {e}") from e
+
+
+def _parse_object(
+    text: str,
+    pos: int,
+    where: str,
+    value_at: Callable[[str, int], Tuple[Any, int]],
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Parse one JSON object starting at text[pos]; value_at(key, pos) parses each
+    member value. Duplicate keys are rejected (json.loads keeps the last one).
+    """
+    if text[pos : pos + 1] != "{":
+        raise _schema(f"{where} must be an object")
+
+    out: Dict[str, Any] = {}
+    pos = _skip_ws(text, pos + 1)
+    if text[pos : pos + 1] == "}":
+        return out, pos + 1
+
+    while True:
+        if text[pos : pos + 1] != '"':
+            raise _invalid(f"Expected a key in {where} at offset {pos}")
+        key, pos = _decode_value(text, pos)
+        pos = _skip_ws(text, pos)
+        if text[pos : pos + 1] != ":":
+            raise _invalid(f"Expected ':' in {where} at offset {pos}")
+        pos = _skip_ws(text, pos + 1)
+
+        if key in out:
+            raise _schema(f"Duplicate key in {where}: {key!r}")
+        out[key], pos = value_at(key, pos)
+
+        pos = _skip_ws(text, pos)
+        sep = text[pos : pos + 1]
+        if sep == "}":
+            return out, pos + 1
+        if sep != ",":
+            raise _invalid(f"Expected ',' or '}}' in {where} at offset {pos}")
+        pos = _skip_ws(text, pos + 1)
+
+
+def _path_array_end(text: str, pos: int, where: str) -> int:
+    """
+    End offset of the array of strings starting at text[pos].
+
+    Raises ReportError('report_schema_invalid') unless the array is well-formed
+    and holds only strings.
+    """
+    m = _STR_ARRAY.match(text, pos)
+    if m is None:
+        raise _schema(f"{where} must be an array of strings")
+    return m.end()
+
+
+def _analysis_value(text: str, pos: int) -> Tuple[Any, int]:
+    def value_at(key: str, at: int) -> Tuple[Any, int]:
+        if key in _LAZY_PATH_FIELDS:
+            where = f"analysis.{key}"
+            end = _path_array_end(text, at, where)
+            return _PendingPaths(text[at:end]), end
+        return _decode_value(text, at)
+
+    return _parse_object(text, pos, "analysis", value_at)
+
+
+def _report_value(key: str, pos: int, text: str) -> Tuple[Any, int]:
+    if key == "analysis":
+        return _analysis_value(text, pos)
+    return _decode_value(text, pos)
+
+
+# ---- schema ----
+
+
+def _schema(message: str) -> ReportError:
+    return ReportError("report_schema_invalid", message)
+
+
+def _check_fields(obj: Any, cls: type, where: str) -> Dict[str, Any]:
+    if not isinstance(obj, dict):
+        raise _schema(f"{where} must be an object")
+    expected = {f.name for f in fields(cls)}
+    missing = sorted(expected - obj.keys())
+    unknown = sorted(obj.keys() - expected)
+    if missing:
+        raise _schema(f"{where} is missing fields: {', '.join(missing)}")
+    if unknown:
+        raise _schema(f"{where} has unknown fields: {', '.join(unknown)}")
+    return obj
+
+
+def _str(value: Any, where: str) -> str:
+    if not isinstance(value, str):
+        raise _schema(f"{where} must be a string")
+    return value
+
+
+def _opt_str(value: Any, where: str) -> Optional[str]:
+    return None if value is None else _str(value, where)
+
+
+def _int(value: Any, where: str) -> int:
+    if type(value) is not int:
+        raise _schema(f"{where} must be an integer")
+    return value
+
+
+def _bool(value: Any, where: str) -> bool:
+    if type(value) is not bool:
+        raise _schema(f"{where} must be a boolean")
+    return value
+
+
+def _list(value: Any, where: str) -> list:
+    if not isinstance(value, list):
+        raise _schema(f"{where} must be an array")
+    return value
+
+
+def _meta(obj: Any) -> ReportMeta:
+    d = _check_fields(obj, ReportMeta, "meta")
+    version = d["report_schema_version"]
+    if not isinstance(version, str) or version not in _SCHEMA_VERSIONS:
+        raise ReportError(
+            "report_schema_unsupported",
+            f"Unsupported report_schema_version: {version!r}",
+        )
+    return ReportMeta(
+        report_schema_version=cast(ReportSchemaVersion, version),
+        generated_at=_opt_str(d["generated_at"], "meta.generated_at"),
+        tool_version=_opt_str(d["tool_version"], "meta.tool_version"),
+    )
+
+
+def _policy(obj: Any) -> PolicyPin:
+    d = _check_fields(obj, PolicyPin, "policy")
+    if d["content_hash_alg"] != "sha256":
+        raise _schema("policy.content_hash_alg must be 'sha256'")
+    return PolicyPin(
+        policy_pack_id=_str(d["policy_pack_id"], "policy.policy_pack_id"),
+        version=_str(d["version"], "policy.version"),
+        schema_version=_str(d["schema_version"], "policy.schema_version"),
+        content_hash=_opt_str(d["content_hash"], "policy.content_hash"),
+    )
+
+
+def _analysis(obj: Any) -> AnalysisSnapshot:
+    d = _check_fields(obj, AnalysisSnapshot, "analysis")
+
+    ext_counts = d["ext_counts"]
+    if not isinstance(ext_counts, dict):
+        raise _schema("analysis.ext_counts must be an object")
+    for ext, count in ext_counts.items():
+        _int(count, f"analysis.ext_counts[{ext!r}]")
+
+    values = {
+        "entry_count": _int(d["entry_count"], "analysis.entry_count"),
+        "dir_count": _int(d["dir_count"], "analysis.dir_count"),
+        "max_depth": _int(d["max_depth"], "analysis.max_depth"),
+        "files": d["files"],
+        "dirs": d["dirs"],
+        "ext_counts": ext_counts,
+        "has_readme": _bool(d["has_readme"], "analysis.has_readme"),
+        "has_pyproject": _bool(d["has_pyproject"], "analysis.has_pyproject"),
+        "has_requirements": _bool(d["has_requirements"], "analysis.has_requirements"),
+        "cairn_aware": _bool(d["cairn_aware"], "analysis.cairn_aware"),
+    }
+
+    # Bypass __init__ so the pending path arrays are stored undecoded.
+    snapshot = object.__new__(_LazyAnalysisSnapshot)
+    snapshot.__dict__.update(values)
+    return snapshot
+
+
+def _remediation(obj: Any, where: str) -> RemediationLink:
+    d = _check_fields(obj, RemediationLink, where)
+    return RemediationLink(
+        project_id=_str(d["project_id"], f"{where}.project_id"),
+        safe_by_default=_bool(d["safe_by_default"], f"{where}.safe_by_default"),
+        dry_run_supported=_bool(d["dry_run_supported"], f"{where}.dry_run_supported"),
+    )
+
+
+def _standard(obj: Any, where: str) -> StandardsLink:
+    d = _check_fields(obj, StandardsLink, where)
+    return StandardsLink(
+        scheme=_str(d["scheme"], f"{where}.scheme"),
+        ref=_str(d["ref"], f"{where}.ref"),
+        url=_opt_str(d["url"], f"{where}.url"),
+    )
+
+
+def _finding(obj: Any, where: str) -> Finding:
+    d = _check_fields(obj, Finding, where)
+
+    severity = d["severity"]
+    if not isinstance(severity, str) or severity not in _SEVERITIES:
+        raise _schema(f"{where}.severity is not a known severity: {severity!r}")
+
+    evidence = _check_fields(d["evidence"], Evidence, f"{where}.evidence")["items"]
+    if not isinstance(evidence, dict):
+        raise _schema(f"{where}.evidence.items must be an object")
+
+    remediation = _list(d["remediation"], f"{where}.remediation")
+    standards = _list(d["standards"], f"{where}.standards")
+    return Finding(
+        rule_id=_str(d["rule_id"], f"{where}.rule_id"),
+        severity=cast(Severity, severity),
+        title=_str(d["title"], f"{where}.title"),
+        evidence=Evidence(evidence),
+        remediation=tuple(
+            _remediation(item, f"{where}.remediation[{i}]")
+            for i, item in enumerate(remediation)
+        ),
+        standards=tuple(
+            _standard(item, f"{where}.standards[{i}]")
+            for i, item in enumerate(standards)
+        ),
+        rationale=_str(d["rationale"], f"{where}.rationale"),
+    )
+
+
+# ---- public API ----
+
+
+def parse_report_json(data: Union[bytes, str]) -> CairnReport:
+    """
+    Build a CairnReport from report JSON text (UTF-8 bytes or str).
+
+    Must:
+    - reject malformed JSON, duplicate keys and trailing data
+    - require exactly the schema's fields in every object
+    - defer decoding of analysis.files/dirs until they are accessed
+
+    Raises ReportError with code:
+    - 'report_json_invalid' (not UTF-8 / not well-formed JSON / not a JSON object)
+    - 'report_schema_unsupported' (unknown report_schema_version)
+    - 'report_schema_invalid' (wrong shape, missing/unknown field, bad type)
+
+    analysis.files/dirs are validated here (a malformed array raises
+    'report_schema_invalid') but decoded only when first read. Evidence arrays
+    load as lists (JSON does not distinguish tuples).
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        try:
+            text = bytes(data).decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise _invalid(f"Report is not valid UTF-8: {e}") from e
+    else:
+        text = data
+
+    pos = _skip_ws(text, 0)
+    if text[pos : pos + 1] != "{":
+        raise _invalid(f"Report is not a JSON object (offset {pos})")
+    top, pos = _parse_object(
+        text, pos, "report", lambda key, at: _report_value(key, at, text)
+    )
+    if _skip_ws(text, pos) != len(text):
+        raise _invalid(f"Trailing data after report at offset {pos}")
+
+    d = _check_fields(top, CairnReport, "report")
+    findings = _list(d["findings"], "findings")
+    return CairnReport(
+        meta=_meta(d["meta"]),
+        policy=_policy(d["policy"]),
+        project_ref=_str(d["project_ref"], "project_ref"),
+        analysis=_analysis(d["analysis"]),
+        findings=tuple(
+            _finding(item, f"findings[{i}]") for i, item in enumerate(findings)
+        ),
+    )
+
+
+def load_report_json(path: Union[str, Path]) -> CairnReport:
+    """
+    Read a report written by write_report_json().
+
+    Raises ReportError('report_io_error') if the file cannot be read, otherwise
+    as parse_report_json().
+    """
+    try:
+        data = Path(path).read_bytes()
+    except OSError as e:
+        raise ReportError(
+            "report_io_error", f"Failed to read report: {path} ({e})"
+        ) from e
+    return parse_report_json(data)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Literal, Optional, Tuple
+from typing import Any, Dict, Literal, Mapping, Optional, Tuple
 
 # Keep report schema version explicit and finite.
 ReportSchemaVersion = Literal["1.0"]
@@ -76,8 +76,11 @@ class Evidence:
     Examples:
       {"marker": "README", "present": False}
       {"ext": ".py", "count": 12, "min_required": 1}
+
+    Findings shared between batch-evaluated snapshots carry a read-only
+    mapping (types.MappingProxyType) here.
     """
-    items: Dict[str, Any] = field(default_factory=dict)
+    items: Mapping[str, Any] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
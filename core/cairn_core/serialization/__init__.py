@@ -1,9 +1,33 @@
-from .json import to_json_dict, to_json_str, to_json_bytes
-from .errors import SerializationError
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cairn_core._lazy import lazy_exports
+
+# Public name -> defining submodule, imported on first use.
+_EXPORTS = {
+    "to_json_dict": "json",
+    "to_json_str": "json",
+    "to_json_bytes": "json",
+    "write_json": "json",
+    "SerializationError": "errors",
+}
 
 __all__ = [
     "to_json_dict",
     "to_json_str",
     "to_json_bytes",
+    "write_json",
     "SerializationError",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .errors import SerializationError
+    from .json import (
+        to_json_bytes,
+        to_json_dict,
+        to_json_str,
+        write_json,
+    )
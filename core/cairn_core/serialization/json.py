@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import json
-from dataclasses import is_dataclass, asdict
-from typing import Any, Dict, List
+from dataclasses import fields, is_dataclass
+from types import MappingProxyType
+from typing import Any, BinaryIO, Callable, Dict, List, Mapping, Tuple
 
 from .errors import SerializationError
 
@@ -12,7 +13,8 @@ def _normalize(obj: Any) -> Any:
     Convert supported objects into JSON-serializable primitives.
 
     Determinism rules:
-    - dict keys must be strings (JSON requirement) and will be sorted at dump-time.
+    - dict (or read-only MappingProxyType) keys must be strings (JSON requirement)
+      and will be sorted at dump-time.
     - tuples are converted to lists, preserving order.
     - dataclasses become dicts recursively.
     - unsupported types raise SerializationError.
@@ -21,14 +23,12 @@ def _normalize(obj: Any) -> Any:
     if obj is None or isinstance(obj, (bool, int, float, str)):
         return obj
 
-    # dataclasses
-    if is_dataclass(obj):
-        # asdict() is deterministic given deterministic field order,
-        # but we still recursively normalize to enforce type constraints.
-        return _normalize(asdict(obj))
+    # dataclasses (instances; field order does not matter, keys are sorted)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: _normalize(getattr(obj, f.name)) for f in fields(obj)}
 
-    # dict
-    if isinstance(obj, dict):
+    # dict, or a read-only view of one
+    if isinstance(obj, (dict, MappingProxyType)):
         out: Dict[str, Any] = {}
         for k, v in obj.items():
             if not isinstance(k, str):
@@ -49,6 +49,224 @@ def _normalize(obj: Any) -> Any:
     )
 
 
+# Same string encoder json.dumps(ensure_ascii=False) uses (C version if available).
+_encode_str: Callable[[str], str]
+_encode_str = json.encoder.encode_basestring  # type: ignore[attr-defined]
+
+_INFINITY = float("inf")
+
+# Per-dataclass (pre-encoded '"name":' prefix, field name) pairs, in sort_keys order.
+_FIELD_CACHE: Dict[type, Tuple[Tuple[str, str], ...]] = {}
+
+
+def _dataclass_fields(cls: type) -> Tuple[Tuple[str, str], ...]:
+    cached = _FIELD_CACHE.get(cls)
+    if cached is None:
+        names = sorted(f.name for f in fields(cls))
+        cached = tuple((_encode_str(name) + ":", name) for name in names)
+        _FIELD_CACHE[cls] = cached
+    return cached
+
+
+_Append = Callable[[str], None]
+_Emit = Callable[[Any, _Append], None]
+
+
+def _encode_float(value: float) -> str:
+    # Mirrors json.encoder's floatstr with allow_nan=True.
+    if value != value:
+        return "NaN"
+    if value == _INFINITY:
+        return "Infinity"
+    if value == -_INFINITY:
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _emit(obj: Any, append: _Append) -> None:
+    """
+    Validate and encode in one pass, passing JSON text chunks to `append`.
+
+    Equivalent to json.dumps(_normalize(obj), sort_keys=True, ...) for every input
+    _normalize accepts. Anything unusual raises SerializationError; the caller
+    then re-runs the reference path so errors are reported exactly as before.
+    """
+    # Exact-type checks first: these cover almost every value in a report.
+    t = type(obj)
+    if t is str:
+        append(_encode_str(obj))
+        return
+    if obj is None:
+        append("null")
+        return
+    if obj is True:
+        append("true")
+        return
+    if obj is False:
+        append("false")
+        return
+    if isinstance(obj, str):
+        append(_encode_str(obj))
+        return
+    if isinstance(obj, int):
+        append(int.__repr__(obj))
+        return
+    if isinstance(obj, float):
+        append(_encode_float(obj))
+        return
+
+    # dataclasses: walk fields directly. Only plain containers and dataclasses
+    # are taken here; anything else falls back via SerializationError.
+    if hasattr(t, "__dataclass_fields__"):
+        if isinstance(obj, (dict, list, tuple)):
+            raise SerializationError("json_fast_path_unsupported", repr(t))
+        sep = "{"
+        for prefix, name in _dataclass_fields(t):
+            append(sep)
+            append(prefix)
+            _emit_field(getattr(obj, name), append)
+            sep = ","
+        append("}" if sep == "," else "{}")
+        return
+
+    if isinstance(obj, (dict, MappingProxyType)):
+        _emit_dict(obj, append, _emit)
+        return
+
+    if isinstance(obj, (list, tuple)):
+        _emit_seq(obj, append, _emit)
+        return
+
+    raise SerializationError(
+        "json_unsupported_type",
+        f"Object of type {type(obj)!r} is not JSON-serializable",
+    )
+
+
+def _emit_field(value: Any, append: _Append) -> None:
+    """
+    _emit() for values reached through a dataclass field: only exact builtin
+    containers are walked here.
+    """
+    t = type(value)
+    if t is dict or t is MappingProxyType:
+        _emit_dict(value, append, _emit_field)
+    elif t is list or t is tuple:
+        _emit_seq(value, append, _emit_field)
+    elif isinstance(value, (dict, list, tuple)):
+        # Subclasses (namedtuple, defaultdict, ...) take the reference path.
+        raise SerializationError("json_fast_path_unsupported", repr(t))
+    else:
+        _emit(value, append)
+
+
+def _emit_dict(obj: Mapping[Any, Any], append: _Append, emit: _Emit) -> None:
+    for k in obj:
+        if not isinstance(k, str):
+            raise SerializationError(
+                "json_key_not_string",
+                f"JSON object keys must be strings; got key type {type(k)!r}",
+            )
+    if not obj:
+        append("{}")
+        return
+    sep = "{"
+    for k, v in sorted(obj.items()):
+        append(sep)
+        append(_encode_str(k))
+        append(":")
+        emit(v, append)
+        sep = ","
+    append("}")
+
+
+def _emit_seq(obj: Any, append: _Append, emit: _Emit) -> None:
+    if not obj:
+        append("[]")
+        return
+    sep = "["
+    for item in obj:
+        append(sep)
+        if type(item) is str:
+            append(_encode_str(item))
+        else:
+            emit(item, append)
+        sep = ","
+    append("]")
+
+
+def _encode(obj: Any) -> str:
+    """
+    Deterministic JSON text (without trailing newline).
+
+    Single pass over the object graph; on any SerializationError the reference
+    path (_normalize + json.dumps) is run instead, so the error raised (or, for
+    inputs the fast path does not handle, the output) is exactly the same.
+    """
+    out: List[str] = []
+    try:
+        _emit(obj, out.append)
+    except SerializationError:
+        return _encode_reference(obj)
+    return "".join(out)
+
+
+def _encode_reference(obj: Any) -> str:
+    return json.dumps(
+        _normalize(obj),
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+
+# Chunks buffered before each write in write_json(); a chunk is at most one
+# encoded scalar, so this bounds memory independently of document size.
+_STREAM_BUFFER_CHUNKS = 8192
+
+
+def write_json(
+    obj: Any, stream: BinaryIO, *, buffer_chunks: int = _STREAM_BUFFER_CHUNKS
+) -> int:
+    """
+    Stream exactly to_json_bytes(obj) to a binary stream; returns bytes written.
+
+    Validation happens while writing: on error the stream may hold a partial
+    document (write to a temporary file to get all-or-nothing semantics).
+    """
+    parts: List[str] = []
+    written = 0
+
+    def flush() -> None:
+        nonlocal written
+        if parts:
+            data = "".join(parts).encode("utf-8")
+            parts.clear()
+            stream.write(data)
+            written += len(data)
+
+    def append(chunk: str) -> None:
+        parts.append(chunk)
+        if len(parts) >= buffer_chunks:
+            flush()
+
+    try:
+        _emit(obj, append)
+    except SerializationError:
+        # Everything flushed so far is a prefix of the reference output (same
+        # text, emitted in the same order), so finish from where it stopped;
+        # if the reference path raises, the error matches to_json_bytes().
+        data = _encode_reference(obj).encode("utf-8")
+        parts.clear()
+        stream.write(data[written:])
+        written = len(data)
+    else:
+        flush()
+
+    stream.write(b"\n")
+    return written + 1
+
+
 def to_json_dict(obj: Any) -> Any:
     """
     Public API: normalize to JSON-safe python structures.
@@ -60,13 +278,7 @@ def to_json_str(obj: Any) -> str:
     """
     Deterministic JSON string.
     """
-    normalized = _normalize(obj)
-    return json.dumps(
-        normalized,
-        ensure_ascii=False,
-        sort_keys=True,
-        separators=(",", ":"),
-    ) + "\n"
+    return _encode(obj) + "\n"
 
 
 def to_json_bytes(obj: Any) -> bytes:
@@ -0,0 +1,165 @@
+"""
+Optional span tracing for the analysis pipeline.
+
+A Tracer passed to the project entrypoints (introspect_project, analyze_project,
+analyze_project_report and their *_with_stats variants) and to the report
+writers records one span per pipeline step (load_project, walk, aggregate,
+build_report, emit_*) and one per directory listing. write() saves them in the
+Chrome Trace Event format, which chrome://tracing and ui.perfetto.dev open
+directly.
+
+Directory listings are the only per-tree spans, so they are bounded:
+
+- max_dir_depth: listings deeper than this are not recorded
+- sample_every: only every Nth listing (in traversal order) is recorded
+- slow_us: a listing that took at least this long is recorded regardless of
+  sampling or depth, so slow directories are never sampled away
+- max_events: hard cap on stored spans; later spans are counted as dropped
+
+Timestamps come from the same monotonic clock as ScanStats. A Tracer belongs to
+one process and is not meant to be shared between concurrent scans.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+__all__ = ["Tracer"]
+
+_CATEGORY = "cairn"
+
+# (name, start_ns, end_ns, thread id, args)
+_Event = Tuple[str, int, int, int, Optional[Dict[str, Any]]]
+
+
+class Tracer:
+    """
+    In-memory span recorder with a Chrome Trace Event exporter.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_dir_depth: int | None = None,
+        sample_every: int = 1,
+        slow_us: float | None = None,
+        max_events: int = 100_000,
+    ) -> None:
+        if max_dir_depth is not None and max_dir_depth < 0:
+            raise ValueError("max_dir_depth must be >= 0")
+        if sample_every < 1:
+            raise ValueError("sample_every must be >= 1")
+        if max_events < 0:
+            raise ValueError("max_events must be >= 0")
+
+        self.max_dir_depth = max_dir_depth
+        self.sample_every = sample_every
+        self.slow_ns = None if slow_us is None else int(slow_us * 1000)
+        self.max_events = max_events
+
+        self.events: List[_Event] = []
+        self.dropped = 0
+        self._listings = 0
+        self._origin_ns = time.perf_counter_ns()
+
+    def add(
+        self,
+        name: str,
+        start_ns: int,
+        end_ns: int,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Record one completed span (perf_counter_ns timestamps).
+        """
+        if len(self.events) >= self.max_events:
+            self.dropped += 1
+            return
+        self.events.append((name, start_ns, end_ns, threading.get_native_id(), args))
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[None]:
+        """
+        Record the enclosed block as one span, even if it raises.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, start, time.perf_counter_ns(), args or None)
+
+    def listing(
+        self, rel: str, start_ns: int, end_ns: int, entries: int | None
+    ) -> None:
+        """
+        Record one directory listing, subject to depth cutoff and sampling.
+        `entries` is None for the single-entry probes made at the depth limit.
+        """
+        self._listings += 1
+        slow = self.slow_ns is not None and end_ns - start_ns >= self.slow_ns
+        if not slow:
+            if (self._listings - 1) % self.sample_every:
+                return
+            if self.max_dir_depth is not None:
+                depth = 0 if rel == "." else rel.count("/") + 1
+                if depth > self.max_dir_depth:
+                    return
+
+        args: Dict[str, Any] = {"path": rel}
+        if entries is None:
+            args["probe"] = True
+        else:
+            args["entries"] = entries
+        self.add("list_dir", start_ns, end_ns, args)
+
+    def write(self, path: str | Path) -> None:
+        """
+        Write the recorded spans as a Chrome Trace Event JSON object, one
+        event per line.
+        """
+        pid = os.getpid()
+        origin = self._origin_ns
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('{"displayTimeUnit":"ms","otherData":')
+            json.dump(
+                {
+                    "dropped_events": self.dropped,
+                    "listings_seen": self._listings,
+                    "sample_every": self.sample_every,
+                    "max_dir_depth": self.max_dir_depth,
+                },
+                f,
+                sort_keys=True,
+            )
+            f.write(',"traceEvents":[\n')
+            f.write(
+                json.dumps(
+                    {
+                        "name": "process_name",
+                        "ph": "M",
+                        "pid": pid,
+                        "args": {"name": "cairn_core"},
+                    }
+                )
+            )
+            for name, start, end, tid, args in self.events:
+                event: Dict[str, Any] = {
+                    "name": name,
+                    "cat": _CATEGORY,
+                    "ph": "X",
+                    "ts": (start - origin) / 1000,
+                    "dur": (end - start) / 1000,
+                    "pid": pid,
+                    "tid": tid,
+                }
+                if args:
+                    event["args"] = args
+                f.write(",\n")
+                f.write(json.dumps(event))
+            f.write("\n]}\n")
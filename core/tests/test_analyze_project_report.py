@@ -17,3 +17,24 @@ def test_analyze_project_report_matches_builder(tmp_path: Path) -> None:
     actual = analyze_project_report(tmp_path)
 
     assert to_json_str(actual) == to_json_str(expected)
+
+
+def test_analyze_project_report_parses_manifest_once(
+    tmp_path: Path, monkeypatch
+) -> None:
+    import yaml
+
+    init_project(tmp_path, "test-project")
+
+    calls = []
+    real_safe_load = yaml.safe_load
+
+    def counting_safe_load(stream):
+        calls.append(stream)
+        return real_safe_load(stream)
+
+    monkeypatch.setattr(yaml, "safe_load", counting_safe_load)
+
+    analyze_project_report(tmp_path)
+
+    assert len(calls) == 1
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from cairn_core.cli import main
+from cairn_core.projects.analyze import analyze_project_report
+from cairn_core.projects.batch import batch_output_name, iter_batch_reports, run_batch
+from cairn_core.projects.init import init_project
+from cairn_core.projects.introspect import ScanOptions
+from cairn_core.serialization import to_json_bytes
+
+
+def _projects(tmp_path: Path) -> list[Path]:
+    roots = []
+    for i, name in enumerate(["zeta", "alpha", "broken", "mid"]):
+        root = tmp_path / "projects" / name
+        root.mkdir(parents=True)
+        if name != "broken":
+            init_project(root, f"project-{name}")
+            for j in range(i + 1):
+                (root / f"file{j}.py").write_text("x", encoding="utf-8")
+        roots.append(root)
+    return roots
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_yields_results_in_input_order(tmp_path: Path, workers: int) -> None:
+    roots = _projects(tmp_path)
+
+    results = list(iter_batch_reports(roots, workers=workers))
+
+    assert [r.root for r in results] == roots
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert [r.error_code for r in results] == [None, None, "manifest_missing", None]
+    for root, result in zip(roots, results):
+        if result.ok:
+            assert result.report_json == to_json_bytes(analyze_project_report(root))
+
+
+def test_batch_captures_introspection_errors(tmp_path: Path) -> None:
+    roots = _projects(tmp_path)
+
+    results = list(
+        iter_batch_reports(roots, workers=2, options=ScanOptions(max_files=3))
+    )
+
+    assert [r.error_code for r in results] == [
+        None,
+        None,
+        "manifest_missing",
+        "introspection_scan_limit_exceeded",
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_records_non_mapping_manifest(tmp_path: Path, workers: int) -> None:
+    roots = _projects(tmp_path)
+    (roots[1] / ".cairn" / "manifest.yaml").write_text("", encoding="utf-8")
+
+    results = run_batch(roots, tmp_path / "out", workers=workers)
+
+    assert [r.error_code for r in results] == [
+        None,
+        "manifest_unsupported",
+        "manifest_missing",
+        None,
+    ]
+    assert results[1].output_path is None
+
+
+def test_run_batch_writes_reports_in_order(tmp_path: Path) -> None:
+    roots = _projects(tmp_path)
+    out = tmp_path / "out"
+    seen = []
+
+    results = run_batch(roots, out, workers=2, on_result=lambda r: seen.append(r.index))
+
+    assert seen == [0, 1, 2, 3]
+    assert sorted(p.name for p in out.iterdir()) == [
+        batch_output_name(i, roots[i]) for i in (0, 1, 3)
+    ]
+    assert results[2].output_path is None
+    assert results[0].report_json is None
+    assert results[1].output_path is not None
+    assert results[1].output_path.read_bytes() == to_json_bytes(
+        analyze_project_report(roots[1])
+    )
+
+
+def test_cli_batch_discovers_projects_in_name_order(tmp_path: Path, capsys) -> None:
+    roots = _projects(tmp_path)
+    out = tmp_path / "out"
+
+    status = main(["batch", "--out", str(out), "--discover", str(roots[0].parent)])
+
+    lines = [line.split("\t") for line in capsys.readouterr().out.splitlines()]
+    assert status == 0
+    assert [(line[0], Path(line[1]).name) for line in lines] == [
+        ("ok", "alpha"),
+        ("ok", "mid"),
+        ("ok", "zeta"),
+    ]
+    assert len(list(out.iterdir())) == 3
+
+
+def test_cli_batch_reports_failures_by_code(tmp_path: Path, capsys) -> None:
+    roots = _projects(tmp_path)
+    out = tmp_path / "out"
+
+    status = main(["batch", "--out", str(out), "--workers", "1", *map(str, roots)])
+
+    lines = [line.split("\t") for line in capsys.readouterr().out.splitlines()]
+    assert status == 1
+    assert [line[0] for line in lines] == ["ok", "ok", "error", "ok"]
+    assert lines[2][1:3] == [str(roots[2]), "manifest_missing"]
+
+
+def test_cli_batch_without_roots_is_a_usage_error(tmp_path: Path) -> None:
+    assert main(["batch", "--out", str(tmp_path / "out")]) == 2
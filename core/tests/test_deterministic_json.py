@@ -1,6 +1,12 @@
+import json
+import random
+from collections import OrderedDict, namedtuple
+from dataclasses import dataclass
+
 import pytest
 
 from cairn_core.serialization import to_json_str, SerializationError
+from cairn_core.serialization.json import _normalize
 from cairn_core.policy import PolicyPack, PolicyPackMeta
 from cairn_core.reporting import (
     CairnReport,
@@ -49,3 +55,136 @@ def test_non_string_key_raises_coded_error():
         to_json_str({1: "x"})  # type: ignore[dict-item]
 
     assert excinfo.value.code == "json_key_not_string"
+
+
+def _reference_json_str(obj) -> str:
+    return json.dumps(
+        _normalize(obj), ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    ) + "\n"
+
+
+_Pair = namedtuple("_Pair", "a b")
+
+
+@dataclass
+class _Node:
+    zeta: object
+    alpha: object
+
+
+def _random_value(rnd, depth: int = 0):
+    scalars = [
+        None,
+        True,
+        False,
+        0,
+        -7,
+        2**70,
+        1.5,
+        -0.0,
+        1e300,
+        float("nan"),
+        float("inf"),
+        "",
+        "plain",
+        'quote " backslash \\ tab \t nl \n',
+        "\x00\x1f\x7f",
+        "naïve ✓ \U0001f600",
+    ]
+    if depth > 3:
+        return rnd.choice(scalars)
+
+    kind = rnd.randrange(7)
+    if kind == 0:
+        return rnd.choice(scalars)
+    if kind == 1:
+        return [_random_value(rnd, depth + 1) for _ in range(rnd.randrange(4))]
+    if kind == 2:
+        return tuple(_random_value(rnd, depth + 1) for _ in range(rnd.randrange(4)))
+    if kind == 3:
+        return {
+            rnd.choice(["b", "a", "ä", "A", "", "10", "9"]): _random_value(
+                rnd, depth + 1
+            )
+            for _ in range(rnd.randrange(4))
+        }
+    if kind == 4:
+        return OrderedDict(z=_random_value(rnd, depth + 1), a=1)
+    if kind == 5:
+        return _Pair(_random_value(rnd, depth + 1), _random_value(rnd, depth + 1))
+    return _Node(_random_value(rnd, depth + 1), _random_value(rnd, depth + 1))
+
+
+def test_fast_path_is_byte_identical_to_reference():
+    rnd = random.Random(0)
+    for _ in range(2000):
+        value = _random_value(rnd)
+        assert to_json_str(value) == _reference_json_str(value)
+
+
+def test_fast_path_is_byte_identical_for_report():
+    report = CairnReport(
+        meta=ReportMeta(generated_at="2025-12-22T00:00:00Z"),
+        policy=PolicyPin(policy_pack_id="x", version="1.0.0", schema_version="1.0"),
+        project_ref="proj",
+        analysis=AnalysisSnapshot(
+            entry_count=4,
+            dir_count=1,
+            max_depth=1,
+            files=("a.py", "src/b ✓.py"),
+            dirs=("src",),
+            ext_counts={".py": 2, "": 0},
+        ),
+    )
+
+    assert to_json_str(report) == _reference_json_str(report)
+
+
+def test_fast_path_reports_errors_like_reference():
+    @dataclass(frozen=True)
+    class Key:
+        k: int
+
+    @dataclass
+    class Holder:
+        mapping: dict
+
+    for bad in ({"x": {1: "y"}}, Holder({Key(1): "x"}), [object()]):
+        with pytest.raises(Exception) as reference:
+            _reference_json_str(bad)
+        with pytest.raises(Exception) as fast:
+            to_json_str(bad)
+
+        assert type(fast.value) is type(reference.value)
+        assert str(fast.value) == str(reference.value)
+
+
+@pytest.mark.parametrize("buffer_chunks", [1, 3, 8192])
+def test_write_json_streams_exact_bytes(buffer_chunks):
+    import io
+
+    from cairn_core.serialization import to_json_bytes, write_json
+
+    rnd = random.Random(1)
+    for _ in range(300):
+        value = _random_value(rnd)
+        buf = io.BytesIO()
+        n = write_json(value, buf, buffer_chunks=buffer_chunks)
+        assert buf.getvalue() == to_json_bytes(value)
+        assert n == len(buf.getvalue())
+
+
+def test_write_json_finishes_via_reference_after_partial_flush():
+    """
+    A value only the reference path handles, reached after chunks were already
+    flushed, must still produce the exact bytes.
+    """
+    import io
+
+    from cairn_core.serialization import to_json_bytes, write_json
+
+    value = [_Node(zeta=_Pair("a", "b"), alpha="x" * 10)]
+    buf = io.BytesIO()
+    write_json(value, buf, buffer_chunks=1)
+
+    assert buf.getvalue() == to_json_bytes(value)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import cairn_core.policy
+import cairn_core.reporting
+import cairn_core.serialization
+from cairn_core._import_budget import DEFERRED_MODULES, IMPORT_BUDGETS_MS
+
+# benchmarks.startup holds imports to IMPORT_BUDGETS_MS; this suite only checks
+# a loose multiple of them, so a shared, noisy runner does not fail it.
+_BUDGET_SCALE = 5
+
+
+def _import_in_fresh_interpreter(statement: str) -> tuple[float, list[str]]:
+    probe = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(json.dumps([time.perf_counter() - start, sorted(sys.modules)]))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    ).stdout
+    elapsed, modules = json.loads(out)
+    return elapsed, modules
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import cairn_core.cli",
+        "import cairn_core.projects.analyze",
+        "import cairn_core.policy",
+        "from cairn_core.reporting import CairnReport",
+    ],
+)
+def test_import_does_not_load_deferred_modules(statement: str) -> None:
+    _, modules = _import_in_fresh_interpreter(statement)
+    assert [m for m in DEFERRED_MODULES if m in modules] == []
+
+
+def test_package_import_loads_no_submodules() -> None:
+    _, modules = _import_in_fresh_interpreter(
+        "import cairn_core.reporting, cairn_core.policy, cairn_core.serialization"
+    )
+    for package in ("reporting", "policy", "serialization"):
+        prefix = f"cairn_core.{package}."
+        assert [m for m in modules if m.startswith(prefix)] == []
+
+
+def test_cli_import_is_within_budget() -> None:
+    best = min(
+        _import_in_fresh_interpreter("import cairn_core.cli")[0] for _ in range(3)
+    )
+    budget_s = IMPORT_BUDGETS_MS["cairn_core.cli"] * _BUDGET_SCALE / 1e3
+    assert best < budget_s
+
+
+@pytest.mark.parametrize(
+    "package", [cairn_core.reporting, cairn_core.policy, cairn_core.serialization]
+)
+def test_lazy_exports_resolve(package) -> None:
+    for name in package.__all__:
+        assert getattr(package, name).__name__ == name
+    assert package.__all__ == list(package._EXPORTS)
+    assert set(package.__all__) <= set(dir(package))
+    with pytest.raises(AttributeError):
+        getattr(package, "no_such_name")
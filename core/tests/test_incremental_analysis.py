@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import random
+import shutil
+from pathlib import Path
+
+import pytest
+
+from cairn_core.projects.analyze import analyze_project, update_analysis
+from cairn_core.projects.init import init_project
+from cairn_core.projects.introspect import ScanOptions
+
+_NAMES = [
+    "a",
+    "a-b",
+    "a.txt",
+    "B",
+    "README.md",
+    "pyproject.toml",
+    "requirements.txt",
+    "mod.py",
+    "x.PY",
+    "t.tar.gz",
+    ".git",
+    "__pycache__",
+    "node_modules",
+    "build",
+]
+
+
+def _random_mutation(root: Path, rnd: random.Random) -> list[str]:
+    """
+    Apply one random add/remove/replace and return the changed relative paths,
+    as a file watcher would report them.
+    """
+    existing = sorted(
+        p for p in root.rglob("*") if ".cairn" not in p.relative_to(root).parts
+    )
+    op = rnd.choice(["add_file", "add_dir", "add_deep", "remove", "replace"])
+
+    if op == "remove" and existing:
+        victim = rnd.choice(existing)
+        if victim.is_dir():
+            shutil.rmtree(victim)
+        else:
+            victim.unlink()
+        return [victim.relative_to(root).as_posix()]
+
+    if op == "replace" and existing:
+        victim = rnd.choice(existing)
+        if victim.is_dir():
+            shutil.rmtree(victim)
+            victim.write_text("x", encoding="utf-8")
+        else:
+            victim.unlink()
+            victim.mkdir()
+        return [victim.relative_to(root).as_posix()]
+
+    dirs = [root] + [p for p in existing if p.is_dir()]
+    parent = rnd.choice(dirs)
+    target = parent / rnd.choice(_NAMES)
+    if target.exists():
+        return []
+
+    if op == "add_deep":
+        # Only the deepest path is reported; its new ancestors are not.
+        leaf = target / rnd.choice(_NAMES) / "deep.py"
+        leaf.parent.mkdir(parents=True)
+        leaf.write_text("x", encoding="utf-8")
+        return [leaf.relative_to(root).as_posix()]
+
+    if op == "add_dir":
+        target.mkdir()
+    else:
+        target.write_text("x", encoding="utf-8")
+    return [target.relative_to(root).as_posix()]
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_update_analysis_matches_full_reanalysis(tmp_path: Path, seed: int) -> None:
+    """
+    Differential harness: after every batch of random changes, patching the
+    previous analysis must equal analyzing the tree from scratch.
+    """
+    rnd = random.Random(seed)
+    init_project(tmp_path, "test-project")
+    with (tmp_path / ".cairn" / "manifest.yaml").open("a", encoding="utf-8") as f:
+        f.write("exclude:\n- build\n")
+
+    analysis = analyze_project(tmp_path)
+    for _step in range(12):
+        changed: list[str] = []
+        for _ in range(rnd.randint(1, 3)):
+            changed.extend(_random_mutation(tmp_path, rnd))
+
+        analysis = update_analysis(analysis, changed)
+        assert analysis == analyze_project(tmp_path)
+
+
+def test_update_analysis_recomputes_max_depth_after_deletion(tmp_path: Path) -> None:
+    init_project(tmp_path, "test-project")
+    (tmp_path / "a" / "b" / "c").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "c" / "deep.py").write_text("x", encoding="utf-8")
+    (tmp_path / "a" / "b" / "mid.py").write_text("x", encoding="utf-8")
+
+    analysis = analyze_project(tmp_path)
+    assert analysis.max_depth == 3
+
+    shutil.rmtree(tmp_path / "a" / "b" / "c")
+    updated = update_analysis(analysis, ["a/b/c"])
+
+    assert updated.max_depth == 2
+    assert updated == analyze_project(tmp_path)
+
+
+def test_update_analysis_accepts_absolute_paths_and_ignores_excluded(
+    tmp_path: Path,
+) -> None:
+    init_project(tmp_path, "test-project")
+    analysis = analyze_project(tmp_path)
+
+    (tmp_path / "README.md").write_text("x", encoding="utf-8")
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "junk.pyc").write_bytes(b"\x00")
+
+    updated = update_analysis(
+        analysis, [tmp_path / "README.md", "__pycache__/junk.pyc"]
+    )
+
+    assert updated.markers.has_readme is True
+    assert updated == analyze_project(tmp_path)
+
+
+def test_update_analysis_rejects_paths_outside_root(tmp_path: Path) -> None:
+    init_project(tmp_path, "test-project")
+    analysis = analyze_project(tmp_path)
+
+    with pytest.raises(ValueError):
+        update_analysis(analysis, ["../elsewhere.txt"])
+
+
+def test_update_analysis_reruns_phase3_gate_on_manifest_change(tmp_path: Path) -> None:
+    init_project(tmp_path, "test-project")
+    analysis = analyze_project(tmp_path)
+
+    (tmp_path / ".cairn" / "manifest.yaml").write_text(
+        "schema_version: '999'\n", encoding="utf-8"
+    )
+
+    with pytest.raises(Exception) as excinfo:
+        update_analysis(analysis, [".cairn/manifest.yaml"])
+
+    assert excinfo.value.code == "manifest_schema_unsupported"
+
+
+def test_update_analysis_enforces_scan_limits(tmp_path: Path) -> None:
+    init_project(tmp_path, "test-project")
+    (tmp_path / "a.txt").write_text("x", encoding="utf-8")
+
+    options = ScanOptions(max_files=2)
+    analysis = analyze_project(tmp_path, options=options)
+
+    (tmp_path / "b.txt").write_text("x", encoding="utf-8")
+    with pytest.raises(Exception) as excinfo:
+        update_analysis(analysis, ["b.txt"], options=options)
+
+    assert excinfo.value.code == "introspection_scan_limit_exceeded"
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import cairn_core.projects.introspect_cache as cache_mod
+from cairn_core.projects.init import init_project
+from cairn_core.projects.introspect import ScanOptions, introspect_project
+
+_CACHE_REL = ".cairn/introspect-cache.json"
+_CACHED = ScanOptions(use_cache=True)
+
+
+def _age_tree(root: Path) -> None:
+    """
+    Backdate every directory mtime so cached listings are outside the racy window.
+    """
+    old_ns = 1_000_000_000_000_000_000  # 2001-09-09
+    for dirpath, _dirnames, _filenames in os.walk(root):
+        os.utime(dirpath, ns=(old_ns, old_ns))
+
+
+def _warm_cache(root: Path) -> None:
+    """
+    Leave a cache whose recorded mtimes match the (aged) directories on disk.
+    """
+    introspect_project(root, options=_CACHED)
+    _age_tree(root)
+    introspect_project(root, options=_CACHED)
+    _age_tree(root)
+
+
+def _make_tree(root: Path) -> None:
+    init_project(root, "test-project")
+    (root / "src").mkdir()
+    (root / "src" / "main.py").write_text("x", encoding="utf-8")
+    (root / "src" / "pkg").mkdir()
+    (root / "src" / "pkg" / "mod.py").write_text("x", encoding="utf-8")
+    (root / "docs").mkdir()
+    (root / "docs" / "a.md").write_text("x", encoding="utf-8")
+    (root / "README.md").write_text("x", encoding="utf-8")
+
+
+def _count_listings(monkeypatch) -> list[str]:
+    listed: list[str] = []
+    real_scan_dir = cache_mod.scan_dir
+
+    def counting_scan_dir(dir_path: str):
+        listed.append(dir_path)
+        return real_scan_dir(dir_path)
+
+    monkeypatch.setattr(cache_mod, "scan_dir", counting_scan_dir)
+    return listed
+
+
+def test_cached_scan_matches_cold_scan_and_hides_cache_file(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+
+    cold = introspect_project(tmp_path)
+    first = introspect_project(tmp_path, options=_CACHED)
+    assert (tmp_path / _CACHE_REL).is_file()
+
+    _age_tree(tmp_path)
+    warm = introspect_project(tmp_path, options=_CACHED)
+
+    assert first == cold
+    assert warm == cold
+    assert introspect_project(tmp_path) == cold
+    assert _CACHE_REL not in warm.relative_paths
+
+
+def test_cached_scan_relists_only_changed_directories(
+    tmp_path: Path, monkeypatch
+) -> None:
+    _make_tree(tmp_path)
+    _warm_cache(tmp_path)
+
+    (tmp_path / "src" / "pkg" / "new.py").write_text("x", encoding="utf-8")
+
+    listed = _count_listings(monkeypatch)
+    warm = introspect_project(tmp_path, options=_CACHED)
+
+    assert listed == [os.path.join(tmp_path, "src", "pkg")]
+    assert warm == introspect_project(tmp_path)
+    assert "src/pkg/new.py" in warm.relative_paths
+
+
+def test_cached_scan_tracks_removed_and_replaced_entries(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    _warm_cache(tmp_path)
+
+    (tmp_path / "docs" / "a.md").unlink()
+    (tmp_path / "docs").rmdir()
+    (tmp_path / "src" / "main.py").unlink()
+    (tmp_path / "src" / "main.py").mkdir()
+
+    assert introspect_project(tmp_path, options=_CACHED) == introspect_project(tmp_path)
+
+
+def test_corrupt_cache_falls_back_to_cold_scan(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    cold = introspect_project(tmp_path)
+
+    (tmp_path / _CACHE_REL).write_text("{not json", encoding="utf-8")
+    assert introspect_project(tmp_path, options=_CACHED) == cold
+
+    (tmp_path / _CACHE_REL).write_text(
+        json.dumps({"version": 999, "scan_started_ns": 0, "dirs": {}}),
+        encoding="utf-8",
+    )
+    assert introspect_project(tmp_path, options=_CACHED) == cold
+
+
+def test_inconsistent_cache_falls_back_to_cold_scan(tmp_path: Path) -> None:
+    """
+    A cached listing that no longer matches the disk (without an mtime change) must
+    not leak into the result or surface an error the cold scan would not raise.
+    """
+    _make_tree(tmp_path)
+    _warm_cache(tmp_path)
+
+    cache_file = tmp_path / _CACHE_REL
+    data = json.loads(cache_file.read_text(encoding="utf-8"))
+    data["dirs"]["src"][2].insert(0, ["ghost", "dir"])
+    cache_file.write_text(json.dumps(data), encoding="utf-8")
+    _age_tree(tmp_path)
+
+    assert introspect_project(tmp_path, options=_CACHED) == introspect_project(tmp_path)
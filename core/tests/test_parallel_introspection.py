@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from cairn_core.projects.init import init_project
+from cairn_core.projects.introspect import ScanOptions, introspect_project
+from cairn_core.projects.traversal import ParallelDirLister, iter_tree_deterministic
+
+
+def _random_tree(root: Path, seed: int) -> None:
+    rnd = random.Random(seed)
+    names = ["a", "a-b", "a.txt", "B", "z", ".git", "__pycache__", "venv", "m.py"]
+    dirs = [root]
+    for _ in range(60):
+        target = rnd.choice(dirs) / rnd.choice(names)
+        if target.exists():
+            continue
+        if rnd.random() < 0.4:
+            target.mkdir()
+            dirs.append(target)
+        else:
+            target.write_text("x", encoding="utf-8")
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_parallel_introspection_matches_sequential(tmp_path: Path, seed: int) -> None:
+    init_project(tmp_path, "test-project")
+    _random_tree(tmp_path, seed)
+
+    parallel = introspect_project(tmp_path, options=ScanOptions(workers=4))
+    assert parallel == introspect_project(tmp_path)
+
+
+@pytest.mark.parametrize("max_pending", [1, 2, 64])
+def test_parallel_walk_order_is_independent_of_prefetch_depth(
+    tmp_path: Path, max_pending: int
+) -> None:
+    _random_tree(tmp_path, 99)
+
+    expected = iter_tree_deterministic(tmp_path, max_depth=4)
+    with ParallelDirLister(3, max_depth=4, max_pending=max_pending) as lister:
+        actual = iter_tree_deterministic(tmp_path, max_depth=4, lister=lister)
+
+    assert actual == expected
+
+
+def test_parallel_walk_reports_first_error_in_traversal_order(tmp_path: Path) -> None:
+    """
+    With several symlinks in the tree, the one the sequential walker meets first
+    must be the one reported, whatever order the listings complete in.
+    """
+    (tmp_path / "a").mkdir()
+    (tmp_path / "z").mkdir()
+    (tmp_path / "target").mkdir()
+    try:
+        (tmp_path / "a" / "link").symlink_to(tmp_path / "target")
+        (tmp_path / "z" / "link").symlink_to(tmp_path / "target")
+    except OSError as e:
+        pytest.skip(f"Symlink creation not permitted on this system: {e}")
+
+    with pytest.raises(Exception) as sequential:
+        iter_tree_deterministic(tmp_path, max_depth=5)
+
+    with ParallelDirLister(4, max_depth=5) as lister:
+        with pytest.raises(Exception) as parallel:
+            iter_tree_deterministic(tmp_path, max_depth=5, lister=lister)
+
+    assert parallel.value.code == sequential.value.code == "introspect_symlink_detected"
+    assert str(parallel.value) == str(sequential.value)
+
+
+def test_parallel_walk_enforces_depth_limit(tmp_path: Path) -> None:
+    init_project(tmp_path, "test-project")
+    cur = tmp_path
+    for i in range(27):
+        cur = cur / f"d{i}"
+        cur.mkdir()
+
+    with pytest.raises(Exception) as excinfo:
+        introspect_project(tmp_path, options=ScanOptions(workers=4))
+
+    assert excinfo.value.code == "introspection_scan_limit_exceeded"
+
+
+def test_parallel_and_cache_cannot_be_combined() -> None:
+    with pytest.raises(ValueError):
+        ScanOptions(use_cache=True, workers=4)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from cairn_core.projects.init import init_project
+from cairn_core.projects.introspect import introspect_project
+from cairn_core.projects.path_table import PathTable
+from cairn_core.projects.traversal import IntrospectionEntry, iter_tree_deterministic
+
+
+def _make_tree(root: Path) -> None:
+    init_project(root, "test-project")
+    for top in ("a", "b"):
+        for sub in ("pkg", "pkg-x"):
+            d = root / top / sub
+            d.mkdir(parents=True)
+            (d / "__init__.py").write_text("x", encoding="utf-8")
+            (d / "mod.py").write_text("x", encoding="utf-8")
+    (root / "README.md").write_text("x", encoding="utf-8")
+
+
+def test_path_table_round_trips_traversal_entries(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    entries = iter_tree_deterministic(tmp_path, max_depth=10)[1:]
+
+    table = PathTable(entries)
+
+    assert len(table) == len(entries)
+    assert list(table.iter_entries()) == entries
+    assert [table.entry(i) for i in range(len(table))] == entries
+    assert table == PathTable(entries)
+
+
+def test_path_table_interns_repeated_names(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    table = PathTable(iter_tree_deterministic(tmp_path, max_depth=10)[1:])
+
+    assert table._strings.count("__init__.py") == 1
+    assert table._strings.count("pkg") == 1
+
+
+def test_path_table_rejects_entries_out_of_traversal_order() -> None:
+    with pytest.raises(ValueError):
+        PathTable([IntrospectionEntry("a/b", "file", 2)])
+
+
+def test_relative_paths_view_behaves_like_a_sequence(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    result = introspect_project(tmp_path)
+    rels = result.relative_paths
+    expected = [e.relative_path for e in result.entries]
+
+    assert rels == expected
+    assert rels == tuple(expected)
+    assert list(rels) == expected
+    assert rels[0] == expected[0]
+    assert rels[-1] == expected[-1]
+    assert rels[1:3] == expected[1:3]
+    assert "a/pkg/mod.py" in rels
+    assert rels.index("README.md") == expected.index("README.md")
+    assert rels != expected[:-1]
+
+    with pytest.raises(IndexError):
+        rels[len(expected)]
@@ -1,30 +1,307 @@
 from __future__ import annotations
 
+import random
+
 import pytest
 
-from cairn_core.policy.evaluate import evaluate_policy
-from cairn_core.policy.schema import PolicyPack, PolicyPackMeta
-from cairn_core.reporting.schema import AnalysisSnapshot
+from cairn_core.policy.compile import compile_policy
+from cairn_core.policy.evaluate import (
+    PolicyEvaluationError,
+    evaluate_policy,
+    evaluate_policy_batch,
+)
+from cairn_core.policy.schema import (
+    PolicyPack,
+    PolicyPackMeta,
+    RemediationRef,
+    Rule,
+    SeverityModel,
+    StandardsRef,
+)
+from cairn_core.reporting.schema import (
+    AnalysisSnapshot,
+    Evidence,
+    Finding,
+    RemediationLink,
+    StandardsLink,
+)
+from cairn_core.serialization import to_json_bytes
 
+_PRESENT = "analysis_marker_present"
+_MISSING = "analysis_marker_missing"
+_EXT_MIN = "analysis_extension_count_at_least"
+_EXT_MAX = "analysis_extension_count_at_most"
+_DEPTH = "analysis_max_depth_at_most"
 
-def test_evaluate_policy_stub_raises_not_implemented_on_valid_inputs() -> None:
-    policy = PolicyPack(
-        meta=PolicyPackMeta(policy_pack_id="test-pack", version="0.0.1"),
-        rules=(),
-    )
 
-    analysis = AnalysisSnapshot(
-        entry_count=0,
-        dir_count=0,
-        max_depth=0,
+def _analysis(**overrides) -> AnalysisSnapshot:
+    values = dict(
+        entry_count=10,
+        dir_count=2,
+        max_depth=3,
         files=(),
         dirs=(),
-        ext_counts={},
+        ext_counts={".py": 4, ".md": 1},
         has_readme=False,
-        has_pyproject=False,
+        has_pyproject=True,
         has_requirements=False,
         cairn_aware=True,
     )
+    values.update(overrides)
+    return AnalysisSnapshot(**values)
+
+
+def _pack(*rules: Rule, content_hash: str | None = None, **meta) -> PolicyPack:
+    return PolicyPack(
+        meta=PolicyPackMeta(
+            policy_pack_id="test-pack",
+            version="0.0.1",
+            content_hash=content_hash,
+            **meta,
+        ),
+        rules=rules,
+    )
+
+
+def _rule(rule_id: str, kind: str, severity: str = "low", **kwargs) -> Rule:
+    return Rule(
+        rule_id=rule_id,
+        title=rule_id.upper(),
+        kind=kind,  # type: ignore[arg-type]
+        severity=severity,  # type: ignore[arg-type]
+        **kwargs,
+    )
+
+
+def test_evaluate_policy_with_no_rules_returns_no_findings() -> None:
+    assert evaluate_policy(_pack(), _analysis()) == ()
+
+
+def test_evaluate_policy_applies_each_rule_kind() -> None:
+    pack = _pack(
+        _rule("readme", "analysis_marker_present", params={"marker": "readme"}),
+        _rule("no-pyproject", _MISSING, params={"marker": "pyproject"}),
+        _rule("py-min", _EXT_MIN, params={"ext": ".PY", "min": 5}),
+        _rule("md-max", _EXT_MAX, params={"ext": ".md", "max": 0}),
+        _rule("depth", "analysis_max_depth_at_most", params={"max": 2}),
+        _rule("dirs", "analysis_dir_count_at_least", params={"min": 3}),
+        _rule("entries", "analysis_entry_count_at_most", params={"max": 9}),
+    )
+
+    findings = evaluate_policy(pack, _analysis())
+
+    assert {f.rule_id: f.evidence.items for f in findings} == {
+        "readme": {"marker": "readme", "present": False},
+        "no-pyproject": {"marker": "pyproject", "present": True},
+        "py-min": {"ext": ".py", "count": 4, "min_required": 5},
+        "md-max": {"ext": ".md", "count": 1, "max_allowed": 0},
+        "depth": {"max_depth": 3, "max_allowed": 2},
+        "dirs": {"dir_count": 2, "min_required": 3},
+        "entries": {"entry_count": 10, "max_allowed": 9},
+    }
+
+
+def test_evaluate_policy_returns_nothing_when_requirements_hold() -> None:
+    pack = _pack(
+        _rule("readme", "analysis_marker_present", params={"marker": "readme"}),
+        _rule("py-max", _EXT_MAX, params={"ext": ".py", "max": 4}),
+        _rule("rs-max", _EXT_MAX, params={"ext": ".rs", "max": 0}),
+    )
+
+    assert evaluate_policy(pack, _analysis(has_readme=True)) == ()
+
+
+def test_evaluate_policy_orders_by_severity_then_rule_id() -> None:
+    pack = _pack(
+        _rule("b", "analysis_max_depth_at_most", "low", params={"max": 0}),
+        _rule("a", "analysis_max_depth_at_most", "low", params={"max": 0}),
+        _rule("z", "analysis_max_depth_at_most", "critical", params={"max": 0}),
+        _rule("m", "analysis_max_depth_at_most", "info", params={"max": 0}),
+    )
+
+    findings = evaluate_policy(pack, _analysis())
+
+    assert [f.rule_id for f in findings] == ["z", "a", "b", "m"]
+
+
+def test_evaluate_policy_builds_full_findings() -> None:
+    pack = _pack(
+        _rule(
+            "readme",
+            "analysis_marker_present",
+            "high",
+            params={"marker": "readme"},
+            remediation=(RemediationRef(project_id="remediate/add_readme"),),
+            standards=(StandardsRef(scheme="CIS", ref="1.1", url="https://x"),),
+            rationale="README documents ownership",
+        )
+    )
+
+    assert evaluate_policy(pack, _analysis()) == (
+        Finding(
+            rule_id="readme",
+            severity="high",
+            title="README",
+            evidence=Evidence({"marker": "readme", "present": False}),
+            remediation=(RemediationLink(project_id="remediate/add_readme"),),
+            standards=(StandardsLink(scheme="CIS", ref="1.1", url="https://x"),),
+            rationale="README documents ownership",
+        ),
+    )
+
+
+def test_disabled_and_out_of_env_rules_are_pruned() -> None:
+    pack = _pack(
+        _rule("off", "analysis_max_depth_at_most", params={"max": 0}, enabled=False),
+        _rule(
+            "strict",
+            "analysis_max_depth_at_most",
+            params={"max": 0},
+            target_envs=("regulated",),
+        ),
+        _rule("on", "analysis_max_depth_at_most", params={"max": 0}),
+    )
+
+    assert [r.rule_id for r in compile_policy(pack).rules] == ["on"]
+    assert [
+        f.rule_id for f in evaluate_policy(pack, _analysis(), target_env="regulated")
+    ] == ["strict"]
+
+
+@pytest.mark.parametrize(
+    "rule, code",
+    [
+        (_rule("r", _PRESENT, params={}), "policy_rule_params_invalid"),
+        (
+            _rule("r", "analysis_marker_present", params={"marker": "license"}),
+            "policy_rule_params_invalid",
+        ),
+        (
+            _rule("r", "analysis_max_depth_at_most", params={"max": 1, "min": 0}),
+            "policy_rule_params_invalid",
+        ),
+        (
+            _rule("r", "analysis_max_depth_at_most", params={"max": -1}),
+            "policy_rule_params_invalid",
+        ),
+        (
+            _rule("r", "analysis_max_depth_at_most", params={"max": True}),
+            "policy_rule_params_invalid",
+        ),
+        (
+            _rule("r", _EXT_MIN, params={"ext": "py", "min": 1}),
+            "policy_rule_params_invalid",
+        ),
+        (_rule("r", "analysis_file_contains", params={}), "policy_rule_kind_unknown"),
+        (
+            _rule("r", "analysis_max_depth_at_most", "urgent", params={"max": 1}),
+            "policy_rule_severity_invalid",
+        ),
+        (
+            _rule(
+                "r",
+                "analysis_max_depth_at_most",
+                params={"max": 1},
+                target_envs=("lab",),
+            ),
+            "policy_target_env_invalid",
+        ),
+        (
+            _rule("r", _DEPTH, params={"max": 1}, enabled=False),
+            None,
+        ),
+    ],
+)
+def test_compile_policy_validates_rules_once(rule: Rule, code: str | None) -> None:
+    # The last case is valid: disabled rules still compile.
+    if code is None:
+        assert compile_policy(_pack(rule)).rules == ()
+        return
+
+    with pytest.raises(PolicyEvaluationError) as excinfo:
+        compile_policy(_pack(rule))
+
+    assert excinfo.value.code == code
+
+
+def test_disabled_rules_are_still_validated() -> None:
+    rule = _rule("r", "analysis_max_depth_at_most", params={}, enabled=False)
+
+    with pytest.raises(PolicyEvaluationError) as excinfo:
+        compile_policy(_pack(rule))
+
+    assert excinfo.value.code == "policy_rule_params_invalid"
+
+
+def test_compile_policy_rejects_duplicates_and_restricted_severities() -> None:
+    rule = _rule("r", "analysis_max_depth_at_most", "info", params={"max": 1})
+
+    with pytest.raises(PolicyEvaluationError) as excinfo:
+        compile_policy(_pack(rule, rule))
+    assert excinfo.value.code == "policy_rule_duplicate_id"
+
+    restricted = PolicyPack(
+        meta=PolicyPackMeta(policy_pack_id="p", version="1"),
+        severity_model=SeverityModel(allowed=("high", "critical")),
+        rules=(rule,),
+    )
+    with pytest.raises(PolicyEvaluationError) as excinfo:
+        compile_policy(restricted)
+    assert excinfo.value.code == "policy_rule_severity_invalid"
+
+
+def test_compiled_policy_is_cached_by_content_hash() -> None:
+    rule = _rule("r", "analysis_max_depth_at_most", params={"max": 1})
+    pack = _pack(rule, content_hash="cd" * 32)
+
+    compiled = compile_policy(pack)
+
+    assert compile_policy(_pack(rule, content_hash="cd" * 32)) is compiled
+    assert compile_policy(pack, target_env="regulated") is not compiled
+    assert compile_policy(_pack(rule)) is compile_policy(_pack(rule))
+    assert compiled.rules_by_kind == {"analysis_max_depth_at_most": compiled.rules}
+
+
+def test_evaluate_policy_batch_matches_per_snapshot_evaluation() -> None:
+    rng = random.Random(7)
+    exts = (".py", ".md", "")
+    rules = [
+        _rule("readme", _PRESENT, "medium", params={"marker": "readme"}),
+        _rule("reqs", _MISSING, "info", params={"marker": "requirements"}),
+        _rule("entries", "analysis_entry_count_at_most", "high", params={"max": 50}),
+        _rule("dirs", "analysis_dir_count_at_least", params={"min": 2}),
+        _rule("depth", _DEPTH, "critical", params={"max": 4}),
+    ]
+    for i, ext in enumerate(exts):
+        rules.append(_rule(f"min{i}", _EXT_MIN, "high", params={"ext": ext, "min": 3}))
+        rules.append(_rule(f"max{i}", _EXT_MAX, params={"ext": ext, "max": 5}))
+    snapshots = [
+        _analysis(
+            entry_count=rng.randrange(100),
+            dir_count=rng.randrange(5),
+            max_depth=rng.randrange(8),
+            ext_counts={e: rng.randrange(10) for e in exts if rng.random() < 0.5},
+            has_readme=rng.random() < 0.5,
+            has_requirements=rng.random() < 0.5,
+        )
+        for _ in range(200)
+    ]
+    pack = _pack(*rules)
+
+    batch = evaluate_policy_batch(pack, iter(snapshots))
+
+    assert batch == tuple(evaluate_policy(pack, s) for s in snapshots)
+    assert len({len(findings) for findings in batch}) > 1
+    assert evaluate_policy_batch(pack, []) == ()
+
+
+def test_evaluate_policy_batch_shares_read_only_findings() -> None:
+    pack = _pack(_rule("depth", _DEPTH, params={"max": 1}))
+    snapshots = [_analysis(max_depth=3), _analysis(max_depth=3)]
+
+    first, second = evaluate_policy_batch(pack, snapshots)
 
-    with pytest.raises(NotImplementedError):
-        evaluate_policy(policy, analysis)
+    assert first[0] is second[0]
+    with pytest.raises(TypeError):
+        first[0].evidence.items["note"] = "annotated"  # type: ignore[index]
+    assert to_json_bytes(first) == to_json_bytes(evaluate_policy(pack, snapshots[0]))
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+import cairn_core.policy.compile as compile_module
+from cairn_core.policy import (
+    PolicyError,
+    PolicyPack,
+    PolicyPackMeta,
+    Rule,
+    clear_compiled_policies,
+    compile_policy,
+    evaluate_report,
+    policy_content_hash,
+    policy_pin,
+    with_content_hash,
+)
+from cairn_core.reporting.schema import (
+    AnalysisSnapshot,
+    CairnReport,
+    PolicyPin,
+    ReportMeta,
+)
+
+
+def _pack(params: dict | None = None, version: str = "1.0.0") -> PolicyPack:
+    return PolicyPack(
+        meta=PolicyPackMeta(policy_pack_id="pack", version=version),
+        rules=(
+            Rule(
+                rule_id="py.min",
+                title="Python files",
+                kind="analysis_extension_count_at_least",
+                severity="medium",
+                params=params if params is not None else {"ext": ".py", "min": 1},
+            ),
+        ),
+    )
+
+
+def test_content_hash_is_canonical_and_excludes_itself() -> None:
+    a = _pack({"ext": ".py", "min": 1})
+    b = _pack({"min": 1, "ext": ".py"})
+    pinned = with_content_hash(a)
+
+    assert policy_content_hash(a) == policy_content_hash(b)
+    assert len(policy_content_hash(a)) == 64
+    assert pinned.meta.content_hash == policy_content_hash(a)
+    assert policy_content_hash(pinned) == policy_content_hash(a)
+    assert with_content_hash(pinned) is pinned
+    other = _pack({"ext": ".py", "min": 2})
+    assert policy_content_hash(other) != pinned.meta.content_hash
+
+
+def test_content_hash_rejects_non_canonical_values() -> None:
+    with pytest.raises(PolicyError) as excinfo:
+        policy_content_hash(_pack({1: "x"}))
+
+    assert excinfo.value.code == "policy_pack_unhashable"
+
+
+def test_compiled_packs_are_cached_by_identity_and_hash(monkeypatch) -> None:
+    clear_compiled_policies()
+    calls = []
+    real_compile = compile_module._compile
+    monkeypatch.setattr(
+        compile_module,
+        "_compile",
+        lambda policy, env: calls.append(env) or real_compile(policy, env),
+    )
+    pinned = with_content_hash(_pack())
+
+    first = compile_policy(pinned)
+    assert compile_policy(with_content_hash(_pack())) is first
+    compile_policy(pinned, target_env="regulated")
+    compile_policy(pinned, target_env="regulated")
+    compile_policy(with_content_hash(_pack(version="1.0.1")))
+    compile_policy(_pack())
+
+    assert calls == ["general", "regulated", "general", "general"]
+
+
+def test_changed_rules_under_the_same_meta_are_recompiled() -> None:
+    clear_compiled_policies()
+    pinned = with_content_hash(_pack())
+    stale = replace(
+        pinned, rules=(replace(pinned.rules[0], params={"ext": ".py", "min": 5}),)
+    )
+
+    first = compile_policy(pinned)
+    recompiled = compile_policy(stale)
+
+    assert recompiled is not first
+    assert recompiled.rules[0].test.threshold == 5
+    with pytest.raises(PolicyError) as excinfo:
+        policy_pin(stale)
+    assert excinfo.value.code == "policy_pack_hash_mismatch"
+
+
+def test_pinned_packs_are_not_rehashed(monkeypatch) -> None:
+    import cairn_core.policy.evaluate as evaluate_module
+    import cairn_core.policy.hashing as hashing_module
+
+    clear_compiled_policies()
+    pinned = with_content_hash(_pack())
+    compiled = compile_policy(pinned)
+    calls = []
+    real_hash = hashing_module.policy_content_hash
+
+    def counting_hash(policy: PolicyPack) -> str:
+        calls.append(policy)
+        return real_hash(policy)
+
+    monkeypatch.setattr(compile_module, "policy_content_hash", counting_hash)
+    monkeypatch.setattr(evaluate_module, "policy_content_hash", counting_hash)
+
+    assert compile_policy(pinned) is compiled
+    assert compile_policy(with_content_hash(_pack())) is compiled
+    assert calls == []
+
+    report = CairnReport(
+        meta=ReportMeta(),
+        policy=PolicyPin(
+            policy_pack_id="unassigned", version="0.0.0", schema_version="1.0"
+        ),
+        project_ref="proj",
+        analysis=AnalysisSnapshot(entry_count=0, dir_count=0, max_depth=0),
+    )
+    evaluate_report(_pack(), report)
+    assert len(calls) == 1
+
+
+def test_compiled_pack_cache_is_bounded(monkeypatch) -> None:
+    clear_compiled_policies()
+    monkeypatch.setattr(compile_module, "_COMPILED_CACHE_SIZE", 2)
+    packs = [with_content_hash(_pack(version=f"1.0.{i}")) for i in range(3)]
+
+    first = compile_policy(packs[0])
+    compile_policy(packs[1])
+    compile_policy(packs[2])
+
+    assert compile_policy(packs[0]) is not first
+
+
+def test_evaluate_report_pins_policy_and_fills_findings() -> None:
+    report = CairnReport(
+        meta=ReportMeta(),
+        policy=PolicyPin(
+            policy_pack_id="unassigned", version="0.0.0", schema_version="1.0"
+        ),
+        project_ref="proj",
+        analysis=AnalysisSnapshot(entry_count=0, dir_count=0, max_depth=0),
+    )
+    pack = _pack()
+
+    evaluated = evaluate_report(pack, report)
+
+    assert evaluated.policy == policy_pin(with_content_hash(pack))
+    assert evaluated.policy.content_hash == policy_content_hash(pack)
+    assert [f.rule_id for f in evaluated.findings] == ["py.min"]
+    assert replace(evaluated, policy=report.policy, findings=()) == report
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from cairn_core.policy import (
+    PolicyPack,
+    PolicyPackMeta,
+    Rule,
+    compile_policy,
+    lint_policy,
+)
+
+
+def _rule(rule_id: str, kind: str, **params) -> Rule:
+    return Rule(
+        rule_id=rule_id,
+        title=rule_id,
+        kind=kind,  # type: ignore[arg-type]
+        severity="low",
+        params=params,
+    )
+
+
+def _pack(*rules: Rule) -> PolicyPack:
+    return PolicyPack(
+        meta=PolicyPackMeta(policy_pack_id="lint-pack", version="1.0.0"),
+        rules=rules,
+    )
+
+
+def _issues(pack: PolicyPack) -> list[tuple[str, tuple[str, str]]]:
+    return [(i.code, i.rule_ids) for i in lint_policy(pack).issues]
+
+
+def test_lint_reports_subsumed_rules() -> None:
+    pack = _pack(
+        _rule("py5", "analysis_extension_count_at_least", ext=".py", min=5),
+        _rule("py3", "analysis_extension_count_at_least", ext=".py", min=3),
+        _rule("md3", "analysis_extension_count_at_least", ext=".md", min=3),
+        _rule("depth4", "analysis_max_depth_at_most", max=4),
+        _rule("depth8", "analysis_max_depth_at_most", max=8),
+    )
+
+    assert _issues(pack) == [
+        ("subsumed", ("depth8", "depth4")),
+        ("subsumed", ("py3", "py5")),
+    ]
+
+
+def test_lint_reports_contradictions_and_duplicates() -> None:
+    pack = _pack(
+        _rule("readme", "analysis_marker_present", marker="readme"),
+        _rule("no-readme", "analysis_marker_missing", marker="readme"),
+        _rule("readme-again", "analysis_marker_present", marker="readme"),
+        _rule("py-min", "analysis_extension_count_at_least", ext=".py", min=5),
+        _rule("py-max", "analysis_extension_count_at_most", ext=".py", max=2),
+        _rule("md-min", "analysis_extension_count_at_least", ext=".md", min=2),
+        _rule("md-max", "analysis_extension_count_at_most", ext=".md", max=2),
+    )
+
+    assert _issues(pack) == [
+        ("contradictory", ("no-readme", "readme")),
+        ("contradictory", ("no-readme", "readme-again")),
+        ("contradictory", ("py-max", "py-min")),
+        ("duplicate", ("readme", "readme-again")),
+    ]
+
+
+def test_lint_counts_shared_column_reads() -> None:
+    pack = _pack(
+        _rule("readme", "analysis_marker_present", marker="readme"),
+        _rule("no-readme", "analysis_marker_missing", marker="readme"),
+        _rule("py", "analysis_extension_count_at_most", ext=".PY", max=9),
+        _rule("py3", "analysis_extension_count_at_least", ext=".py", min=3),
+        _rule("dirs", "analysis_dir_count_at_least", min=1),
+    )
+
+    report = lint_policy(pack)
+
+    assert (report.rule_count, report.column_reads) == (5, 3)
+    assert len(compile_policy(pack).columns) == 3
+    assert report.issues[0].message.startswith("no-readme (fires when")
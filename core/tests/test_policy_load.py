@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+import yaml
+
+from cairn_core.policy import (
+    PolicyError,
+    PolicyPack,
+    load_policy_pack,
+    policy_cache_path,
+    policy_content_hash,
+    with_content_hash,
+)
+from cairn_core.serialization import to_json_bytes
+
+_PACK = """\
+meta:
+  policy_pack_id: test-pack
+  version: "1.0.0"
+  description: Test pack
+  jurisdiction:
+    regions: [US, EU]
+rules:
+  - rule_id: proj.readme.required
+    title: README present
+    kind: analysis_marker_present
+    severity: low
+    params: {marker: readme}
+    remediation:
+      - project_id: remediate/add_readme
+    standards:
+      - {scheme: CIS, ref: "1.1"}
+  - rule_id: proj.depth
+    title: Shallow tree
+    kind: analysis_max_depth_at_most
+    severity: high
+    enabled: false
+    target_envs: [regulated]
+    params: {max: 8}
+"""
+
+
+def _write(tmp_path: Path, text: str = _PACK) -> Path:
+    path = tmp_path / "pack.yaml"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_load_policy_pack_builds_pinned_pack(tmp_path: Path) -> None:
+    pack = load_policy_pack(_write(tmp_path), use_cache=False)
+
+    assert pack.meta.policy_pack_id == "test-pack"
+    assert pack.meta.jurisdiction.regions == ("US", "EU")
+    assert [r.rule_id for r in pack.rules] == ["proj.readme.required", "proj.depth"]
+    assert pack.rules[0].remediation[0].safe_by_default is True
+    assert pack.rules[0].standards[0].ref == "1.1"
+    assert pack.rules[1].target_envs == ("regulated",)
+    assert pack.meta.content_hash == policy_content_hash(pack)
+    assert not policy_cache_path(tmp_path / "pack.yaml").exists()
+
+
+def test_second_load_uses_cache_without_parsing(tmp_path: Path, monkeypatch) -> None:
+    path = _write(tmp_path)
+    first = load_policy_pack(path)
+    assert policy_cache_path(path).is_file()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML parsed despite a valid cache")
+
+    monkeypatch.setattr(yaml, "load", fail)
+
+    assert load_policy_pack(path) == first
+
+
+def test_changed_source_invalidates_cache(tmp_path: Path) -> None:
+    path = _write(tmp_path)
+    first = load_policy_pack(path)
+
+    _write(tmp_path, _PACK.replace("max: 8", "max: 9"))
+    second = load_policy_pack(path)
+
+    assert second.rules[1].params == {"max": 9}
+    assert second.meta.content_hash != first.meta.content_hash
+
+
+@pytest.mark.parametrize("junk", [b"", b"{", b'{"version": 1}', b"\xff"])
+def test_corrupt_cache_is_ignored(tmp_path: Path, junk: bytes) -> None:
+    path = _write(tmp_path)
+    expected = load_policy_pack(path, use_cache=False)
+    policy_cache_path(path).write_bytes(junk)
+
+    assert load_policy_pack(path) == expected
+    assert load_policy_pack(path) == expected
+
+
+def _tamper_cache(
+    path: Path, pack: PolicyPack, max_depth: int, *, rehash: bool
+) -> None:
+    rules = list(pack.rules)
+    rules[1] = replace(rules[1], params={"max": max_depth})
+    tampered = replace(pack, rules=tuple(rules))
+    if rehash:
+        tampered = with_content_hash(tampered)
+
+    cache = policy_cache_path(path)
+    data = json.loads(cache.read_bytes())
+    data["pack"] = json.loads(to_json_bytes(tampered))
+    cache.write_text(json.dumps(data), encoding="utf-8")
+
+
+@pytest.mark.parametrize(
+    "max_depth, rehash",
+    [
+        (99, False),  # stored hash no longer matches the pack
+        (-1, True),  # consistent hash, but the rule fails validation
+    ],
+)
+def test_tampered_cache_falls_back_to_source(
+    tmp_path: Path, max_depth: int, rehash: bool
+) -> None:
+    path = _write(tmp_path)
+    expected = load_policy_pack(path)
+    _tamper_cache(path, expected, max_depth, rehash=rehash)
+
+    assert load_policy_pack(path) == expected
+    # The tampered cache was replaced by a fresh one.
+    cached = json.loads(policy_cache_path(path).read_bytes())["pack"]
+    assert cached["rules"][1]["params"] == {"max": 8}
+
+
+@pytest.mark.parametrize(
+    "text, code",
+    [
+        ("meta: [", "policy_pack_invalid_yaml"),
+        ("", "policy_pack_invalid"),
+        ("rules: []\n", "policy_pack_invalid"),
+        (_PACK + "extra: 1\n", "policy_pack_invalid"),
+        (_PACK.replace('"1.0.0"', "1.0"), "policy_pack_invalid"),
+        (_PACK.replace("enabled: false", "enabled: nope"), "policy_pack_invalid"),
+        (
+            _PACK.replace("version:", 'schema_version: "2.0"\n  version:'),
+            "policy_pack_schema_unsupported",
+        ),
+        (_PACK.replace("{max: 8}", "{max: -1}"), "policy_rule_params_invalid"),
+        (
+            _PACK.replace("severity: high", "severity: urgent"),
+            "policy_rule_severity_invalid",
+        ),
+        (
+            _PACK.replace("analysis_max_depth", "analysis_min_depth"),
+            "policy_rule_kind_unknown",
+        ),
+        (
+            _PACK.replace("version:", 'content_hash: "00"\n  version:'),
+            "policy_pack_hash_mismatch",
+        ),
+    ],
+)
+def test_load_policy_pack_rejects_invalid_packs(
+    tmp_path: Path, text: str, code: str
+) -> None:
+    path = _write(tmp_path, text)
+
+    with pytest.raises(PolicyError) as excinfo:
+        load_policy_pack(path)
+
+    assert excinfo.value.code == code
+    assert not policy_cache_path(path).exists()
+
+
+def test_load_policy_pack_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(PolicyError) as excinfo:
+        load_policy_pack(tmp_path / "missing.yaml")
+
+    assert excinfo.value.code == "policy_pack_io_error"
@@ -167,3 +167,43 @@ def test_analyze_markers_readme_pyproject_requirements(tmp_path: Path) -> None:
     assert analysis.markers.has_readme is True
     assert analysis.markers.has_pyproject is True
     assert analysis.markers.has_requirements is True
+
+
+def test_analyze_issues_no_filesystem_calls_after_traversal(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """
+    Aggregation runs over the typed entries recorded during traversal; it must not
+    stat any path again.
+    """
+    import cairn_core.projects.analyze as analyze_mod
+    from cairn_core.projects.analyze import analyze_from_context
+    from cairn_core.projects.init import init_project
+    from cairn_core.projects.introspect import introspect_from_context
+    from cairn_core.projects.load import load_project
+
+    init_project(tmp_path, "test-project")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text("x", encoding="utf-8")
+    (tmp_path / "README.md").write_text("x", encoding="utf-8")
+
+    project = load_project(tmp_path)
+    intro = introspect_from_context(project)
+    monkeypatch.setattr(
+        analyze_mod, "introspect_from_context", lambda _p, **_kwargs: intro
+    )
+
+    def no_stat(*_args, **_kwargs):
+        raise AssertionError("unexpected filesystem call during aggregation")
+
+    with monkeypatch.context() as m:
+        m.setattr(Path, "is_file", no_stat)
+        m.setattr(Path, "is_dir", no_stat)
+        m.setattr(Path, "stat", no_stat)
+
+        analysis = analyze_from_context(project)
+
+    assert analysis.extension_counts == {".yaml": 1, ".py": 1, ".md": 1}
+    assert analysis.dir_counts == {"src": 1, "": 1}
+    assert analysis.max_depth == 1
+    assert analysis.markers.has_readme is True
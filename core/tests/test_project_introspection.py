@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 import pytest
 
 from cairn_core.projects.introspect import ProjectIntrospection, introspect_project
@@ -129,7 +131,7 @@ def test_introspect_records_sorted_relative_paths(tmp_path):
     result = introspect_project(tmp_path)
 
     rels = result.relative_paths
-    assert isinstance(rels, list)
+    assert isinstance(rels, Sequence)
     assert all(isinstance(x, str) for x in rels)
 
     # Root must NOT appear
@@ -183,3 +185,250 @@ def test_introspect_excludes_dot_git(tmp_path):
 
     assert ".git" not in result.relative_paths
     assert ".git/config" not in result.relative_paths
+
+
+def test_introspect_prunes_spec_exclusions_and_records_ignored_paths(
+    tmp_path, monkeypatch
+):
+    """
+    Spec: excluded directories are never visited (not even listed) and are
+    recorded, sorted, in ignored_paths.
+    """
+    import cairn_core.projects.traversal as traversal
+    from cairn_core.projects.init import init_project
+
+    init_project(tmp_path, "test-project")
+
+    excluded = [
+        ".git",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".venv",
+        "__pycache__",
+        "node_modules",
+        "venv",
+    ]
+    for name in excluded:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "x.py").write_text("x", encoding="utf-8")
+    (tmp_path / "web" / "node_modules" / "pkg").mkdir(parents=True)
+
+    listed = []
+    real_scan_dir = traversal.scan_dir
+
+    def counting_scan_dir(dir_path):
+        listed.append(dir_path)
+        return real_scan_dir(dir_path)
+
+    monkeypatch.setattr(traversal, "scan_dir", counting_scan_dir)
+
+    result = introspect_project(tmp_path)
+
+    assert result.relative_paths == [".cairn", ".cairn/manifest.yaml", "web"]
+    assert result.ignored_paths == tuple(sorted(excluded + ["web/node_modules"]))
+    visited_dirs = (tmp_path, tmp_path / ".cairn", tmp_path / "web")
+    assert sorted(listed) == sorted(str(d) for d in visited_dirs)
+
+
+def test_introspect_applies_manifest_exclusions(tmp_path):
+    from cairn_core.projects.init import init_project
+
+    init_project(tmp_path, "test-project")
+    with (tmp_path / ".cairn" / "manifest.yaml").open("a", encoding="utf-8") as f:
+        f.write("exclude:\n- dist\n- '*.egg-info'\n")
+
+    (tmp_path / "dist").mkdir()
+    (tmp_path / "src" / "cairn.egg-info").mkdir(parents=True)
+    (tmp_path / "src" / "main.py").write_text("x", encoding="utf-8")
+    (tmp_path / "src" / "Cairn.EGG-INFO").write_text("x", encoding="utf-8")
+
+    result = introspect_project(tmp_path)
+
+    assert result.ignored_paths == ("dist", "src/cairn.egg-info")
+    # Patterns match case-sensitively on every platform.
+    assert "src/Cairn.EGG-INFO" in result.relative_paths
+
+
+def test_introspect_does_not_apply_exclusions_to_root(tmp_path):
+    from cairn_core.projects.init import init_project
+
+    root = tmp_path / "venv"
+    root.mkdir()
+    init_project(root, "test-project")
+
+    result = introspect_project(root)
+
+    assert ".cairn/manifest.yaml" in result.relative_paths
+
+
+def test_introspect_traversal_order_is_depth_first_by_name(tmp_path):
+    """
+    Traversal order is depth-first with children sorted by name, so a directory's
+    contents appear directly after it (even when a sibling name sorts between them).
+    """
+    from cairn_core.projects.init import init_project
+
+    init_project(tmp_path, "test-project")
+
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "x.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "a-b.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "B").mkdir()
+
+    result = introspect_project(tmp_path)
+
+    assert result.relative_paths == [
+        ".cairn",
+        ".cairn/manifest.yaml",
+        "B",
+        "a",
+        "a/x.txt",
+        "a-b.txt",
+    ]
+    assert result.entry_count == len(result.relative_paths) + 1
+
+
+def test_introspect_entries_are_typed_and_parallel_to_relative_paths(tmp_path):
+    """
+    Introspection carries each entry's kind and depth forward from traversal.
+    """
+    from cairn_core.projects.init import init_project
+
+    init_project(tmp_path, "test-project")
+
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text("x", encoding="utf-8")
+
+    result = introspect_project(tmp_path)
+
+    assert [e.relative_path for e in result.entries] == result.relative_paths
+    by_path = {e.relative_path: (e.kind, e.depth) for e in result.entries}
+    assert by_path[".cairn"] == ("dir", 1)
+    assert by_path[".cairn/manifest.yaml"] == ("file", 2)
+    assert by_path["src"] == ("dir", 1)
+    assert by_path["src/main.py"] == ("file", 2)
+
+
+def test_introspect_file_limit_exceeded_is_error(tmp_path):
+    """
+    Spec: crossing MAX_FILES fails with 'introspection_scan_limit_exceeded';
+    exactly reaching it does not.
+    """
+    from cairn_core.projects.init import init_project
+    from cairn_core.projects.introspect import ScanOptions
+
+    init_project(tmp_path, "test-project")
+    (tmp_path / "a.txt").write_text("x", encoding="utf-8")
+
+    # manifest.yaml + a.txt = 2 regular files
+    result = introspect_project(tmp_path, options=ScanOptions(max_files=2))
+    assert "a.txt" in result.relative_paths
+
+    (tmp_path / "b.txt").write_text("x", encoding="utf-8")
+    with pytest.raises(Exception) as excinfo:
+        introspect_project(tmp_path, options=ScanOptions(max_files=2))
+
+    assert excinfo.value.code == "introspection_scan_limit_exceeded"
+
+
+def test_introspect_entry_limit_counts_root_and_dirs(tmp_path):
+    from cairn_core.projects.init import init_project
+    from cairn_core.projects.introspect import ScanOptions
+
+    init_project(tmp_path, "test-project")
+    (tmp_path / "empty").mkdir()
+
+    result = introspect_project(tmp_path)
+    limit = result.entry_count
+
+    options = ScanOptions(max_entries=limit)
+    assert introspect_project(tmp_path, options=options) == result
+
+    with pytest.raises(Exception) as excinfo:
+        introspect_project(tmp_path, options=ScanOptions(max_entries=limit - 1))
+
+    assert excinfo.value.code == "introspection_scan_limit_exceeded"
+
+
+def test_introspect_scan_limits_stop_traversal_early(tmp_path, monkeypatch):
+    """
+    Limits are enforced while walking: no directory after the limit is crossed
+    is ever listed.
+    """
+    import cairn_core.projects.traversal as traversal
+    from cairn_core.projects.init import init_project
+    from cairn_core.projects.introspect import ScanOptions
+
+    init_project(tmp_path, "test-project")
+    for i in range(20):
+        (tmp_path / f"d{i:02}").mkdir()
+        (tmp_path / f"d{i:02}" / "f.txt").write_text("x", encoding="utf-8")
+
+    listed = []
+    real_scan_dir = traversal.scan_dir
+
+    def counting_scan_dir(dir_path):
+        listed.append(dir_path)
+        return real_scan_dir(dir_path)
+
+    monkeypatch.setattr(traversal, "scan_dir", counting_scan_dir)
+
+    with pytest.raises(Exception) as excinfo:
+        introspect_project(tmp_path, options=ScanOptions(max_files=3))
+
+    assert excinfo.value.code == "introspection_scan_limit_exceeded"
+    # root, .cairn, d00, d01, d02: the third d*/f.txt crosses the limit.
+    assert len(listed) == 5
+
+
+def test_iter_project_entries_matches_introspection(tmp_path):
+    from cairn_core.projects.init import init_project
+    from cairn_core.projects.introspect import ScanOptions, iter_project_entries
+
+    init_project(tmp_path, "test-project")
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "mod.py").write_text("x", encoding="utf-8")
+    (tmp_path / "README.md").write_text("x", encoding="utf-8")
+
+    result = introspect_project(tmp_path)
+
+    for options in (None, ScanOptions(workers=3)):
+        streamed = list(iter_project_entries(tmp_path, options=options))
+        assert streamed[0] == (".", "dir", 0)
+        assert len(streamed) == result.entry_count
+        assert tuple(streamed[1:]) == result.entries
+
+
+def test_iter_project_entries_is_lazy(tmp_path, monkeypatch):
+    """
+    The Phase 3 gate runs eagerly; directories are listed only as the stream is
+    consumed.
+    """
+    import cairn_core.projects.traversal as traversal
+    from cairn_core.projects.init import init_project
+    from cairn_core.projects.introspect import iter_project_entries
+
+    with pytest.raises(Exception) as excinfo:
+        iter_project_entries(tmp_path)
+    assert excinfo.value.code == "manifest_missing"
+
+    init_project(tmp_path, "test-project")
+    for name in ("a", "b", "c"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "f.txt").write_text("x", encoding="utf-8")
+
+    listed = []
+    real_scan_dir = traversal.scan_dir
+
+    def counting_scan_dir(dir_path):
+        listed.append(dir_path)
+        return real_scan_dir(dir_path)
+
+    monkeypatch.setattr(traversal, "scan_dir", counting_scan_dir)
+
+    stream = iter_project_entries(tmp_path)
+    assert listed == []
+
+    assert next(stream).relative_path == "."
+    assert next(stream).relative_path == ".cairn"
+    assert len(listed) == 1
@@ -82,6 +82,36 @@ def test_load_project_manifest_invalid_field(tmp_path: Path) -> None:
     assert excinfo.value.code == "manifest_invalid_field"
 
 
+def test_load_project_reads_optional_exclusions(tmp_path: Path) -> None:
+    cairn_dir = tmp_path / ".cairn"
+    cairn_dir.mkdir()
+    (cairn_dir / "manifest.yaml").write_text(
+        "schema_version: '0.1'\n"
+        "project_id: p\n"
+        "exclude: [dist, '*.egg-info', dist]\n",
+        encoding="utf-8",
+    )
+
+    ctx = load_project(tmp_path)
+
+    assert ctx.extra_exclusions == ("*.egg-info", "dist")
+
+
+@pytest.mark.parametrize("exclude", ["dist", "[a/b]", "['']", "['..']", "[1]"])
+def test_load_project_invalid_exclusions(tmp_path: Path, exclude: str) -> None:
+    cairn_dir = tmp_path / ".cairn"
+    cairn_dir.mkdir()
+    (cairn_dir / "manifest.yaml").write_text(
+        f"schema_version: '0.1'\nproject_id: p\nexclude: {exclude}\n",
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ProjectLoadError) as excinfo:
+        load_project(tmp_path)
+
+    assert excinfo.value.code == "manifest_invalid_field"
+
+
 from cairn_core.policy import (
     PolicyPack,
     PolicyPackMeta,
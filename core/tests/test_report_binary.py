@@ -0,0 +1,111 @@
+import pytest
+
+from cairn_core.reporting import (
+    AnalysisSnapshot,
+    CairnReport,
+    Evidence,
+    Finding,
+    PolicyPin,
+    RemediationLink,
+    ReportError,
+    ReportMeta,
+    StandardsLink,
+    decode_report_binary,
+    encode_report_binary,
+    report_content_hash,
+    write_report_binary,
+)
+
+
+def _report(ext_counts=None, evidence=None):
+    return CairnReport(
+        meta=ReportMeta(generated_at="2025-12-22T00:00:00Z", tool_version="0.6.0"),
+        policy=PolicyPin(
+            policy_pack_id="pack",
+            version="1.0.0",
+            schema_version="1.0",
+            content_hash="ab" * 32,
+        ),
+        project_ref="proj",
+        analysis=AnalysisSnapshot(
+            entry_count=6,
+            dir_count=2,
+            max_depth=2,
+            files=("README.md", "src/pkg/a.py", "src/pkg/b ✓.py"),
+            dirs=("src", "src/pkg"),
+            ext_counts=ext_counts if ext_counts is not None else {".py": 2, ".md": 1},
+            has_readme=True,
+        ),
+        findings=(
+            Finding(
+                rule_id="b.rule",
+                severity="low",
+                title="B",
+                evidence=Evidence(
+                    evidence
+                    if evidence is not None
+                    else {
+                        "count": -3,
+                        "ratio": 0.25,
+                        "present": False,
+                        "missing": None,
+                        "exts": [".py", (".md", 1)],
+                        "nested": {"k": "v"},
+                    }
+                ),
+                remediation=(RemediationLink(project_id="fix", safe_by_default=False),),
+                standards=(StandardsLink(scheme="CIS", ref="1.1"),),
+                rationale="r",
+            ),
+            Finding(rule_id="a.rule", severity="high", title="A"),
+        ),
+    )
+
+
+def test_binary_report_round_trips():
+    report = _report()
+
+    assert decode_report_binary(encode_report_binary(report)) == report
+
+
+def test_binary_report_is_canonical():
+    a = _report(ext_counts={".py": 2, ".md": 1})
+    b = _report(ext_counts={".md": 1, ".py": 2})
+
+    assert encode_report_binary(a) == encode_report_binary(b)
+    assert report_content_hash(a) == report_content_hash(b)
+    assert report_content_hash(a) != report_content_hash(_report(ext_counts={}))
+
+
+def test_binary_report_detects_corruption():
+    data = bytearray(encode_report_binary(_report()))
+    data[20] ^= 0xFF
+
+    with pytest.raises(ReportError) as excinfo:
+        decode_report_binary(bytes(data))
+
+    assert excinfo.value.code == "report_binary_hash_mismatch"
+
+
+@pytest.mark.parametrize("data", [b"", b"CAIRNRPT", b"{}" * 40])
+def test_binary_report_rejects_non_reports(data):
+    with pytest.raises(ReportError) as excinfo:
+        decode_report_binary(data)
+
+    assert excinfo.value.code == "report_binary_invalid"
+
+
+def test_binary_report_rejects_unsupported_evidence():
+    with pytest.raises(ReportError) as excinfo:
+        encode_report_binary(_report(evidence={"x": object()}))
+
+    assert excinfo.value.code == "report_binary_unsupported_type"
+
+
+def test_write_report_binary(tmp_path):
+    report = _report()
+    out = tmp_path / "report.crpt"
+
+    write_report_binary(report, out)
+
+    assert decode_report_binary(out.read_bytes()) == report
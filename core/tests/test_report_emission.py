@@ -1,3 +1,6 @@
+import dataclasses
+import io
+
 from cairn_core.reporting import (
     CairnReport,
     ReportMeta,
@@ -6,6 +9,7 @@ from cairn_core.reporting import (
     Finding,
     Evidence,
     render_report_text,
+    stream_report_text,
     write_report_json,
     write_report_text,
 )
@@ -63,6 +67,87 @@ def test_render_report_text_sorts_findings_deterministically():
     assert first < second < third
 
 
+def test_stream_report_text_matches_render():
+    f = Finding(
+        rule_id="a.rule", severity="high", title="A", evidence=Evidence({"x": 1})
+    )
+    for r in (_base_report(), _base_report(findings=(f,))):
+        out = io.StringIO()
+        stream_report_text(r, out)
+        assert out.getvalue() == render_report_text(r)
+
+
+def test_stream_report_text_writes_header_before_findings_are_rendered():
+    class Probe(io.StringIO):
+        def write(self, s):
+            if "rule_id:" in s:
+                assert "CAIRN REPORT" in self.getvalue()
+            return super().write(s)
+
+    f = Finding(
+        rule_id="a.rule", severity="high", title="A", evidence=Evidence({"x": 1})
+    )
+    stream_report_text(_base_report(findings=(f,)), Probe())
+
+
+def _paths_report():
+    r = _base_report()
+    analysis = dataclasses.replace(
+        r.analysis, files=("a.py", "b.py", "src/c.py"), dirs=("src",)
+    )
+    return dataclasses.replace(r, analysis=analysis)
+
+
+def test_stream_report_text_paginates_paths_after_findings():
+    out = io.StringIO()
+    stream_report_text(_paths_report(), out, include_paths=True, page_size=2)
+    text = out.getvalue()
+
+    assert text.startswith(render_report_text(_paths_report()))
+    assert text.index("FINDINGS") < text.index("FILES") < text.index("DIRS")
+    files = text[text.index("FILES") : text.index("DIRS")]
+    assert files.splitlines() == [
+        "FILES",
+        "count: 3",
+        "",
+        "page: 1/2",
+        "  a.py",
+        "  b.py",
+        "",
+        "page: 2/2",
+        "  src/c.py",
+        "",
+    ]
+    assert "page: 1/1\n  src\n" in text[text.index("DIRS") :]
+
+
+def test_stream_report_text_single_page_and_empty_listing():
+    out = io.StringIO()
+    stream_report_text(_paths_report(), out, include_paths=True, page_size=2, page=2)
+    text = out.getvalue()
+    assert "page: 1/2" not in text
+    assert "page: 2/2\n  src/c.py\n" in text
+    assert text.endswith("DIRS\ncount: 1\n")
+
+    out = io.StringIO()
+    stream_report_text(_base_report(), out, include_paths=True)
+    assert out.getvalue().endswith(
+        "FILES\ncount: 0\n\n(none)\n\nDIRS\ncount: 0\n\n(none)\n"
+    )
+
+
+def test_stream_report_text_rejects_bad_pagination():
+    for kwargs in ({"page_size": 0}, {"page": 0}):
+        try:
+            stream_report_text(
+                _base_report(), io.StringIO(), include_paths=True, **kwargs
+            )
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("expected ValueError")
+
+
 def test_write_report_json_matches_serializer(tmp_path):
     r = _base_report()
     out = tmp_path / "report.json"
@@ -83,3 +168,58 @@ def test_write_report_text_writes_utf8_and_newline(tmp_path):
     assert "POLICY" in data
     assert "ANALYSIS" in data
     assert "FINDINGS" in data
+
+
+def test_write_report_json_is_atomic_on_error(tmp_path, monkeypatch):
+    import cairn_core.reporting.emit as emit
+
+    out = tmp_path / "report.json"
+    out.write_text("previous", encoding="utf-8")
+
+    def failing_write_json(obj, stream):
+        stream.write(b"{partial")
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(emit, "write_json", failing_write_json)
+
+    try:
+        write_report_json(_base_report(), out)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("expected RuntimeError")
+
+    assert out.read_text(encoding="utf-8") == "previous"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["report.json"]
+
+
+def test_write_report_json_replaces_existing_file(tmp_path):
+    import os
+
+    r = _base_report()
+    out = tmp_path / "report.json"
+    out.write_text("previous", encoding="utf-8")
+    os.chmod(out, 0o640)
+
+    write_report_json(r, out)
+
+    assert out.read_bytes() == to_json_str(r).encode("utf-8")
+    if os.name == "posix":
+        assert out.stat().st_mode & 0o777 == 0o640
+
+
+def test_write_report_json_new_file_leaves_umask_alone(tmp_path, monkeypatch):
+    import os
+
+    def fail(*args):
+        raise AssertionError("process umask changed during a write")
+
+    umask = os.umask(0o022)
+    os.umask(umask)
+    monkeypatch.setattr(os, "umask", fail)
+    out = tmp_path / "report.json"
+
+    write_report_json(_base_report(), out)
+
+    if os.name == "posix":
+        assert out.stat().st_mode & 0o777 == 0o666 & ~umask
@@ -0,0 +1,188 @@
+import json
+
+import pytest
+
+from cairn_core.reporting import (
+    AnalysisSnapshot,
+    CairnReport,
+    Evidence,
+    Finding,
+    PolicyPin,
+    RemediationLink,
+    ReportError,
+    ReportMeta,
+    StandardsLink,
+    load_report_json,
+    parse_report_json,
+    write_report_json,
+)
+from cairn_core.serialization import to_json_str
+
+
+def _report():
+    return CairnReport(
+        meta=ReportMeta(generated_at="2025-12-22T00:00:00Z", tool_version="0.6.0"),
+        policy=PolicyPin(
+            policy_pack_id="pack",
+            version="1.0.0",
+            schema_version="1.0",
+            content_hash="ab" * 32,
+        ),
+        project_ref="proj",
+        analysis=AnalysisSnapshot(
+            entry_count=6,
+            dir_count=2,
+            max_depth=2,
+            files=("README.md", "src/pkg/a].py", 'src/pkg/b "✓".py'),
+            dirs=("src", "src/pkg"),
+            ext_counts={".py": 2, ".md": 1},
+            has_readme=True,
+        ),
+        findings=(
+            Finding(
+                rule_id="b.rule",
+                severity="low",
+                title="B",
+                evidence=Evidence({"count": 3, "exts": [".py"], "nested": {"k": None}}),
+                remediation=(RemediationLink(project_id="fix", safe_by_default=False),),
+                standards=(StandardsLink(scheme="CIS", ref="1.1"),),
+                rationale="r",
+            ),
+            Finding(rule_id="a.rule", severity="high", title="A"),
+        ),
+    )
+
+
+def _doc():
+    return json.loads(to_json_str(_report()))
+
+
+def _error(doc):
+    with pytest.raises(ReportError) as excinfo:
+        parse_report_json(json.dumps(doc))
+    return excinfo.value.code
+
+
+def test_load_report_json_round_trips(tmp_path):
+    report = _report()
+    out = tmp_path / "report.json"
+    write_report_json(report, out)
+
+    loaded = load_report_json(out)
+
+    assert loaded == report
+    assert report == loaded
+    assert to_json_str(loaded) == to_json_str(report)
+
+
+def test_report_paths_are_decoded_on_first_access():
+    loaded = parse_report_json(to_json_str(_report()))
+    analysis = loaded.analysis
+
+    assert not isinstance(analysis.__dict__["files"], tuple)
+    assert analysis.ext_counts == {".md": 1, ".py": 2}
+    assert loaded.findings == _report().findings
+
+    assert analysis.files == _report().analysis.files
+    assert analysis.__dict__["files"] == _report().analysis.files
+
+
+def test_parse_report_json_accepts_any_whitespace():
+    assert parse_report_json(json.dumps(_doc(), indent=2)) == _report()
+
+
+def test_loaded_report_is_frozen():
+    loaded = parse_report_json(to_json_str(_report()))
+
+    with pytest.raises(AttributeError):
+        loaded.analysis.files = ()  # type: ignore[misc]
+
+
+def test_load_report_json_missing_file(tmp_path):
+    with pytest.raises(ReportError) as excinfo:
+        load_report_json(tmp_path / "missing.json")
+
+    assert excinfo.value.code == "report_io_error"
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "{", "[]x", '{"meta": 1} {}', b"\xff", b"", b"not json", b"[1]", b"  1"],
+)
+def test_parse_report_json_rejects_malformed_json(text):
+    with pytest.raises(ReportError) as excinfo:
+        parse_report_json(text)
+
+    assert excinfo.value.code == "report_json_invalid"
+
+
+def test_parse_report_json_rejects_unsupported_schema_version():
+    doc = _doc()
+    doc["meta"]["report_schema_version"] = "2.0"
+
+    assert _error(doc) == "report_schema_unsupported"
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda d: d.pop("findings"),
+        lambda d: d.update(extra=1),
+        lambda d: d["analysis"].update(dirs="src"),
+        lambda d: d["analysis"].update(entry_count=True),
+        lambda d: d["analysis"]["ext_counts"].update({".py": "2"}),
+        lambda d: d["policy"].update(content_hash_alg="md5"),
+        lambda d: d["findings"][0].update(severity="urgent"),
+        lambda d: d["findings"][0]["remediation"][0].pop("project_id"),
+        lambda d: d["findings"][0]["standards"].append("CIS"),
+        lambda d: d["findings"][0]["evidence"].update(items=[]),
+    ],
+)
+def test_parse_report_json_rejects_schema_violations(mutate):
+    doc = _doc()
+    mutate(doc)
+
+    assert _error(doc) == "report_schema_invalid"
+
+
+def test_parse_report_json_rejects_duplicate_keys():
+    text = to_json_str(_report()).replace(
+        '{"analysis":', '{"project_ref":"x","analysis":'
+    )
+
+    with pytest.raises(ReportError) as excinfo:
+        parse_report_json(text)
+
+    assert excinfo.value.code == "report_schema_invalid"
+
+
+@pytest.mark.parametrize(
+    "key, paths",
+    [
+        ("files", ["a", 1]),
+        ("files", [None]),
+        ("files", [{"a": "]"}]),
+        ("files", ["a", ["b"]]),
+        ("dirs", [1, 2]),
+        ("dirs", "a"),
+    ],
+)
+def test_malformed_paths_are_rejected_at_load(key, paths):
+    doc = _doc()
+    doc["analysis"][key] = paths
+
+    with pytest.raises(ReportError) as excinfo:
+        parse_report_json(json.dumps(doc))
+
+    assert excinfo.value.code == "report_schema_invalid"
+
+
+def test_paths_without_escapes_are_bounded_correctly():
+    doc = _doc()
+    doc["analysis"]["files"] = ["a]b", "]", "c"]
+    doc["analysis"]["dirs"] = []
+
+    loaded = parse_report_json(json.dumps(doc))
+
+    assert loaded.analysis.files == ("a]b", "]", "c")
+    assert loaded.analysis.dirs == ()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+from dataclasses import fields
+from pathlib import Path
+
+import pytest
+
+from cairn_core.projects.analyze import (
+    analyze_project,
+    analyze_project_report,
+    analyze_project_report_with_stats,
+    analyze_project_with_stats,
+)
+from cairn_core.projects.init import init_project
+from cairn_core.projects.introspect import (
+    ScanOptions,
+    introspect_project,
+    introspect_project_with_stats,
+)
+from cairn_core.projects.load import ProjectLoadError
+from cairn_core.projects.stats import ScanRecorder, ScanStats, serialize_with_stats
+from cairn_core.projects.traversal import ProjectIntrospectError
+from cairn_core.serialization import to_json_bytes
+
+
+def _tree(root: Path) -> None:
+    init_project(root, "test-project")
+    (root / "README.md").write_text("x", encoding="utf-8")
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "src" / "pkg" / "a.py").write_text("x", encoding="utf-8")
+    (root / "src" / "b.py").write_text("x", encoding="utf-8")
+    (root / "node_modules" / "dep").mkdir(parents=True)
+    (root / ".git").mkdir()
+
+
+def test_introspect_with_stats_matches_plain_result(tmp_path: Path) -> None:
+    _tree(tmp_path)
+
+    intro, stats = introspect_project_with_stats(tmp_path)
+
+    assert intro == introspect_project(tmp_path)
+    assert isinstance(stats, ScanStats)
+    assert stats.entries_visited == intro.entry_count
+    assert stats.entries_excluded == len(intro.ignored_paths) == 2
+    # Root, .cairn, src, src/pkg; excluded directories are never listed.
+    assert stats.dirs_listed == 4
+    # Entry types come from listings: only the root symlink check stats.
+    assert stats.stat_calls == 1
+    assert stats.manifest_ns > 0
+    assert stats.listing_ns > 0
+    assert stats.aggregation_ns == stats.serialization_ns == 0
+    assert stats.total_ns == (
+        stats.manifest_ns + stats.listing_ns + stats.stat_ns + stats.walk_ns
+    )
+
+
+def test_cached_scan_counts_one_stat_per_listed_directory(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    options = ScanOptions(use_cache=True)
+
+    for _ in range(2):  # cold, then warm
+        _, stats = introspect_project_with_stats(tmp_path, options=options)
+        assert stats.stat_calls == 1 + stats.dirs_listed
+
+
+def test_parallel_scan_records_the_same_counters(tmp_path: Path) -> None:
+    _tree(tmp_path)
+
+    _, sequential = introspect_project_with_stats(tmp_path)
+    _, parallel = introspect_project_with_stats(
+        tmp_path, options=ScanOptions(workers=3)
+    )
+
+    for name in ("dirs_listed", "entries_visited", "stat_calls", "entries_excluded"):
+        assert getattr(parallel, name) == getattr(sequential, name)
+
+
+def test_analyze_with_stats_records_aggregation(tmp_path: Path) -> None:
+    _tree(tmp_path)
+
+    analysis, stats = analyze_project_with_stats(tmp_path)
+
+    assert analysis == analyze_project(tmp_path)
+    assert stats.entries_visited == analysis.entry_count
+    assert stats.aggregation_ns > 0
+
+
+def test_report_with_stats_and_serialization(tmp_path: Path) -> None:
+    _tree(tmp_path)
+
+    report, stats = analyze_project_report_with_stats(tmp_path)
+    assert report == analyze_project_report(tmp_path)
+    assert stats.bytes_serialized == 0
+
+    data, serialized = serialize_with_stats(report, stats)
+    assert data == to_json_bytes(report)
+    assert serialized.bytes_serialized == len(data)
+    assert serialized.serialization_ns > 0
+    assert serialized.manifest_ns == stats.manifest_ns
+    assert json.loads(data)["analysis"]["entry_count"] == stats.entries_visited
+
+
+def test_depth_limit_with_stats(tmp_path: Path) -> None:
+    init_project(tmp_path, "test-project")
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "f.txt").write_text("x", encoding="utf-8")
+
+    with pytest.raises(ProjectIntrospectError):
+        introspect_project_with_stats(tmp_path, options=ScanOptions(max_depth=1))
+
+    _, stats = introspect_project_with_stats(tmp_path, options=ScanOptions(max_depth=2))
+    # Root listed, then .cairn and a listed at depth 1 (their children are at 2).
+    assert stats.dirs_listed == 3
+
+
+def test_load_errors_propagate_unchanged(tmp_path: Path) -> None:
+    with pytest.raises(ProjectLoadError) as exc:
+        analyze_project_report_with_stats(tmp_path)
+    assert exc.value.code == "manifest_missing"
+
+
+def test_recorder_counters_mirror_scan_stats() -> None:
+    names = [f.name for f in fields(ScanStats)]
+
+    assert list(ScanRecorder.__slots__) == names + ["tracer"]
+    assert ScanRecorder().freeze() == ScanStats()
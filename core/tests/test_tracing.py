@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from cairn_core.projects.analyze import analyze_project, analyze_project_report
+from cairn_core.projects.init import init_project
+from cairn_core.projects.introspect import (
+    ScanOptions,
+    introspect_project,
+    introspect_project_with_stats,
+)
+from cairn_core.reporting import write_report_json, write_report_text
+from cairn_core.tracing import Tracer
+
+
+def _tree(root: Path, dirs: int = 5) -> None:
+    root.mkdir(exist_ok=True)
+    init_project(root, "test-project")
+    for i in range(dirs):
+        sub = root / f"d{i}" / "inner"
+        sub.mkdir(parents=True)
+        (sub / "f.py").write_text("x", encoding="utf-8")
+
+
+def _names(tracer: Tracer) -> list[str]:
+    return [event[0] for event in tracer.events]
+
+
+def test_traced_report_records_every_pipeline_step(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    _tree(root)
+    tracer = Tracer()
+
+    report = analyze_project_report(root, tracer=tracer)
+    write_report_json(report, tmp_path / "r.json", tracer=tracer)
+    write_report_text(report, tmp_path / "r.txt", tracer=tracer)
+
+    assert report == analyze_project_report(root)
+    names = _names(tracer)
+    for step in ("load_project", "walk", "aggregate", "build_report"):
+        assert names.count(step) == 1
+    assert names[-2:] == ["emit_json", "emit_text"]
+    # Root, .cairn, and d<i> plus d<i>/inner for each of the five.
+    assert names.count("list_dir") == 12
+
+
+def test_traced_results_match_untraced(tmp_path: Path) -> None:
+    _tree(tmp_path)
+
+    assert introspect_project(tmp_path, tracer=Tracer()) == introspect_project(tmp_path)
+    assert analyze_project(tmp_path, tracer=Tracer()) == analyze_project(tmp_path)
+
+
+def test_listing_spans_nest_inside_the_walk(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    tracer = Tracer()
+    introspect_project(tmp_path, tracer=tracer)
+
+    walk = next(e for e in tracer.events if e[0] == "walk")
+    for name, start, end, _tid, args in tracer.events:
+        if name == "list_dir":
+            assert walk[1] <= start <= end <= walk[2]
+            assert args is not None and "path" in args and "entries" in args
+
+
+def test_depth_cutoff_and_sampling_bound_listing_spans(tmp_path: Path) -> None:
+    _tree(tmp_path)
+
+    shallow = Tracer(max_dir_depth=1)
+    introspect_project(tmp_path, tracer=shallow)
+    paths = [e[4]["path"] for e in shallow.events if e[0] == "list_dir"]
+    assert paths == [".", ".cairn", "d0", "d1", "d2", "d3", "d4"]
+
+    sampled = Tracer(sample_every=4)
+    introspect_project(tmp_path, tracer=sampled)
+    assert _names(sampled).count("list_dir") == 3  # listings 1, 5 and 9 of 12
+
+
+def test_slow_listings_bypass_sampling(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    tracer = Tracer(sample_every=1000, max_dir_depth=0, slow_us=0)
+
+    introspect_project(tmp_path, tracer=tracer)
+
+    assert _names(tracer).count("list_dir") == 12
+
+
+def test_max_events_caps_memory_and_counts_drops(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    tracer = Tracer(max_events=3)
+
+    introspect_project(tmp_path, tracer=tracer)
+
+    assert len(tracer.events) == 3
+    # 12 listings, plus load_project and walk.
+    assert tracer.dropped == 14 - 3
+
+
+def test_depth_limit_probes_are_marked(tmp_path: Path) -> None:
+    init_project(tmp_path, "test-project")
+    for i in range(3):
+        (tmp_path / f"d{i}" / "empty").mkdir(parents=True)
+    tracer = Tracer()
+
+    introspect_project_with_stats(
+        tmp_path, options=ScanOptions(max_depth=2), tracer=tracer
+    )
+
+    probes = [e[4]["path"] for e in tracer.events if e[4] and e[4].get("probe")]
+    assert probes == ["d0/empty", "d1/empty", "d2/empty"]
+
+
+def test_write_produces_chrome_trace_json(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    tracer = Tracer(max_events=5)
+    analyze_project(tmp_path, tracer=tracer)
+
+    out = tmp_path / "trace.json"
+    tracer.write(out)
+    doc = json.loads(out.read_text(encoding="utf-8"))
+
+    assert doc["otherData"]["dropped_events"] == tracer.dropped
+    events = doc["traceEvents"]
+    assert events[0]["ph"] == "M"
+    spans = events[1:]
+    assert len(spans) == 5
+    for event in spans:
+        assert event["ph"] == "X"
+        assert event["cat"] == "cairn"
+        assert event["ts"] >= 0 and event["dur"] >= 0
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_dir_depth": -1}, {"sample_every": 0}, {"max_events": -1}],
+)
+def test_invalid_tracer_options(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        Tracer(**kwargs)